@@ -14,20 +14,29 @@
         mysql_db_admin.py -c mysql_cfg -d path
             {-C [db_name [db_name2 ...]] [-t table_name [table_name2 ...]] |
                  [-e to_email [to_email2 ...] [-s subject_line] [-u]] |
-                 [-z] [-p [-n N]]] |
+                 [-z] [-p [-n N]] [-j N] [-B N] [-J] [-b minutes] [-T]
+                 [-m mode]] |
              -A [db_name [db_name2 ...]] [-t table_name [table_name2 ...]] |
                  [-e to_email [to_email2 ...] [-s subject_line] [-u]] |
-                 [-z] [-p [-n N]]] |
+                 [-z] [-p [-n N]] [-j N] [-B N] [-J]
+                 [-R replica_cfg [replica_cfg2 ...] [-l seconds]]] |
              -S [db_name [db_name2 ...]] [-t table_name [table_name2 ...]] |
                  [-e to_email [to_email2 ...] [-s subject_line] [-u]] |
-                 [-z] [-p [-n N]]] |
+                 [-z] [-p [-n N]] [-j N] [-I path/file [-f]] [-J]
+                 [-K N [-Q N]] [-T] [-O mysql_cfg]] |
              -D [db_name [db_name2 ...]] [-t table_name [table_name2 ...]] |
                  [-e to_email [to_email2 ...] [-s subject_line] [-u]] |
-                 [-z] [-p [-n N]]] |
+                 [-z] [-p [-n N]] [-j N] [-B N] [-g pct] [-G MB]
+                 [-J] [-b minutes] [-T] [-q]
+                 [-R replica_cfg [replica_cfg2 ...] [-l seconds]]] |
              -M [[-e to_email [to_email2 ...] [-s subject_line] [-u]] |
-                 [-z] [-p [-n N]]] |
+                 [-z] [-p [-n N]] [-i seconds [-N count]]
+                 [-E path/file] [-H port]] |
              -L [-k]}
-            [-y flavor_id]
+            [-y flavor_id] [-P dir_path [-r]]
+            [-F mysql_cfg [mysql_cfg2 ...] [-W N]]
+            [-a dir_path [-x minutes]]
+            [-X db_name [db_name2 ...]] [-Z table_name [table_name2 ...]]
             [-v | -h]
 
     Arguments:
@@ -47,6 +56,20 @@
             -z => Suppress standard out.
             -p => Expand the JSON format.
                 -n N => Indentation for expanded JSON format.
+            -j N => Number of database connections used to process tables in
+                parallel.  Must be at least 1.  Default is 1.
+            -J => Stream the output as one JSON line per table to the
+                output file (-o) as each table finishes, followed by a
+                summary line.
+            -B N => Process small tables in batches of up to N tables per
+                statement.  N must be at least 1.  Default is 1.
+            -b minutes => Time budget for the run.  No new table is started
+                once the budget is used up or the table is predicted to not
+                finish within the budget.
+            -T => Throttle the run on the server load.  The global status
+                thresholds are set in the configuration file (see Notes).
+            -m mode => Check table mode:  QUICK, FAST, MEDIUM, CHANGED or
+                EXTENDED.  Default is the server's default check.
 
         -A [database name(s)] => Analyze a table's key distribution, checks the
                 table's indexes.
@@ -62,9 +85,43 @@
             -z => Suppress standard out.
             -p => Expand the JSON format.
                 -n N => Indentation for expanded JSON format.
+            -j N => Number of database connections used to process tables in
+                parallel.  Must be at least 1.  Default is 1.
+            -J => Stream the output as one JSON line per table to the
+                output file (-o) as each table finishes, followed by a
+                summary line.
+            -B N => Process small tables in batches of up to N tables per
+                statement.  N must be at least 1.  Default is 1.
+            -R replica_cfg(s) => Replica configuration file(s) (same format
+                and -d directory as -c).  Before each table the run waits
+                until the replication lag of every replica is below -l.
+                -l seconds => Replication lag threshold.  Must be at least
+                    1.  Default is 30.
 
         -S [database name(s)] => Return a checksum on a table.
             -t table name(s) => Table names to check.
+            -I path/file => Incremental checksum state file.  Tables whose
+                    update time, row estimate and data length have not
+                    changed since the last run reuse the checksum stored in
+                    the state file instead of being checksummed again.
+                -f => Full rescan, checksum all tables and refresh the state
+                    file.
+            -K N => Chunked checksum:  Walk each table's primary key in
+                chunks of N rows, with a short digest query per chunk, and
+                combine the chunk digests into the table checksum.  N must
+                be at least 1.
+                -Q N => Split each table with a single integer primary key
+                    into N ranges walked at the same time on N connections.
+                    N must be at least 1.  The checksum is the same
+                    whatever N is.
+            -O mysql_cfg => Compare mode:  Replica configuration file (in the
+                -d directory).  Each table is checksummed on the -c server
+                and the replica at the same time and only the mismatching
+                tables are returned.  With -K the mismatch is narrowed down
+                to the differing primary key chunks.  A table that fails on
+                the replica (e.g. missing) is returned with the error.
+            -T => Throttle the run on the server load before each table and,
+                with -K, between chunks.
             -o path/file => Directory path and file name for output.
                 -w a|w => Append or write to output to output file. Default is
                     write.
@@ -76,10 +133,21 @@
             -z => Suppress standard out.
             -p => Expand the JSON format.
                 -n N => Indentation for expanded JSON format.
+            -j N => Number of database connections used to process tables in
+                parallel.  Must be at least 1.  Default is 1.
+            -J => Stream the output as one JSON line per table to the
+                output file (-o) as each table finishes, followed by a
+                summary line.
 
         -D [database name(s)] => Optimize/defragment a table, the command
                 runs an Alter Table and Analyze command on the table.
             -t table name(s) => Table names to check.
+            -g pct => Only optimize tables whose free space (DATA_FREE) is
+                more than this percentage of the data length (DATA_LENGTH).
+            -G MB => Only optimize tables with more than this many megabytes
+                of free space (DATA_FREE) to reclaim.
+            -q => Analyze InnoDB tables with no free space (DATA_FREE) to
+                reclaim instead of rebuilding them.
             -o path/file => Directory path and file name for output.
                 -w a|w => Append or write to output to output file. Default is
                     write.
@@ -91,9 +159,28 @@
             -z => Suppress standard out.
             -p => Expand the JSON format.
                 -n N => Indentation for expanded JSON format.
+            -j N => Number of database connections used to process tables in
+                parallel.  Must be at least 1.  Default is 1.
+            -J => Stream the output as one JSON line per table to the
+                output file (-o) as each table finishes, followed by a
+                summary line.
+            -B N => Process small tables in batches of up to N tables per
+                statement.  N must be at least 1.  Default is 1.
+            -b minutes => Time budget for the run.  No new table is started
+                once the budget is used up or the table is predicted to not
+                finish within the budget.
+            -T => Throttle the run on the server load.  The global status
+                thresholds are set in the configuration file (see Notes).
+            -R replica_cfg(s) => Replica configuration file(s) (same format
+                and -d directory as -c).  Before each table the run waits
+                until the replication lag of every replica is below -l.
+                -l seconds => Replication lag threshold.  Must be at least
+                    1.  Default is 30.
 
         -M => Display the current database status, such as uptime, memory
-                use, connection usage, and status.
+                use, connection usage, and status.  Includes the InnoDB
+                buffer pool hit ratio, dirty pages, row lock waits, temporary
+                tables on disk, and thread cache hit rate.
             -o path/file => Directory path and file name for output.
                 -w a|w => Append or write to output to output file. Default is
                     write.
@@ -105,11 +192,43 @@
             -z => Suppress standard out.
             -p => Expand the JSON format.
                 -n N => Indentation for expanded JSON format.
+            -i seconds => Keep the connection open and take a status sample
+                every N seconds, with the per second rates of the counters
+                since the previous sample.  N must be at least 1.
+                -N count => Number of samples to take.  Default is to
+                    sample until the program is stopped.
+            -E path/file => Write the status metrics and an extended set of
+                global status counters in Prometheus text format to the
+                file (e.g. a node exporter textfile collector path).  With
+                -i the file is rewritten for each sample.
+            -H port => Serve the Prometheus metrics on the local HTTP port
+                until the program is stopped.  Each scrape takes a sample
+                over the one connection.
 
         -L => Display list of user databases.
             -k => Include system databases in the list.
 
         -y value => A flavor id for the program lock.  To create unique lock.
+        -F mysql_cfg(s) => Fleet mode:  MySQL configuration file(s) (in the -d
+                directory) of more servers to run the option against along
+                with the -c server.  The output is one JSON document keyed by
+                server name, or JSON lines with the -J option.
+            -W N => Number of servers to run against at the same time.
+                Must be at least 1.  Default is 4.
+        -P dir_path => Directory path for the checkpoint files of the -A, -C,
+                -D and -S options.  Each finished table is recorded in the
+                checkpoint file, which is removed when the run completes.
+            -r => Resume from the checkpoint file of a previous run that did
+                not complete and merge its results into the output.
+        -a dir_path => Directory path for the schema cache files of the -A,
+                -C, -D, -S and -L options.  The server's databases and tables
+                are read from the cache file instead of information_schema
+                while the cache is still valid.
+            -x minutes => Time to live of the schema cache.  Default is 60.
+        -X database name(s) => Database names or patterns to leave out of
+                the -A, -C, -D and -S options.
+        -Z table name(s) => Table names or patterns to leave out of the -A,
+                -C, -D and -S options.
         -v => Display version of this program.
         -h => Help and usage message.
 
@@ -122,6 +241,95 @@
             delimited.  If no -t option is used, will do all tables in the
             database.
         NOTE 4:  -t option only works if passing in a single database name.
+        NOTE 5:  Options -g and -G:  If either option is passed, tables must
+            be above both thresholds to be optimized (a missing option
+            defaults to 0).  Skipped tables are reported with their measured
+            fragmentation.  The information_schema statistics are refreshed
+            before the tables are read.
+        NOTE 6:  Option -I:  Tables without an update time (e.g. after a
+            server restart) are always checksummed.
+        NOTE 7:  Option -B:  Tables larger than 10MB (data and index length)
+            are not batched.  Option -B is ignored when -g or -G is passed.
+        NOTE 8:  Option -J:  Requires the -o option.  The -e, -p and -n
+            options are ignored when streaming.
+        NOTE 9:  Option -p:  Documents larger than 1MB are expanded as
+            indented JSON instead of the Python pretty print format.
+        NOTE 10:  Option -P:  The checkpoint file is named after the -y
+            flavor id and the option type (e.g. mysql_db_admin_id_check.ckpt).
+            A checkpoint file from a different server is ignored by -r.
+        NOTE 11:  Option -b:  A table's run time is predicted from the run
+            times and sizes of the tables already finished.  Tables not
+            started are listed under "Unprocessed" in the output and left out
+            of the results.  With -P the checkpoint file is kept so the next
+            run can resume the unprocessed tables with -r.
+        NOTE 12:  Option -T:  Before each table the global status variables
+            are sampled.  While a threshold is exceeded the run pauses with a
+            growing delay (1 to 60 seconds), and the delay shrinks again once
+            the server is below half of the thresholds.  Threads_running
+            includes the connections of the -j option.
+        NOTE 13:  Option -R:  The lag is read from Seconds_Behind_Source of
+            show replica status (the highest of all channels).  A replica
+            with replication stopped is not waited on.  The total wait is
+            reported under ReplicaWait in the output.  A wait longer than 30
+            minutes times out the run and the tables not started are reported
+            as unprocessed under ReplicaWait.
+        NOTE 14:  Option -i:  Each sample is written as one JSON line to the
+            output file (-o) and standard out.  The -e, -p and -n options
+            are ignored when sampling.
+        NOTE 15:  Option -E:  The file is written to a temporary file which
+            then replaces the file, so a collector never reads a partly
+            written file.  Option -H listens on 127.0.0.1 only.
+        NOTE 16:  Option -F:  The -j option sets the connections per server.
+            The -I, -P, -R, -i, -E and -H options cannot be used with -F.  A
+            server that fails to connect is listed with its error.
+        NOTE 17:  Option -K:  The checksum is the BIT_XOR of the CRC32 of
+            each row and does not match the CHECKSUM TABLE value, so do not
+            mix runs with and without -K in one -I state file.  With -P each
+            finished chunk is recorded in a chunk checkpoint file and -r
+            resumes a table from its last chunk.  Tables without a primary
+            key use CHECKSUM TABLE.
+        NOTE 18:  Option -Q:  The ranges are split on the minimum and maximum
+            key values, the last range being open ended.  The -Q connections
+            are in addition to the -j connections and are shared by the
+            tables being checksummed.  A range resumes with -r only if the
+            key values it was split on are unchanged.
+        NOTE 19:  Option -O:  With -K the chunks are bound by the -c server's
+            primary keys and each chunk is digested on both servers at the
+            same time, so both sides are read at nearly the same point.  Up
+            to 100 mismatched chunks are listed per table.  The -I, -P and -Q
+            options cannot be used with -O.
+        NOTE 20:  Option -t:  With a single database, only the named tables
+            are looked up in information_schema and a warning lists any
+            table names not found in the database.
+        NOTE 21:  Option -a:  The cache file is named after the server name
+            (e.g. ServerName_schema.json).  The cache is refreshed once past
+            its time to live or when the count of databases, the count of
+            tables or the latest table creation time has changed.  Table
+            sizes in the cache may be up to the time to live old, so the -I,
+            -g, -G and -q options cannot be used with -a.
+        NOTE 22:  Options -A, -C, -D, -S, -t, -X and -Z:  A name with a glob
+            (* or ?) or SQL LIKE (%) wildcard is a pattern, and in a pattern
+            an underscore matches any single character.  Quote patterns on
+            the command line.  The patterns and the system databases are
+            applied in the information_schema query so only the matching
+            tables are fetched.  The -t option is ignored for a database
+            pattern.
+        NOTE 23:  Options -A, -C and -D:  Tables whose storage engine is known
+            to not support the command (e.g. MEMORY) are skipped.  Each table's
+            results list its Engine and the Action taken.  With -q the
+            information_schema statistics are refreshed before the tables
+            are listed.  InnoDB only reports whole free extents in
+            DATA_FREE, so a table with page level fragmentation may still be
+            analyzed instead of rebuilt.  The -q option cannot be used with
+            the -g, -G or -a options.
+        NOTE 24:  Option -S:  Tables created with CHECKSUM=1 (e.g. MyISAM)
+            keep a live checksum which is read without a table scan.  The
+            other tables are scanned.  Each table's results list the Mode
+            (quick or extended) of the checksum.
+        NOTE 25:  Option -m:  FAST only checks tables not closed properly and
+            CHANGED only tables changed since the last check, the others
+            report the table is already up to date.  Each table's results
+            list the Mode of the check.
 
     Notes:
         Database configuration file format (config/mysql_cfg.py.TEMPLATE):
@@ -139,6 +347,10 @@
             port = 3306
             cfg_file = "MYSQL_DIRECTORY/mysqld.cnf"
 
+            # Global status thresholds for the -T option (optional)
+            throttle_limits = {
+                "Threads_running": 16, "Innodb_row_lock_current_waits": 4}
+
             # If SSL connections are being used, configure one or more of these
                 entries:
             ssl_client_ca = None
@@ -188,8 +400,20 @@
 # Libraries and Global Variables
 
 # Standard
+import os
+import re
 import sys
+import copy
+import time
+import decimal
+import datetime
 import pprint
+import queue
+import functools
+import threading
+import contextlib
+import wsgiref.simple_server
+import concurrent.futures
 
 try:
     import simplejson as json
@@ -214,6 +438,55 @@ except (ValueError, ImportError) as err:
 __version__ = version.__version__
 
 # Global
+# Tables larger than this size (bytes) are not batched with other tables
+BATCH_TBL_SIZE = 10 * 1024 * 1024
+# Documents larger than this size (characters) are expanded as JSON not pprint
+EXPAND_MAX_SIZE = 1024 * 1024
+# Global status thresholds for the -T option, if not set in the config file
+THROTTLE_LIMITS = {"Threads_running": 16, "Innodb_row_lock_current_waits": 4}
+# Range of the -T option's delay (seconds) between tables
+THROTTLE_MIN_DELAY = 1
+THROTTLE_MAX_DELAY = 60
+# Default replication lag threshold (seconds) and poll interval of -R option
+LAG_MAX_SECS = 30
+LAG_POLL_SECS = 5
+# Longest time (seconds) the -R option waits on the replication lag
+LAG_MAX_WAIT = 30 * 60
+# Global status counters of the -i option and their per second rate names
+STATUS_RATES = {
+    "Questions": "Queries", "Connections": "Connections",
+    "Bytes_received": "BytesIn", "Bytes_sent": "BytesOut",
+    "Innodb_rows_read": "InnodbRowsRead",
+    "Innodb_data_reads": "InnodbDataReads"}
+# Global status and system variables of the extended status document
+STATUS_EXT = [
+    "Innodb_buffer_pool_reads", "Innodb_buffer_pool_read_requests",
+    "Innodb_buffer_pool_pages_dirty", "Innodb_buffer_pool_pages_total",
+    "Innodb_row_lock_waits", "Innodb_row_lock_current_waits",
+    "Innodb_row_lock_time_avg", "Created_tmp_disk_tables",
+    "Created_tmp_tables", "Threads_created", "Connections"]
+STATUS_EXT_VARS = ["thread_cache_size"]
+# Global status variables of the -E and -H options and the gauges among them
+PROM_COUNTERS = list(STATUS_RATES) + [
+    "Threads_connected", "Threads_running", "Slow_queries",
+    "Aborted_connects", "Aborted_clients", "Innodb_buffer_pool_read_requests",
+    "Innodb_row_lock_current_waits", "Innodb_row_lock_time",
+    "Created_tmp_disk_tables", "Select_full_join"]
+PROM_GAUGES = [
+    "Threads_connected", "Threads_running", "Innodb_row_lock_current_waits"]
+# Default number of servers the -F option runs against at the same time
+FLEET_WORKERS = 4
+# Most mismatched chunks listed per table by the -O option
+CMP_MAX_CHUNKS = 100
+# Default time to live (minutes) of the -a option's schema cache
+CACHE_TTL_MINS = 60
+# Check table modes of the -m option
+CHECK_MODES = ["QUICK", "FAST", "MEDIUM", "CHANGED", "EXTENDED"]
+# Storage engines (lowercase) known not to support the table commands
+ENGINE_SKIP = {
+    "analyze": ["memory", "archive", "csv", "blackhole", "federated"],
+    "check": ["memory", "blackhole", "federated"],
+    "optimize": ["memory", "csv", "blackhole", "federated"]}
 
 
 def help_message():
@@ -230,50 +503,320 @@ def help_message():
     print(__doc__)
 
 
-def get_all_dbs_tbls(server, db_list, dict_key):
+def arg_int_chk(args, opt_int_list, opt_pos_list=None):
+
+    """Function:  arg_int_chk
+
+    Description:  Check the options in the list have integer values and the
+        options in the positive list have values of at least 1.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_int_list -> List of options requiring integer values
+        (input) opt_pos_list -> List of options requiring positive values
+        (output) status -> True|False - All options have integer values
+
+    """
+
+    status = True
+
+    for opt in opt_int_list:
+        if args.arg_exist(opt) \
+           and not str(args.get_val(opt, def_val="")).isdigit():
+            print(f"Error:  Option {opt} requires an integer value:"
+                  f" {args.get_val(opt, def_val='')}")
+            status = False
+
+        elif args.arg_exist(opt) and opt in (opt_pos_list or []) \
+                and int(args.get_val(opt)) < 1:
+            print(f"Error:  Option {opt} requires a value of at least 1:"
+                  f" {args.get_val(opt)}")
+            status = False
+
+    return status
+
+
+def like_pattern(name):
+
+    """Function:  like_pattern
+
+    Description:  Return the SQL LIKE pattern of a name with glob (* and ?)
+        or LIKE (%) wildcards, or None if the name is an exact name.  In a
+        pattern the underscore is the LIKE single character wildcard.
+
+    Arguments:
+        (input) name -> Database or table name or pattern
+        (output) SQL LIKE pattern or None
+
+    """
+
+    if not any(char in name for char in "*?%"):
+        return None
+
+    return name.replace("*", "%").replace("?", "_")
+
+
+def like_match(name, item):
+
+    """Function:  like_match
+
+    Description:  Return True if the name is the exact name or matches the
+        pattern of the item.
+
+    Arguments:
+        (input) name -> Database or table name
+        (input) item -> Exact name or pattern
+        (output) True|False -> Name matches the item
+
+    """
+
+    pattern = like_pattern(item)
+
+    if pattern is None:
+        return name == item
+
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern)
+
+    return re.fullmatch(regex, name) is not None
+
+
+def name_match(name, incl=None, excl=None):
+
+    """Function:  name_match
+
+    Description:  Return True if the name matches one of the include names
+        or patterns (or none are passed) and none of the exclude names or
+        patterns.
+
+    Arguments:
+        (input) name -> Database or table name
+        (input) incl -> List of names or patterns to include
+        (input) excl -> List of names or patterns to exclude
+        (output) True|False -> Name is selected
+
+    """
+
+    return (not incl or any(like_match(name, item) for item in incl)) \
+        and not any(like_match(name, item) for item in excl or [])
+
+
+def name_filter(col, incl=None, excl=None):
+
+    """Function:  name_filter
+
+    Description:  Return the where clauses and parameters that select a
+        column on the include and exclude names or patterns.  Exact names are
+        matched with in and not in, patterns with like and not like.
+
+    Arguments:
+        (input) col -> Column name
+        (input) incl -> List of names or patterns to include
+        (input) excl -> List of names or patterns to exclude
+        (output) where -> List of where clauses
+        (output) params -> List of parameters for the where clauses
+
+    """
+
+    where = []
+    params = []
+    incl = list(incl or [])
+    excl = list(excl or [])
+    names = [item for item in incl if like_pattern(item) is None]
+    parts = [f"{col} like %s"] * (len(incl) - len(names))
+
+    if names:
+        parts.insert(0, f"{col} in (" + ", ".join(["%s"] * len(names)) + ")")
+
+    if parts:
+        where.append("(" + " or ".join(parts) + ")")
+        params = names + [
+            like_pattern(item) for item in incl if like_pattern(item)]
+
+    names = [item for item in excl if like_pattern(item) is None]
+
+    if names:
+        where.append(
+            f"{col} not in (" + ", ".join(["%s"] * len(names)) + ")")
+        params = params + names
+
+    for item in excl:
+        if like_pattern(item):
+            where.append(f"{col} not like %s")
+            params.append(like_pattern(item))
+
+    return where, params
+
+
+def get_all_dbs_tbls(server, db_list, dict_key, tbl_list=None, **kwargs):
 
     """Function:  get_all_dbs_tbls
 
-    Description:  Return a dictionary of databases with table lists.
+    Description:  Return a dictionary of databases with table dictionaries.
+        All tables for the databases are fetched in a single
+        information_schema query instead of one query per database.  Each
+        table entry holds the table's information_schema row.  If a table
+        list is passed, only the named tables are looked up.  Names may be
+        patterns and the exclude names and patterns are left out in the
+        query.
 
     Arguments:
         (input) server -> Server instance
-        (input) db_list -> List of database names
+        (input) db_list -> List of database names or patterns
         (input) dict_key -> Dictionary key that is tuned to the Mysql version
-        (output) db_dict -> Dictionary of databases and lists of tables
+        (input) tbl_list -> List of table names or patterns to look up
+        (input) **kwargs:
+            db_excl -> List of database names or patterns to exclude
+            tbl_excl -> List of table names or patterns to exclude
+        (output) db_dict -> Dictionary of databases and dictionaries of tables
+
+    """
+
+    db_list = list(db_list)
+    db_dict = {
+        dbs: {} for dbs in db_list if like_pattern(dbs) is None
+        and name_match(dbs, excl=kwargs.get("db_excl"))}
+
+    if db_list:
+        where, params = name_filter(
+            "TABLE_SCHEMA", db_list, kwargs.get("db_excl"))
+        tbl_where, tbl_params = name_filter(
+            "TABLE_NAME", tbl_list, kwargs.get("tbl_excl"))
+        qry = (
+            "select TABLE_SCHEMA, TABLE_NAME, ENGINE, DATA_LENGTH,"
+            " INDEX_LENGTH, DATA_FREE, TABLE_ROWS, UPDATE_TIME,"
+            " CREATE_OPTIONS"
+            " from information_schema.tables where "
+            + " and ".join(["TABLE_TYPE = %s"] + where + tbl_where)
+            + " order by TABLE_SCHEMA, TABLE_NAME")
+
+        for item in server.col_sql(
+                qry, params=tuple(["BASE TABLE"] + params + tbl_params)):
+            db_dict.setdefault(item["TABLE_SCHEMA"], {})[item[dict_key]] = \
+                item
+
+    return db_dict
+
+
+def cache_tbls(cache, db_list, tbl_list=None, **kwargs):
+
+    """Function:  cache_tbls
+
+    Description:  Return a dictionary of databases with table dictionaries
+        from the schema cache, selected the same way as get_all_dbs_tbls.
+
+    Arguments:
+        (input) cache -> Dictionary of the schema cache
+        (input) db_list -> List of database names or patterns
+        (input) tbl_list -> List of table names or patterns to look up
+        (input) **kwargs:
+            db_excl -> List of database names or patterns to exclude
+            tbl_excl -> List of table names or patterns to exclude
+        (output) db_dict -> Dictionary of databases and dictionaries of tables
 
     """
 
-    db_dict = {}
     db_list = list(db_list)
+    db_dict = {
+        dbs: {} for dbs in db_list if like_pattern(dbs) is None
+        and name_match(dbs, excl=kwargs.get("db_excl"))}
 
-    for dbs in db_list:
-        tbl_list = gen_libs.dict_2_list(
-            mysql_libs.fetch_tbl_dict(server, dbs), dict_key)
-        db_dict[dbs] = tbl_list
+    for dbs, tables in cache["Tables"].items() if db_list else []:
+        if name_match(dbs, db_list, kwargs.get("db_excl")):
+            db_dict[dbs] = {
+                tbl: item for tbl, item in tables.items()
+                if name_match(tbl, tbl_list, kwargs.get("tbl_excl"))}
 
     return db_dict
 
 
+def schema_probe(server):
+
+    """Function:  schema_probe
+
+    Description:  Return the database count, table count and latest table
+        creation time of the server.  The probe changes when a database or
+        table is created or dropped and is used to validate the schema cache.
+
+    Arguments:
+        (input) server -> Server instance
+        (output) Dictionary of the schema probe
+
+    """
+
+    qry = (
+        "select (select count(*) from information_schema.schemata)"
+        " as DbCount, count(*) as TblCount, max(CREATE_TIME) as CreateTime"
+        " from information_schema.tables where TABLE_TYPE = %s")
+    data = server.col_sql(qry, params=("BASE TABLE",))[0]
+
+    return {
+        "Databases": int(data["DbCount"]), "Tables": int(data["TblCount"]),
+        "CreateTime": str(data["CreateTime"])}
+
+
+def load_cache(server, args):
+
+    """Function:  load_cache
+
+    Description:  Return the schema cache of the server (-a option).  The
+        cache is reused while it is within its time to live and its schema
+        probe matches the server, otherwise the databases and tables are
+        fetched again and the cache file is rewritten.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (output) cache -> Dictionary of the database list and tables
+
+    """
+
+    cache_file = os.path.join(
+        args.get_val("-a"), f"{server.name}_schema.json")
+    ttl = int(args.get_val("-x", def_val=CACHE_TTL_MINS)) * 60
+    cache = load_state(cache_file)
+    probe = schema_probe(server)
+
+    if cache.get("Probe") != probe \
+       or time.time() - cache.get("AsOf", 0) > ttl:
+        db_list = gen_libs.dict_2_list(
+            mysql_libs.fetch_db_dict(server), "Database")
+        cache = {
+            "AsOf": time.time(), "Probe": probe, "Databases": db_list,
+            "Tables": get_all_dbs_tbls(server, db_list, "TABLE_NAME")}
+        save_state(cache_file, cache)
+
+    return cache
+
+
 def get_db_tbl(server, args, db_list, **kwargs):
 
     """Function:  get_db_tbl
 
-    Description:  Determines which databases and tables will be checked.
+    Description:  Determines which databases and tables will be checked.  The
+        databases and tables are read from the schema cache if the -a option
+        is passed.  The system databases and the -X and -Z option names and
+        patterns are excluded.
 
     Arguments:
         (input) server -> Server instance
         (input) args -> ArgParser class instance
-        (input) db_list -> List of database names
+        (input) db_list -> List of database names or patterns
         (input) **kwargs:
             sys_dbs -> List of system databases to skip
-        (output) db_dict -> Dictionary of databases and lists of tables
+        (output) db_dict -> Dictionary of databases and dictionaries of tables
 
     """
 
     db_dict = {}
     db_list = list(db_list)
     dict_key = "TABLE_NAME"
+    cache = load_cache(server, args) if args.get_val("-a") else None
+    excl = {
+        "db_excl": list(kwargs.get("sys_dbs", []))
+        + list(args.get_val("-X", def_val=[])),
+        "tbl_excl": list(args.get_val("-Z", def_val=[]))}
 
     if db_list:
         db_list = gen_libs.del_not_and_list(
@@ -282,17 +825,33 @@ def get_db_tbl(server, args, db_list, **kwargs):
         if not db_list:
             print("get_db_tbl 1: Warning:  No non-system databases to process")
 
-        elif len(db_list) == 1 and args.get_val("-t"):
-            db_tables = gen_libs.dict_2_list(
-                mysql_libs.fetch_tbl_dict(server, db_list[0]), dict_key)
-            tbl_list = gen_libs.del_not_in_list(args.get_val("-t"), db_tables)
-            db_dict[db_list[0]] = tbl_list
+        elif len(db_list) == 1 and like_pattern(db_list[0]) is None \
+                and args.get_val("-t"):
+            tbl_list = list(args.get_val("-t"))
+            db_tables = (
+                cache_tbls(cache, db_list, tbl_list, **excl) if cache
+                else get_all_dbs_tbls(
+                    server, db_list, dict_key, tbl_list=tbl_list,
+                    **excl)).get(db_list[0], {})
+            db_dict[db_list[0]] = {
+                tbl: item for tbl, item in db_tables.items()
+                if name_match(tbl, tbl_list)}
+            missing = [
+                tbl for tbl in tbl_list
+                if like_pattern(tbl) is None and tbl not in db_tables]
+
+            if missing:
+                print(f"get_db_tbl 3: Warning:  Tables not found in"
+                      f" {db_list[0]}: {', '.join(missing)}")
+
+        elif cache:
+            db_dict = cache_tbls(cache, db_list, **excl)
 
         else:
-            db_dict = get_all_dbs_tbls(server, db_list, dict_key)
+            db_dict = get_all_dbs_tbls(server, db_list, dict_key, **excl)
 
     else:
-        db_list = gen_libs.dict_2_list(
+        db_list = cache["Databases"] if cache else gen_libs.dict_2_list(
             mysql_libs.fetch_db_dict(server), "Database")
         db_list = gen_libs.del_not_and_list(
             db_list, kwargs.get("sys_dbs", []))
@@ -300,12 +859,32 @@ def get_db_tbl(server, args, db_list, **kwargs):
         if not db_list:
             print("get_db_tbl 2: Warning:  No non-system databases to process")
 
+        elif cache:
+            db_dict = cache_tbls(cache, db_list, **excl)
+
         else:
-            db_dict = get_all_dbs_tbls(server, db_list, dict_key)
+            db_dict = get_all_dbs_tbls(server, db_list, dict_key, **excl)
 
     return db_dict
 
 
+def tbl_size(tbl_info):
+
+    """Function:  tbl_size
+
+    Description:  Return the size of a table (data and index length) from its
+        information_schema row.
+
+    Arguments:
+        (input) tbl_info -> Dictionary of table information_schema row
+        (output) Size of the table in bytes
+
+    """
+
+    return int(tbl_info.get("DATA_LENGTH") or 0) \
+        + int(tbl_info.get("INDEX_LENGTH") or 0)
+
+
 def get_json_template(server):
 
     """Function:  get_json_template
@@ -351,11 +930,52 @@ def create_data_config(args):
     return data_config
 
 
+def render_data(data, fmt, buffers, indent=None):
+
+    """Function:  render_data
+
+    Description:  Render the data in a format once and cache the result for
+        any other output media wanting the same format.  Documents larger
+        than EXPAND_MAX_SIZE are expanded as indented JSON instead of pprint.
+        Values that are not JSON types are rendered as strings.
+
+    Arguments:
+        (input) data -> JSON data document
+        (input) fmt -> json|expand|text - Format to render the data in
+        (input) buffers -> Dictionary of rendered formats
+        (input) indent -> Number of spaces to indent the JSON document
+        (output) Rendered data in the format
+
+    """
+
+    if fmt not in buffers:
+        if fmt == "json":
+            buffers[fmt] = json.dumps(data, indent=indent, default=str)
+
+        elif fmt == "expand":
+            # An indented JSON render is shared with the json format
+            doc = render_data(data, "json", buffers, indent) if indent \
+                else json.dumps(data, indent=4, default=str)
+
+            if len(doc) > EXPAND_MAX_SIZE:
+                buffers[fmt] = doc
+
+            else:
+                cfg = {"indent": indent} if indent else {}
+                buffers[fmt] = pprint.pformat(data, **cfg)
+
+        else:
+            buffers[fmt] = str(data)
+
+    return buffers[fmt]
+
+
 def data_out(data, **kwargs):
 
     """Function:  data_out
 
-    Description:  Outputs the data in a variety of formats and media.
+    Description:  Outputs the data in a variety of formats and media.  Each
+        format is rendered once and reused by every media wanting it.
 
     Arguments:
         (input) data -> JSON data document
@@ -366,7 +986,8 @@ def data_out(data, **kwargs):
             outfile -> Name of output file name
             mode -> w|a => Write or append mode for file
             expand -> True|False - Expand the JSON format
-            indent -> Indentation of JSON document if expanded
+            indent -> Number of spaces to indent the JSON document (e.g. the
+                -n option string)
             suppress -> True|False - Suppress standard out
             db_tbl -> database:table - Database name:Table name
         (output) state -> True|False - Successful operation
@@ -380,293 +1001,3008 @@ def data_out(data, **kwargs):
     if not isinstance(data, dict):
         return False, f"Error: Is not a dictionary: {data}"
 
-    mail = None
-    data = dict(data)
-    cfg = {"indent": kwargs.get("indent", 4)} if kwargs.get("indent", False) \
-        else {}
+    buffers = {}
+    indent = int(kwargs.get("indent")) if kwargs.get("indent") else None
+    expand = kwargs.get("expand", False)
 
     if kwargs.get("to_addr", False):
         subj = kwargs.get("subj", "NoSubjectLinePassed")
         mail = gen_class.setup_mail(kwargs.get("to_addr"), subj=subj)
-        mail.add_2_msg(json.dumps(data, **cfg))
+        mail.add_2_msg(render_data(data, "json", buffers, indent))
         mail.send_mail(use_mailx=kwargs.get("mailx", False))
 
     if kwargs.get("outfile", False):
-        if kwargs.get("expand", False):
-            with open(kwargs.get("outfile"), kwargs.get("mode", "w"),
-                      encoding="UTF-8") as outfile:
-                pprint.pprint(data, stream=outfile, **cfg)
-
-        else:
-            gen_libs.write_file(
-                kwargs.get("outfile"), kwargs.get("mode", "w"),
-                json.dumps(data, indent=kwargs.get("indent")))
+        gen_libs.write_file(
+            kwargs.get("outfile"), kwargs.get("mode", "w"),
+            render_data(
+                data, "expand" if expand else "json", buffers, indent))
 
     if not kwargs.get("suppress", False):
-        if kwargs.get("expand", False):
-            pprint.pprint(data, **cfg)
-
-        else:
-            print(data)
+        print(render_data(
+            data, "expand" if expand else "text", buffers, indent))
 
     return state, msg
 
 
-def analyze(server, args, **kwargs):
+def frag_info(tbl_info):
 
-    """Function:  analyze
+    """Function:  frag_info
 
-    Description:  Analzye the tables for problems.
+    Description:  Return the fragmentation of a table (free space versus data
+        length) from its information_schema row.
 
     Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            sys_dbs -> List of system databases to skip
+        (input) tbl_info -> Dictionary of table information_schema row
+        (output) Dictionary of the table's fragmentation
 
     """
 
-    db_list = list(args.get_val("-A"))
-    db_dict = get_db_tbl(server, args, db_list, **kwargs)
-    results = get_json_template(server)
-    results["Type"] = "analyze"
-    results["Results"] = []
-    data_config = dict(create_data_config(args))
+    data_free = int(tbl_info.get("DATA_FREE") or 0)
+    data_len = int(tbl_info.get("DATA_LENGTH") or 0)
 
-    for dbn in db_dict:                                 # pylint:disable=C0206
-        t_results = {"Database": dbn, "Tables": []}
+    return {"DataFree": data_free, "DataLength": data_len,
+            "PercentFree": 100.0 * data_free / data_len if data_len else 0.0}
 
-        for tbl in db_dict[dbn]:
-            t_data = {"TableName": tbl}
 
-            for data in mysql_libs.analyze_tbl(server, dbn, tbl):
-                t_data[gen_libs.pascalize(data["Msg_type"])] = data["Msg_text"]
+def tbl_meta(tbl_info):
 
-            t_results["Tables"].append(t_data)
+    """Function:  tbl_meta
 
-        results["Results"].append(t_results)
+    Description:  Return the table metadata used to detect if a table has
+        changed since its last checksum.
 
-    state = data_out(results, **data_config)
+    Arguments:
+        (input) tbl_info -> Dictionary of table information_schema row
+        (output) Dictionary of the table's change metadata
 
-    if not state[0]:
-        print(f"analyze: Error encountered: {state[1]}")
+    """
 
+    upd_time = tbl_info.get("UPDATE_TIME")
 
-def check(server, args, **kwargs):
+    return {"UpdateTime": str(upd_time) if upd_time else None,
+            "TableRows": tbl_info.get("TABLE_ROWS"),
+            "DataLength": tbl_info.get("DATA_LENGTH")}
 
-    """Function:  check
 
-    Description:  Check the tables for errors.
+def load_state(state_file):
+
+    """Function:  load_state
+
+    Description:  Load a JSON state file, return an empty state if the file
+        does not exist or is empty.
 
     Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            sys_dbs -> List of system databases to skip
+        (input) state_file -> Path and name of state file
+        (output) state -> Dictionary of the state
 
     """
 
-    db_list = list(args.get_val("-C"))
-    db_dict = get_db_tbl(server, args, db_list, **kwargs)
-    results = get_json_template(server)
-    results["Type"] = "check"
-    results["Results"] = []
-    data_config = dict(create_data_config(args))
+    state = {}
 
-    for dbn in db_dict:                                 # pylint:disable=C0206
-        t_results = {"Database": dbn, "Tables": []}
+    if os.path.isfile(state_file) and os.path.getsize(state_file):
+        with open(state_file, "r", encoding="UTF-8") as fhdr:
+            state = json.load(fhdr)
 
-        for tbl in db_dict[dbn]:
-            t_data = {"TableName": tbl}
+    return state
 
-            for data in mysql_libs.check_tbl(server, dbn, tbl):
-                t_data[gen_libs.pascalize(data["Msg_type"])] = data["Msg_text"]
 
-            t_results["Tables"].append(t_data)
+def save_state(state_file, state):
 
-        results["Results"].append(t_results)
+    """Function:  save_state
 
-    state = data_out(results, **data_config)
+    Description:  Save a state to a JSON state file.  The state is written to
+        a temporary file which then replaces the state file so an
+        interrupted write does not corrupt the existing state file.
 
-    if not state[0]:
-        print(f"check: Error encountered: {state[1]}")
+    Arguments:
+        (input) state_file -> Path and name of state file
+        (input) state -> Dictionary of the state
 
+    """
 
-def optimize(server, args, **kwargs):
+    tmp_file = state_file + ".tmp"
 
-    """Function:  optimize
+    with open(tmp_file, "w", encoding="UTF-8") as fhdr:
+        json.dump(state, fhdr, default=str)
 
-    Description:  Optimizes the tables for best performance.
+    os.replace(tmp_file, state_file)
+
+
+def create_pool(server, args, size=None):
+
+    """Function:  create_pool
+
+    Description:  Create a pool of database connections for running table
+        operations in parallel.  The pool size is set by the -j option unless
+        a size is passed, and the existing server connection is used as the
+        first pool member.
 
     Arguments:
         (input) server -> Server instance
         (input) args -> ArgParser class instance
-        (input) **kwargs:
-            sys_dbs -> List of system databases to skip
+        (input) size -> Number of connections in the pool
+        (output) pool -> List of connected Server instances
 
     """
 
-    db_list = list(args.get_val("-D"))
-    db_dict = get_db_tbl(server, args, db_list, **kwargs)
-    results = get_json_template(server)
-    results["Type"] = "optimize"
-    results["Results"] = []
-    data_config = dict(create_data_config(args))
+    pool = [server]
 
-    for dbn in db_dict:                                 # pylint:disable=C0206
-        t_results = {"Database": dbn, "Tables": []}
+    for _ in range(int(size or args.get_val("-j", def_val=1)) - 1):
+        srv = mysql_libs.create_instance(
+            args.get_val("-c"), args.get_val("-d"), mysql_class.Server)
+        srv.connect(silent=True)
 
-        for tbl in db_dict[dbn]:
-            t_data = {"TableName": tbl}
+        if srv.conn_msg:
+            print(f"create_pool: Warning:  Connection failed on server:"
+                  f" {srv.name}: {srv.conn_msg}")
+            break
 
-            for data in mysql_libs.optimize_tbl(server, dbn, tbl):
-                t_data[gen_libs.pascalize(data["Msg_type"])] = data["Msg_text"]
+        pool.append(srv)
 
-            t_results["Tables"].append(t_data)
+    return pool
 
-        results["Results"].append(t_results)
 
-    state = data_out(results, **data_config)
+def close_pool(pool):
 
-    if not state[0]:
-        print(f"optimize: Error encountered: {state[1]}")
+    """Function:  close_pool
 
+    Description:  Disconnect the pool connections, except the first one which
+        is the server connection owned by run_program.
 
-def checksum(server, args, **kwargs):
+    Arguments:
+        (input) pool -> List of connected Server instances
 
-    """Function:  checksum
+    """
+
+    for srv in pool[1:]:
+        mysql_libs.disconnect(srv)
 
-    Description:  Returns checksums of the tables.
+
+def run_task(conns, func, task):
+
+    """Function:  run_task
+
+    Description:  Borrow a connection from the queue, run the function on the
+        task and return the connection to the queue.
 
     Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            sys_dbs -> List of system databases to skip
+        (input) conns -> Queue of connected Server instances
+        (input) func -> Function to run:  func(server, *task)
+        (input) task -> Tuple of arguments for the function
+        (output) Return value of the function
 
     """
 
-    db_list = list(args.get_val("-S"))
-    db_dict = get_db_tbl(server, args, db_list, **kwargs)
-    results = get_json_template(server)
-    results["Type"] = "checksum"
-    results["Results"] = []
-    data_config = dict(create_data_config(args))
+    srv = conns.get()
 
-    for dbn in db_dict:                                 # pylint:disable=C0206
-        t_results = {"Database": dbn, "Tables": []}
+    try:
+        return func(srv, *task)
 
-        for tbl in db_dict[dbn]:
-            t_data = {"TableName": tbl}
+    finally:
+        conns.put(srv)
 
-            for data in mysql_libs.checksum(server, dbn, tbl):
-                t_data["Checksum"] = data["Checksum"]
 
-            t_results["Tables"].append(t_data)
+def run_tasks(pool, tasks, func, callback):
 
-        results["Results"].append(t_results)
+    """Function:  run_tasks
 
-    state = data_out(results, **data_config)
+    Description:  Run the function on each task, in parallel across the pool
+        of connections if more than one connection is available.  The
+        callback is called with each task's results as soon as the task
+        finishes.  If a task fails, the tasks not yet started are cancelled,
+        the results of the tasks already finished are passed to the callback
+        and the error is raised, the same as on a single connection.  The
+        queued tasks are also cancelled if the run is interrupted.
 
-    if not state[0]:
-        print(f"optimize: Error encountered: {state[1]}")
+    Arguments:
+        (input) pool -> List of connected Server instances
+        (input) tasks -> List of argument tuples
+        (input) func -> Function to run:  func(server, *task)
+        (input) callback -> Function called as each task finishes:
+            callback(task index, function return value)
 
+    """
 
-def status(server, args, **kwargs):                     # pylint:disable=W0613
+    if len(pool) == 1:
+        for idx, task in enumerate(tasks):
+            callback(idx, func(pool[0], *task))
 
-    """Function:  status
+    else:
+        conns = queue.Queue()
 
-    Description:  Retrieves a number of database status variables and sends
-        them out either in standard out (print) or to a JSON format which
-        is printed and poissibly inserted into a Mongo database.
+        for srv in pool:
+            conns.put(srv)
 
-    Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            sys_dbs -> List of system databases to skip
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(pool))
+        futs = {executor.submit(run_task, conns, func, task): idx
+                for idx, task in enumerate(tasks)}
 
-    """
+        try:
+            for fut in concurrent.futures.as_completed(futs):
+                callback(futs.pop(fut), fut.result())
 
-    server.upd_srv_stat()
-    results = get_json_template(server)
-    results["Type"] = "status"
-    data_config = dict(create_data_config(args))
-    results["Memory"] = {
-        "CurrentUsage": server.cur_mem_mb, "MaxUsage": server.max_mem_mb,
-        "PercentUsed": server.prct_mem}
-    results["UpTime"] = server.days_up
-    results["Connections"] = {
-        "CurrentConnected": server.cur_conn, "MaxConnections": server.max_conn,
-        "PercentUsed": server.prct_conn}
-    state = data_out(results, **data_config)
+        except Exception:
+            # Stop the queued tasks and keep the results already finished
+            executor.shutdown(cancel_futures=True)
 
-    if not state[0]:
-        print(f"analyze: Error encountered: {state[1]}")
+            for fut, idx in futs.items():
+                if not fut.cancelled() and fut.exception() is None:
+                    callback(idx, fut.result())
 
+            raise
 
-def listdbs(server, args, **kwargs):
+        finally:
+            # Cancel the queued tasks on any exit (e.g. KeyboardInterrupt)
+            executor.shutdown(cancel_futures=True)
 
-    """Function:  listdbs
 
-    Description:  List user or user/system databases in the database instance.
+def table_cmd(server, dbn, tbl, cmd_func):
+
+    """Function:  table_cmd
+
+    Description:  Run a table maintenance command (analyze, check, optimize)
+        on a table and return the table's results.
 
     Arguments:
         (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            sys_dbs -> List of system databases
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cmd_func -> mysql_libs table command function
+        (output) t_data -> Dictionary of table results
 
     """
 
-    sys_dbs = list(kwargs.get("sys_dbs", []))
-    db_list = gen_libs.dict_2_list(
-        mysql_libs.fetch_db_dict(server), "Database")
-
-    if args.arg_exist("-k"):
-        print("List of user and system databases:")
-
-        for item in db_list:
-            print(f"    {item}")
+    t_data = {"TableName": tbl}
 
-    else:
-        print("List of user databases:")
+    for data in cmd_func(server, dbn, tbl):
+        t_data[gen_libs.pascalize(data["Msg_type"])] = data["Msg_text"]
 
-        for item in gen_libs.del_not_and_list(db_list, sys_dbs):
-            print(f"    {item}")
+    return t_data
 
 
-def run_program(args, func_dict):
+def table_check(server, dbn, tbl, mode):
 
-    """Function:  run_program
+    """Function:  table_check
 
-    Description:  Creates class instance(s) and controls flow of the program.
+    Description:  Check a table with a check table mode and return the
+        table's results.  The mode is added to the results.
 
     Arguments:
-        (input) args -> ArgParser class instance
-        (input) func_dict -> Dictionary of functions
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) mode -> Check table mode (see CHECK_MODES)
+        (output) t_data -> Dictionary of table results
 
     """
 
-    sysdbs = ["performance_schema", "information_schema", "mysql", "sys"]
+    t_data = {"TableName": tbl}
 
-    func_dict = dict(func_dict)
-    server = mysql_libs.create_instance(
-        args.get_val("-c"), args.get_val("-d"), mysql_class.Server)
-    server.connect(silent=True)
+    for data in server.col_sql(
+            f"check table {quote_name(dbn, tbl)} {mode.lower()}"):
+        t_data[gen_libs.pascalize(data["Msg_type"])] = data["Msg_text"]
 
-    if server.conn_msg:
+    t_data["Mode"] = mode
+
+    return t_data
+
+
+def table_optimize(server, dbn, tbl, db_dict, frag_pct, free_mb):
+
+    """Function:  table_optimize
+
+    Description:  Optimize a table only if its fragmentation is above both the
+        percentage and reclaimable size thresholds, otherwise skip the table.
+        The measured fragmentation is added to the table's results.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) frag_pct -> Minimum percentage of free space to data length
+        (input) free_mb -> Minimum free space in megabytes
+        (output) t_data -> Dictionary of table results
+
+    """
+
+    frag = frag_info(db_dict[dbn][tbl])
+
+    if frag["PercentFree"] > frag_pct \
+       and frag["DataFree"] > free_mb * 1024 * 1024:
+        t_data = table_cmd(server, dbn, tbl, mysql_libs.optimize_tbl)
+
+    else:
+        t_data = {"TableName": tbl, "Skipped": "Below fragmentation threshold"}
+
+    frag["PercentFree"] = round(frag["PercentFree"], 2)
+    t_data["Fragmentation"] = frag
+
+    return t_data
+
+
+def engine_action(cmd, tbl_info, downgrade=False):
+
+    """Function:  engine_action
+
+    Description:  Return the cheapest valid table command for the table's
+        storage engine.  None is returned if the engine is known to not
+        support the command (see ENGINE_SKIP), other engines get the command.
+        If a downgrade is allowed (-q option), an InnoDB optimize
+        (a full rebuild and analyze) is downgraded to an analyze if the table
+        has no free space to reclaim.
+        A table without an engine gets the command unchanged.
+
+    Arguments:
+        (input) cmd -> Table command:  analyze|check|optimize
+        (input) tbl_info -> Dictionary of table information_schema row
+        (input) downgrade -> True|False -> Allow a cheaper command
+        (output) Table command or None to skip the table
+
+    """
+
+    engine = (tbl_info.get("ENGINE") or "").lower()
+
+    if not engine:
+        return cmd
+
+    if engine in ENGINE_SKIP[cmd]:
+        return None
+
+    if downgrade and cmd == "optimize" and engine == "innodb" \
+       and tbl_info.get("DATA_FREE") == 0:
+        return "analyze"
+
+    return cmd
+
+
+def table_route(                                        # pylint:disable=R0913
+        server, dbn, tbl, db_dict, cmd, tbl_func, downgrade=False):
+
+    """Function:  table_route
+
+    Description:  Run the table function, a cheaper command or skip the
+        table depending on its storage engine (see engine_action).  The
+        engine and the command run are added to the table's results.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) cmd -> Table command:  analyze|check|optimize
+        (input) tbl_func -> Function to run:  tbl_func(server, dbn, tbl)
+        (input) downgrade -> True|False -> Allow a cheaper command
+        (output) t_data -> Dictionary of table results
+
+    """
+
+    tbl_info = db_dict[dbn][tbl]
+    action = engine_action(cmd, tbl_info, downgrade)
+
+    if action is None:
+        t_data = {
+            "TableName": tbl, "Skipped": f"Engine does not support {cmd}"}
+
+    elif action == cmd:
+        t_data = tbl_func(server, dbn, tbl)
+
+    else:
+        t_data = table_cmd(server, dbn, tbl, mysql_libs.analyze_tbl)
+
+    t_data["Engine"] = tbl_info.get("ENGINE")
+    t_data["Action"] = action or "skip"
+
+    return t_data
+
+
+def live_checksum(tbl_info):
+
+    """Function:  live_checksum
+
+    Description:  Return True if the table was created with CHECKSUM=1 and
+        keeps a live checksum.
+
+    Arguments:
+        (input) tbl_info -> Dictionary of table information_schema row
+        (output) True|False - Table keeps a live checksum
+
+    """
+
+    return "checksum=1" in (tbl_info.get("CREATE_OPTIONS") or "").lower()
+
+
+def table_checksum(server, dbn, tbl, db_dict=None):
+
+    """Function:  table_checksum
+
+    Description:  Return the checksum results for a table.  A table created
+        with CHECKSUM=1 (from the CREATE_OPTIONS of its information_schema
+        row) keeps a live checksum which is read with CHECKSUM TABLE QUICK.
+        Other tables, or if no live checksum is returned, are checksummed
+        with a full table scan.  The mode used is added to the results.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (output) t_data -> Dictionary of table results
+
+    """
+
+    t_data = {"TableName": tbl}
+    tbl_info = db_dict[dbn][tbl] if db_dict else {}
+
+    if live_checksum(tbl_info):
+        for data in server.col_sql(
+                f"checksum table {quote_name(dbn, tbl)} quick"):
+            t_data["Checksum"] = data["Checksum"]
+
+        if t_data.get("Checksum") is not None:
+            t_data["Mode"] = "quick"
+            return t_data
+
+    for data in mysql_libs.checksum(server, dbn, tbl):
+        t_data["Checksum"] = data["Checksum"]
+
+    t_data["Mode"] = "extended"
+
+    return t_data
+
+
+def table_checksum_inc(                                 # pylint:disable=R0913
+        server, dbn, tbl, db_dict, srv_state, full=False,
+        chk_func=table_checksum, method=None):
+
+    """Function:  table_checksum_inc
+
+    Description:  Return the checksum results for a table, reusing the cached
+        checksum from the state if the table's metadata has not changed
+        since the last checksum and it was taken with the same method.  A
+        cached checksum reports its method as the mode.  The state is updated
+        with the checksum.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) srv_state -> Dictionary of the server's checksum state
+        (input) full -> True|False - Ignore the state and checksum the table
+        (input) chk_func -> Function to checksum the table:
+            chk_func(server, dbn, tbl)
+        (input) method -> Checksum method (e.g. chunk), defaults to the
+            table_checksum mode (quick or extended)
+        (output) t_data -> Dictionary of table results
+
+    """
+
+    meta = tbl_meta(db_dict[dbn][tbl])
+    meta["Method"] = method or (
+        "quick" if live_checksum(db_dict[dbn][tbl]) else "extended")
+    cached = srv_state.get(dbn, {}).get(tbl)
+
+    if not full and cached and meta["UpdateTime"] \
+       and cached.get("Meta") == meta:
+        t_data = {"TableName": tbl, "Checksum": cached["Checksum"],
+                  "Mode": cached["Meta"]["Method"], "Cached": True}
+
+    else:
+        t_data = chk_func(server, dbn, tbl)
+        t_data["Cached"] = False
+        srv_state.setdefault(dbn, {})[tbl] = {
+            "Checksum": t_data.get("Checksum"), "Meta": meta}
+
+    return t_data
+
+
+def quote_name(*names):
+
+    """Function:  quote_name
+
+    Description:  Return the names quoted as a MySQL identifier (e.g.
+        `db`.`tbl`).
+
+    Arguments:
+        (input) *names -> Database, table or column names
+        (output) Quoted identifier
+
+    """
+
+    return ".".join("`" + name.replace("`", "``") + "`" for name in names)
+
+
+def tbl_columns(server, dbn, tbl):
+
+    """Function:  tbl_columns
+
+    Description:  Return the columns of a table and its primary key columns
+        in key order.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (output) cols -> List of column names
+        (output) pk_cols -> List of primary key column names
+
+    """
+
+    qry = (
+        "select c.COLUMN_NAME as COLUMN_NAME, s.SEQ_IN_INDEX as SEQ_IN_INDEX"
+        " from information_schema.columns c"
+        " left join information_schema.statistics s"
+        " on s.TABLE_SCHEMA = c.TABLE_SCHEMA and s.TABLE_NAME = c.TABLE_NAME"
+        " and s.COLUMN_NAME = c.COLUMN_NAME and s.INDEX_NAME = 'PRIMARY'"
+        " where c.TABLE_SCHEMA = %s and c.TABLE_NAME = %s"
+        " order by c.ORDINAL_POSITION")
+    rows = server.col_sql(qry, params=(dbn, tbl))
+    cols = [row["COLUMN_NAME"] for row in rows]
+    pk_cols = [row["COLUMN_NAME"] for row in sorted(
+        (row for row in rows if row["SEQ_IN_INDEX"]),
+        key=lambda row: row["SEQ_IN_INDEX"])]
+
+    return cols, pk_cols
+
+
+def key_range(pk_cols, lower, upper):
+
+    """Function:  key_range
+
+    Description:  Return the where clause and parameters of a primary key
+        range, above the lower primary key and up to the upper primary key.
+
+    Arguments:
+        (input) pk_cols -> List of primary key column names
+        (input) lower -> List of the lower primary key values or None
+        (input) upper -> List of the upper primary key values or None
+        (output) where -> Where clause or empty string if no bounds
+        (output) params -> List of the bound values
+
+    """
+
+    pk_list = ", ".join(quote_name(col) for col in pk_cols)
+    marks = "(" + ", ".join(["%s"] * len(pk_cols)) + ")"
+    conds = []
+    params = []
+
+    for cond, vals in ((" > ", lower), (" <= ", upper)):
+        if vals is not None:
+            conds.append("(" + pk_list + ")" + cond + marks)
+            params += list(vals)
+
+    return (" where " + " and ".join(conds) if conds else ""), params
+
+
+def chunk_upper(                                        # pylint:disable=R0913
+        server, dbn, tbl, pk_cols, lower, size, stop=None):
+
+    """Function:  chunk_upper
+
+    Description:  Return the upper primary key of the next chunk of size rows
+        after the lower primary key, found with a short primary key index
+        scan.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) pk_cols -> List of primary key column names
+        (input) lower -> List of the lower primary key values or None
+        (input) size -> Number of rows per chunk
+        (input) stop -> List of the stop primary key values or None
+        (output) upper -> List of the upper primary key values or None if
+            fewer than size rows are left
+
+    """
+
+    pk_list = ", ".join(quote_name(col) for col in pk_cols)
+    where, params = key_range(pk_cols, lower, stop)
+    upper = None
+
+    for row in server.col_sql(
+            "select " + pk_list + " from " + quote_name(dbn, tbl) + where
+            + " order by " + pk_list
+            + f" limit 1 offset {int(size) - 1}", params=tuple(params)):
+        upper = [row[col] for col in pk_cols]
+
+    return upper
+
+
+def range_digest(                                       # pylint:disable=R0913
+        server, dbn, tbl, cols, pk_cols, lower, upper):
+
+    """Function:  range_digest
+
+    Description:  Return the row count and digest of a primary key range.
+        The digest is the BIT_XOR of the CRC32 of each row, so range digests
+        XOR into the same table digest however the table is split.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of column names
+        (input) pk_cols -> List of primary key column names
+        (input) lower -> List of the lower primary key values or None
+        (input) upper -> List of the upper primary key values or None
+        (output) Dictionary of the range's row count and digest
+
+    """
+
+    where, params = key_range(pk_cols, lower, upper)
+    crc = "crc32(concat_ws('#', " \
+        + ", ".join(quote_name(col) for col in cols) + ", concat(" \
+        + ", ".join(f"isnull({quote_name(col)})" for col in cols) + ")))"
+    data = server.col_sql(
+        "select count(*) as RowCnt, bit_xor(" + crc + ") as Digest"
+        " from " + quote_name(dbn, tbl) + where, params=tuple(params))[0]
+
+    return {"Rows": int(data["RowCnt"]), "Digest": int(data["Digest"] or 0)}
+
+
+def chunk_digest(                                       # pylint:disable=R0913
+        server, dbn, tbl, cols, pk_cols, lower, size, stop=None):
+
+    """Function:  chunk_digest
+
+    Description:  Return the digest of the next chunk of up to size rows
+        after the lower primary key.  The chunk's upper primary key is found
+        first so the digest query is a short primary key range scan.  A stop
+        primary key ends the chunk at the end of a primary key range.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of column names
+        (input) pk_cols -> List of primary key column names
+        (input) lower -> List of the lower primary key values or None
+        (input) size -> Number of rows per chunk
+        (input) stop -> List of the stop primary key values or None
+        (output) data -> Dictionary of the chunk's upper primary key (None
+            for the last chunk), row count and digest
+
+    """
+
+    upper = chunk_upper(server, dbn, tbl, pk_cols, lower, size, stop=stop)
+    data = range_digest(
+        server, dbn, tbl, cols, pk_cols, lower,
+        stop if upper is None else upper)
+    data["Upper"] = upper
+
+    return data
+
+
+def chunk_ranges(server, dbn, tbl, pk_col, cnt):
+
+    """Function:  chunk_ranges
+
+    Description:  Split the key space of a single integer primary key into
+        up to cnt ranges of equal width from its minimum and maximum values.
+        The last range is open ended.  A table with another primary key
+        type or without rows is one range.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) pk_col -> Primary key column name
+        (input) cnt -> Number of ranges
+        (output) List of ranges:  [lower primary key, stop primary key]
+
+    """
+
+    data = server.col_sql(
+        f"select min({quote_name(pk_col)}) as MinKey,"
+        f" max({quote_name(pk_col)}) as MaxKey from {quote_name(dbn, tbl)}")[0]
+    min_key, max_key = data["MinKey"], data["MaxKey"]
+
+    if not isinstance(min_key, int) or not isinstance(max_key, int) \
+       or cnt < 2:
+        return [[None, None]]
+
+    step = (max_key - min_key) // cnt + 1
+    ranges = [[[low - 1], [low + step - 1]]
+              for low in range(min_key, max_key + 1, step)]
+    ranges[-1][1] = None
+
+    return ranges
+
+
+def key_dump(vals):
+
+    """Function:  key_dump
+
+    Description:  Return the primary key values in a JSON form that restores
+        their type:  binary values as hex, dates and times in ISO format,
+        time values as seconds and decimals as strings.  A value of another
+        type cannot be restored and raises a TypeError.
+
+    Arguments:
+        (input) vals -> List of primary key values or None
+        (output) List of JSON primary key values or None
+
+    """
+
+    if vals is None:
+        return None
+
+    data = []
+
+    for val in vals:
+        if val is None or isinstance(val, (bool, int, float, str)):
+            data.append(val)
+
+        elif isinstance(val, (bytes, bytearray)):
+            data.append({"Hex": bytes(val).hex()})
+
+        elif isinstance(val, datetime.datetime):
+            data.append({"Datetime": val.isoformat()})
+
+        elif isinstance(val, datetime.date):
+            data.append({"Date": val.isoformat()})
+
+        elif isinstance(val, datetime.timedelta):
+            data.append({"Time": val.total_seconds()})
+
+        elif isinstance(val, decimal.Decimal):
+            data.append({"Decimal": str(val)})
+
+        else:
+            raise TypeError(f"Key type cannot be restored: {type(val)}")
+
+    return data
+
+
+def key_str(vals):
+
+    """Function:  key_str
+
+    Description:  Return the primary key values for a report:  binary values
+        as hex and other values that are not JSON types as strings (e.g.
+        dates and decimals).
+
+    Arguments:
+        (input) vals -> List of primary key values or None
+        (output) List of reportable primary key values or None
+
+    """
+
+    if vals is None:
+        return None
+
+    return [val.hex() if isinstance(val, (bytes, bytearray))
+            else val if val is None or isinstance(val, (int, float, str))
+            else str(val) for val in vals]
+
+
+def key_load(data):
+
+    """Function:  key_load
+
+    Description:  Return the primary key values from their JSON form (see
+        key_dump).
+
+    Arguments:
+        (input) data -> List of JSON primary key values or None
+        (output) List of primary key values or None
+
+    """
+
+    if data is None:
+        return None
+
+    loads = {"Hex": bytes.fromhex,
+             "Datetime": datetime.datetime.fromisoformat,
+             "Date": datetime.date.fromisoformat,
+             "Time": lambda secs: datetime.timedelta(seconds=secs),
+             "Decimal": decimal.Decimal}
+    vals = []
+
+    for val in data:
+        if isinstance(val, dict):
+            tag, item = next(iter(val.items()))
+            val = loads[tag](item)
+
+        vals.append(val)
+
+    return vals
+
+
+def chunk_range(                                        # pylint:disable=R0913
+        server, dbn, tbl, cols, pk_cols, chunk, rng):
+
+    """Function:  chunk_range
+
+    Description:  Walk a primary key range of a table in chunks and combine
+        the chunk digests.  The run waits on the throttle between chunks and
+        records each finished chunk in the chunk checkpoint file, so an
+        interrupted range resumes from its last chunk.  A chunk whose key
+        type cannot be restored (see key_dump) is not recorded.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of column names
+        (input) pk_cols -> List of primary key column names
+        (input) chunk -> Dictionary of the chunked checksum
+        (input) rng -> Range:  [lower primary key, stop primary key]
+        (output) prog -> Dictionary of the range's row count, digest and
+            number of chunks
+
+    """
+
+    prog = dict(chunk["Done"].get(dbn, {}).get(tbl, {}).get(
+        json.dumps(rng, default=str)) or {
+            "Lower": rng[0], "Rows": 0, "Digest": 0, "Chunks": 0})
+
+    while True:
+        if prog["Chunks"] and chunk["Throttle"]:
+            throttle_wait(server, chunk["Throttle"])
+
+        data = chunk_digest(
+            server, dbn, tbl, cols, pk_cols, prog["Lower"], chunk["Size"],
+            stop=rng[1])
+        prog = {"Lower": data["Upper"], "Rows": prog["Rows"] + data["Rows"],
+                "Digest": prog["Digest"] ^ data["Digest"],
+                "Chunks": prog["Chunks"] + 1}
+
+        if data["Upper"] is None:
+            break
+
+        if chunk["Fhdr"]:
+            try:
+                line = {"Database": dbn, "TableName": tbl, "Range": rng,
+                        "Chunk": dict(prog, Lower=key_dump(prog["Lower"]))}
+
+            except TypeError:
+                continue
+
+            stream_line(line, fhdr=chunk["Fhdr"], lock=chunk["Lock"])
+
+    return prog
+
+
+def table_checksum_chunk(server, dbn, tbl, chunk):
+
+    """Function:  table_checksum_chunk
+
+    Description:  Return the checksum results for a table by walking its
+        primary key in chunks and combining the chunk digests.  With the -Q
+        option a single integer primary key is split into ranges that are
+        walked at the same time on the spare connections of the chunk pool.
+        The digests XOR into the same checksum whatever the number of
+        ranges.  Tables without a primary key use a whole table checksum.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) chunk -> Dictionary of the chunked checksum
+        (output) t_data -> Dictionary of table results
+
+    """
+
+    cols, pk_cols = tbl_columns(server, dbn, tbl)
+
+    if not pk_cols:
+        return table_checksum(server, dbn, tbl)
+
+    ranges = [[None, None]]
+    pool = [server]
+    progs = {}
+
+    if chunk["Conns"] and len(pk_cols) == 1:
+        ranges = chunk_ranges(server, dbn, tbl, pk_cols[0], chunk["Ranges"])
+
+        while len(pool) < len(ranges) and not chunk["Conns"].empty():
+            pool.append(chunk["Conns"].get())
+
+    try:
+        run_tasks(
+            pool, [(dbn, tbl, cols, pk_cols, chunk, rng) for rng in ranges],
+            chunk_range, progs.__setitem__)
+
+    finally:
+        for srv in pool[1:]:
+            chunk["Conns"].put(srv)
+
+    t_data = {"TableName": tbl, "Checksum": 0, "Rows": 0, "Chunks": 0}
+
+    for prog in progs.values():
+        t_data["Checksum"] ^= prog["Digest"]
+        t_data["Rows"] += prog["Rows"]
+        t_data["Chunks"] += prog["Chunks"]
+
+    if len(ranges) > 1:
+        t_data["Ranges"] = len(ranges)
+
+    return t_data
+
+
+def load_chunks(ckpt_file, header):
+
+    """Function:  load_chunks
+
+    Description:  Load the last finished chunk of each table range from a
+        chunk checkpoint file.  The checkpoint is ignored if its header does
+        not match, and a line cut short by an interrupted run is skipped.
+        The lower primary key of each chunk is restored with key_load.
+
+    Arguments:
+        (input) ckpt_file -> Directory path and name of checkpoint file
+        (input) header -> Dictionary of the checkpoint header
+        (output) done -> Dictionary of databases and dictionaries of tables
+            with their range progress
+
+    """
+
+    done = {}
+
+    if not os.path.isfile(ckpt_file):
+        return done
+
+    with open(ckpt_file, "r", encoding="UTF-8") as fhdr:
+        for cnt, line in enumerate(fhdr):
+            try:
+                line = json.loads(line)
+
+            except ValueError:
+                continue
+
+            if cnt == 0 and line != header:
+                return {}
+
+            if "Chunk" in line:
+                done.setdefault(line["Database"], {}).setdefault(
+                    line["TableName"], {})[
+                        json.dumps(line.get("Range"), default=str)] = \
+                    dict(line["Chunk"], Lower=key_load(line["Chunk"]["Lower"]))
+
+    return done
+
+
+def create_chunk(server, args, throttle=None):
+
+    """Function:  create_chunk
+
+    Description:  Create the chunked checksum for the run if the -K option is
+        passed.  With the -Q option a pool of connections is created whose
+        spare connections walk the ranges of a table.  With the -P option the
+        chunk checkpoint file is rewritten with the chunks finished by a
+        previous run (-r option).
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) throttle -> Dictionary of the throttle
+        (output) chunk -> Dictionary of the chunked checksum or None if no -K
+
+    """
+
+    if args.get_val("-K", def_val=None) is None:
+        return None
+
+    chunk = {"Size": int(args.get_val("-K")), "Throttle": throttle,
+             "Lock": threading.Lock(), "File": None, "Fhdr": None,
+             "Done": {}, "Ranges": int(args.get_val("-Q", def_val=1)),
+             "Pool": [server], "Conns": None}
+
+    if chunk["Ranges"] > 1:
+        chunk["Pool"] = create_pool(server, args, size=chunk["Ranges"])
+        chunk["Conns"] = queue.Queue()
+
+        for srv in chunk["Pool"][1:]:
+            chunk["Conns"].put(srv)
+
+    if args.get_val("-P"):
+        chunk["File"] = get_ckpt_file(args, "chunk")
+        header = {"Server": server.name, "Type": "chunk"}
+
+        if args.get_val("-r", def_val=False):
+            chunk["Done"] = load_chunks(chunk["File"], header)
+
+        chunk["Fhdr"] = open(                           # pylint:disable=R1732
+            chunk["File"], "w", encoding="UTF-8")
+        stream_line(header, fhdr=chunk["Fhdr"])
+
+        for dbn, tbls in chunk["Done"].items():
+            for tbl, progs in tbls.items():
+                for rng, prog in progs.items():
+                    stream_line({"Database": dbn, "TableName": tbl,
+                                 "Range": json.loads(rng),
+                                 "Chunk": dict(
+                                     prog, Lower=key_dump(prog["Lower"]))},
+                                fhdr=chunk["Fhdr"])
+
+    return chunk
+
+
+def close_chunk(chunk):
+
+    """Function:  close_chunk
+
+    Description:  Close the chunk checkpoint file and disconnect the pool
+        connections of the chunked checksum.
+
+    Arguments:
+        (input) chunk -> Dictionary of the chunked checksum
+
+    """
+
+    if chunk and chunk["Fhdr"]:
+        chunk["Fhdr"].close()
+
+    if chunk:
+        close_pool(chunk["Pool"])
+
+
+def create_compare(args, chunk=None):
+
+    """Function:  create_compare
+
+    Description:  Connect to the replica of the -O option for comparing
+        checksums, one connection for each -j connection.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) chunk -> Dictionary of the chunked checksum
+        (output) cmp -> Dictionary of the comparison or None if no replica
+            is connected
+
+    """
+
+    pool = []
+
+    for _ in range(int(args.get_val("-j", def_val=1))):
+        srv = mysql_libs.create_instance(
+            args.get_val("-O"), args.get_val("-d"), mysql_class.Server)
+        srv.connect(silent=True)
+
+        if srv.conn_msg:
+            print(f"create_compare: Warning:  Connection failed on replica:"
+                  f" {srv.name}: {srv.conn_msg}")
+            break
+
+        pool.append(srv)
+
+    if not pool:
+        return None
+
+    conns = queue.Queue()
+
+    for srv in pool:
+        conns.put(srv)
+
+    return {"Pool": pool, "Conns": conns, "Chunk": chunk}
+
+
+def close_compare(cmp):
+
+    """Function:  close_compare
+
+    Description:  Disconnect the replica connections of the comparison.
+
+    Arguments:
+        (input) cmp -> Dictionary of the comparison
+
+    """
+
+    if cmp:
+        for srv in cmp["Pool"]:
+            mysql_libs.disconnect(srv)
+
+
+def compare_run(executor, func, server, replica):
+
+    """Function:  compare_run
+
+    Description:  Run a function on the source and the replica at the same
+        time.  An error on the replica (e.g. the table is missing or has
+        changed) is returned as the replica's results, as it is a difference
+        between the servers.
+
+    Arguments:
+        (input) executor -> ThreadPoolExecutor instance
+        (input) func -> Function to run:  func(server)
+        (input) server -> Server instance of the source
+        (input) replica -> Server instance of the replica
+        (output) src -> Source results
+        (output) rep -> Replica results or dictionary of the replica error
+
+    """
+
+    rep_fut = executor.submit(func, replica)
+    src = func(server)
+
+    try:
+        rep = rep_fut.result()
+
+    except Exception as err:                            # pylint:disable=W0718
+        rep = {"Error": f"Replica: {err}"}
+
+    return src, rep
+
+
+def compare_chunks(                                     # pylint:disable=R0913
+        server, replica, dbn, tbl, cols, pk_cols, chunk):
+
+    """Function:  compare_chunks
+
+    Description:  Walk a table's primary key in chunks bound by the source's
+        keys and digest each chunk on the source and the replica at the same
+        time.  The chunks that differ are listed, up to CMP_MAX_CHUNKS, with
+        their primary key range made reportable by key_str.  The walk stops
+        at a replica error, which is added to the results.
+
+    Arguments:
+        (input) server -> Server instance of the source
+        (input) replica -> Server instance of the replica
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of column names
+        (input) pk_cols -> List of primary key column names
+        (input) chunk -> Dictionary of the chunked checksum
+        (output) t_data -> Dictionary of table results
+
+    """
+
+    t_data = {"TableName": tbl, "Source": 0, "Replica": 0, "Chunks": 0,
+              "MismatchChunks": 0, "Mismatches": []}
+    lower = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            if t_data["Chunks"] and chunk["Throttle"]:
+                throttle_wait(server, chunk["Throttle"])
+
+            upper = chunk_upper(
+                server, dbn, tbl, pk_cols, lower, chunk["Size"])
+            src, rep = compare_run(
+                executor, functools.partial(
+                    range_digest, dbn=dbn, tbl=tbl, cols=cols,
+                    pk_cols=pk_cols, lower=lower, upper=upper),
+                server, replica)
+
+            if "Error" in rep:
+                t_data["Error"] = rep["Error"]
+                break
+
+            t_data["Source"] ^= src["Digest"]
+            t_data["Replica"] ^= rep["Digest"]
+            t_data["Chunks"] += 1
+
+            if src != rep:
+                t_data["MismatchChunks"] += 1
+
+                if len(t_data["Mismatches"]) < CMP_MAX_CHUNKS:
+                    t_data["Mismatches"].append({
+                        "Lower": key_str(lower), "Upper": key_str(upper),
+                        "SourceRows": src["Rows"],
+                        "ReplicaRows": rep["Rows"]})
+
+            if upper is None:
+                break
+
+            lower = upper
+
+    return t_data
+
+
+def table_compare(server, dbn, tbl, cmp):
+
+    """Function:  table_compare
+
+    Description:  Checksum a table on the source and on a replica connection
+        at the same time and return the results only if they differ.  With
+        the -K option the mismatch is narrowed down to the differing primary
+        key chunks.  Tables without a primary key are compared with a whole
+        table checksum.  A replica error on the table is returned as a
+        mismatch with the error text.
+
+    Arguments:
+        (input) server -> Server instance of the source
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cmp -> Dictionary of the comparison
+        (output) t_data -> Dictionary of table results or None if the
+            checksums match
+
+    """
+
+    replica = cmp["Conns"].get()
+
+    try:
+        cols, pk_cols = tbl_columns(server, dbn, tbl) if cmp["Chunk"] \
+            else (None, None)
+
+        if pk_cols:
+            t_data = compare_chunks(
+                server, replica, dbn, tbl, cols, pk_cols, cmp["Chunk"])
+
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1) as executor:
+                src, rep = compare_run(
+                    executor,
+                    functools.partial(table_checksum, dbn=dbn, tbl=tbl),
+                    server, replica)
+
+            t_data = {"TableName": tbl, "Source": src.get("Checksum"),
+                      "Replica": rep.get("Checksum")}
+
+            if "Error" in rep:
+                t_data["Error"] = rep["Error"]
+
+    finally:
+        cmp["Conns"].put(replica)
+
+    if t_data["Source"] == t_data["Replica"] \
+       and not t_data.get("MismatchChunks") and "Error" not in t_data:
+        return None
+
+    return t_data
+
+
+def table_batch_cmd(server, batch, cmd, mode=None):
+
+    """Function:  table_batch_cmd
+
+    Description:  Run a table maintenance command (analyze, check, optimize)
+        on a batch of tables in a single statement and split the returned
+        rows back out to each table's results by their Table column.  If a
+        check table mode is passed, it is added to the statement and the
+        results.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) batch -> List of (database name, table name) tuples
+        (input) cmd -> Table command:  analyze|check|optimize
+        (input) mode -> Check table mode (see CHECK_MODES)
+        (output) List of dictionaries of table results in batch order
+
+    """
+
+    t_dict = {}
+
+    for dbn, tbl in batch:
+        t_dict[f"{dbn}.{tbl}".lower()] = {"TableName": tbl}
+
+        if mode:
+            t_dict[f"{dbn}.{tbl}".lower()]["Mode"] = mode
+
+    qry = cmd + " table " + ", ".join(
+        quote_name(dbn, tbl) for dbn, tbl in batch)
+
+    if mode:
+        qry = qry + " " + mode.lower()
+
+    for data in server.col_sql(qry):
+        t_data = t_dict.get(data["Table"].lower())
+
+        if t_data is not None:
+            t_data[gen_libs.pascalize(data["Msg_type"])] = data["Msg_text"]
+
+    return [t_dict[f"{dbn}.{tbl}".lower()] for dbn, tbl in batch]
+
+
+def route_batch(                                        # pylint:disable=R0913
+        server, batch, db_dict, cmd, mode=None, downgrade=False):
+
+    """Function:  route_batch
+
+    Description:  Run a table command on a batch of tables, grouping the
+        tables by the command chosen for their storage engine (see
+        engine_action) and running one statement per command.  The engine
+        and the command run are added to each table's results.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) batch -> List of (database name, table name) tuples
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) cmd -> Table command:  analyze|check|optimize
+        (input) mode -> Check table mode (see CHECK_MODES)
+        (input) downgrade -> True|False -> Allow a cheaper command
+        (output) t_list -> List of dictionaries of table results in batch
+            order
+
+    """
+
+    actions = [
+        engine_action(cmd, db_dict[dbn][tbl], downgrade)
+        for dbn, tbl in batch]
+    t_list = [None] * len(batch)
+
+    for action in dict.fromkeys(actions):
+        idxs = [idx for idx, item in enumerate(actions) if item == action]
+
+        if action is None:
+            t_data = [{"TableName": batch[idx][1],
+                       "Skipped": f"Engine does not support {cmd}"}
+                      for idx in idxs]
+
+        else:
+            t_data = table_batch_cmd(
+                server, [batch[idx] for idx in idxs], action,
+                mode=mode if action == cmd else None)
+
+        for idx, item in zip(idxs, t_data):
+            dbn, tbl = batch[idx]
+            item["Engine"] = db_dict[dbn][tbl].get("ENGINE")
+            item["Action"] = action or "skip"
+            t_list[idx] = item
+
+    return t_list
+
+
+def run_batch(server, batch, tbl_func):
+
+    """Function:  run_batch
+
+    Description:  Run a table function on each table in a batch.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) batch -> List of (database name, table name) tuples
+        (input) tbl_func -> Function to run:  tbl_func(server, dbn, tbl)
+        (output) List of dictionaries of table results in batch order
+
+    """
+
+    return [tbl_func(server, dbn, tbl) for dbn, tbl in batch]
+
+
+def make_batches(tasks, order, db_dict, batch_size):
+
+    """Function:  make_batches
+
+    Description:  Group the tables into batches of up to batch_size tables.
+        Tables larger than BATCH_TBL_SIZE are placed in a batch by
+        themselves.
+
+    Arguments:
+        (input) tasks -> List of (database name, table name) tuples
+        (input) order -> List of task indexes in processing order
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) batch_size -> Maximum number of tables in a batch
+        (output) batches -> List of lists of task indexes
+
+    """
+
+    batches = []
+    batch = []
+
+    for idx in order:
+        dbn, tbl = tasks[idx]
+
+        if tbl_size(db_dict[dbn][tbl]) > BATCH_TBL_SIZE:
+            batches.append([idx])
+
+        else:
+            batch.append(idx)
+
+            if len(batch) >= batch_size:
+                batches.append(batch)
+                batch = []
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+def create_budget(args):
+
+    """Function:  create_budget
+
+    Description:  Create the time budget for the run from the -b option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) budget -> Dictionary of the time budget or None if no -b
+
+    """
+
+    if args.get_val("-b", def_val=None) is None:
+        return None
+
+    return {"End": time.monotonic() + int(args.get_val("-b")) * 60,
+            "Bytes": 0, "Secs": 0.0, "Tables": 0, "Unprocessed": [],
+            "Lock": threading.Lock()}
+
+
+def budget_est(budget, size, cnt):
+
+    """Function:  budget_est
+
+    Description:  Predict the run time of tables from the run times of the
+        tables already finished, by size if the finished tables had a size,
+        otherwise by number of tables.
+
+    Arguments:
+        (input) budget -> Dictionary of the time budget
+        (input) size -> Size of the tables in bytes
+        (input) cnt -> Number of tables
+        (output) Predicted run time in seconds
+
+    """
+
+    with budget["Lock"]:
+        if budget["Bytes"]:
+            return budget["Secs"] * size / budget["Bytes"]
+
+        if budget["Tables"]:
+            return budget["Secs"] * cnt / budget["Tables"]
+
+    return 0
+
+
+def budget_batch(                                       # pylint:disable=R0913
+        server, batch, batch_func, budget, db_dict):
+
+    """Function:  budget_batch
+
+    Description:  Run the batch function on a batch of tables if the batch is
+        predicted to finish within the time budget, and add its run time to
+        the budget.  Otherwise the tables are added to the unprocessed
+        tables.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) batch -> List of (database name, table name) tuples
+        (input) batch_func -> Function to run:  batch_func(server, batch)
+        (input) budget -> Dictionary of the time budget
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (output) b_data -> List of table results or None if not started
+
+    """
+
+    size = sum(tbl_size(db_dict[dbn][tbl]) for dbn, tbl in batch)
+    start = time.monotonic()
+
+    if start + budget_est(budget, size, len(batch)) > budget["End"]:
+        with budget["Lock"]:
+            budget["Unprocessed"].extend(
+                {"Database": dbn, "TableName": tbl} for dbn, tbl in batch)
+
+        return None
+
+    b_data = batch_func(server, batch)
+
+    with budget["Lock"]:
+        budget["Bytes"] += size
+        budget["Secs"] += time.monotonic() - start
+        budget["Tables"] += len(batch)
+
+    return b_data
+
+
+def create_throttle(args, limits):
+
+    """Function:  create_throttle
+
+    Description:  Create the load throttle for the run if the -T option is
+        passed.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) limits -> Dictionary of global status names and thresholds
+        (output) throttle -> Dictionary of the throttle or None if no -T
+
+    """
+
+    if not args.get_val("-T", def_val=False):
+        return None
+
+    return {"Limits": dict(limits), "Delay": 0.0, "Lock": threading.Lock()}
+
+
+def get_load(server, names, var_names=None):
+
+    """Function:  get_load
+
+    Description:  Return the current values of global status variables, and
+        of global system variables if any are passed, in a single query.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) names -> List of global status variable names
+        (input) var_names -> List of global system variable names
+        (output) Dictionary of lowercase variable names and values
+
+    """
+
+    var_names = list(var_names or [])
+    cmd = "select variable_name as Variable_name," \
+          " variable_value as Value" \
+          " from performance_schema.global_status" \
+          " where variable_name in (" + ", ".join(["%s"] * len(names)) + ")"
+
+    if var_names:
+        cmd += " union all select variable_name, variable_value" \
+               " from performance_schema.global_variables" \
+               " where variable_name in (" \
+               + ", ".join(["%s"] * len(var_names)) + ")"
+
+    return {row["Variable_name"].lower(): int(row["Value"])
+            for row in server.col_sql(cmd, params=list(names) + var_names)}
+
+
+def throttle_wait(server, throttle):
+
+    """Function:  throttle_wait
+
+    Description:  Pace the run on the server load.  While a threshold is
+        exceeded the delay is doubled and the run pauses and samples again.
+        Once the load is below half of every threshold the delay is halved
+        (or cleared).  The current delay is waited before returning.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) throttle -> Dictionary of the throttle
+
+    """
+
+    while True:
+        load = get_load(server, throttle["Limits"])
+        ratio = max((load.get(name.lower(), 0) / limit
+                     for name, limit in throttle["Limits"].items() if limit),
+                    default=0)
+
+        with throttle["Lock"]:
+            if ratio >= 1:
+                throttle["Delay"] = min(
+                    max(throttle["Delay"] * 2, THROTTLE_MIN_DELAY),
+                    THROTTLE_MAX_DELAY)
+
+            elif ratio < 0.5:
+                throttle["Delay"] = throttle["Delay"] / 2 \
+                    if throttle["Delay"] > THROTTLE_MIN_DELAY else 0.0
+
+            delay = throttle["Delay"]
+
+        if delay:
+            time.sleep(delay)
+
+        if ratio < 1:
+            break
+
+
+def throttle_batch(server, batch, batch_func, throttle):
+
+    """Function:  throttle_batch
+
+    Description:  Wait for the server load before running the batch function
+        on a batch of tables.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) batch -> List of (database name, table name) tuples
+        (input) batch_func -> Function to run:  batch_func(server, batch)
+        (input) throttle -> Dictionary of the throttle
+        (output) List of table results or None if not started
+
+    """
+
+    throttle_wait(server, throttle)
+
+    return batch_func(server, batch)
+
+
+def create_lag(args):
+
+    """Function:  create_lag
+
+    Description:  Connect to the replicas of the -R option for checking the
+        replication lag.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) lag -> Dictionary of the replica lag check or None if no
+            replicas are connected
+
+    """
+
+    replicas = []
+
+    for cfg in args.get_val("-R", def_val=None) or []:
+        srv = mysql_libs.create_instance(
+            cfg, args.get_val("-d"), mysql_class.Server)
+        srv.connect(silent=True)
+
+        if srv.conn_msg:
+            print(f"create_lag: Warning:  Connection failed on replica:"
+                  f" {srv.name}: {srv.conn_msg}")
+            continue
+
+        replicas.append(srv)
+
+    if not replicas:
+        return None
+
+    return {"Replicas": replicas,
+            "Max": int(args.get_val("-l", def_val=LAG_MAX_SECS)),
+            "Waits": 0, "WaitSecs": 0.0, "TimedOut": False,
+            "Unprocessed": [], "Lock": threading.Lock()}
+
+
+def close_lag(lag):
+
+    """Function:  close_lag
+
+    Description:  Disconnect the replicas of the replica lag check.
+
+    Arguments:
+        (input) lag -> Dictionary of the replica lag check
+
+    """
+
+    if lag:
+        for srv in lag["Replicas"]:
+            mysql_libs.disconnect(srv)
+
+
+def get_lag(replica):
+
+    """Function:  get_lag
+
+    Description:  Return the replication lag of a replica, the highest of all
+        replication channels.
+
+    Arguments:
+        (input) replica -> Server instance of the replica
+        (output) Replication lag in seconds or None if not replicating
+
+    """
+
+    lags = [row["Seconds_Behind_Source"]
+            for row in replica.col_sql("show replica status")
+            if row.get("Seconds_Behind_Source") is not None]
+
+    return max(int(item) for item in lags) if lags else None
+
+
+def lag_wait(lag):
+
+    """Function:  lag_wait
+
+    Description:  Wait until the replication lag of every replica is below
+        the threshold and add the time waited to the lag check.  The lock
+        holds every worker while one of them waits.  A wait longer than
+        LAG_MAX_WAIT times out the lag check and no later wait is made.
+
+    Arguments:
+        (input) lag -> Dictionary of the replica lag check
+        (output) True|False - Lag is below the threshold
+
+    """
+
+    with lag["Lock"]:
+        if lag["TimedOut"]:
+            return False
+
+        start = time.monotonic()
+        waited = False
+
+        while max(get_lag(srv) or 0 for srv in lag["Replicas"]) \
+                >= lag["Max"]:
+            if time.monotonic() - start >= LAG_MAX_WAIT:
+                lag["TimedOut"] = True
+                break
+
+            waited = True
+            time.sleep(LAG_POLL_SECS)
+
+        if waited:
+            lag["Waits"] += 1
+            lag["WaitSecs"] += time.monotonic() - start
+
+        return not lag["TimedOut"]
+
+
+def lag_batch(server, batch, batch_func, lag):
+
+    """Function:  lag_batch
+
+    Description:  Wait for the replication lag before running the batch
+        function on a batch of tables.  If the wait timed out the tables are
+        added to the unprocessed tables.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) batch -> List of (database name, table name) tuples
+        (input) batch_func -> Function to run:  batch_func(server, batch)
+        (input) lag -> Dictionary of the replica lag check
+        (output) List of table results or None if not started
+
+    """
+
+    if not lag_wait(lag):
+        with lag["Lock"]:
+            lag["Unprocessed"].extend(
+                {"Database": dbn, "TableName": tbl} for dbn, tbl in batch)
+
+        return None
+
+    return batch_func(server, batch)
+
+
+def lag_report(lag):
+
+    """Function:  lag_report
+
+    Description:  Return the time waited on the replication lag and the
+        tables not processed after the wait timed out.
+
+    Arguments:
+        (input) lag -> Dictionary of the replica lag check
+        (output) Dictionary of the replica wait report
+
+    """
+
+    return {"MaxLag": lag["Max"], "Waits": lag["Waits"],
+            "WaitSecs": round(lag["WaitSecs"], 3),
+            "TimedOut": lag["TimedOut"], "Unprocessed": lag["Unprocessed"]}
+
+
+def batch_done(                                         # pylint:disable=R0913
+        b_idx, b_data, batches, tasks, t_list=None, tbl_done=None):
+
+    """Function:  batch_done
+
+    Description:  Pass each table's results of a finished batch to the
+        tbl_done function if one is set, otherwise store them in the table
+        results list.  A batch not started (no results) or a table without
+        results (e.g. a matching comparison) is skipped.
+
+    Arguments:
+        (input) b_idx -> Index of the batch
+        (input) b_data -> List of dictionaries of table results in batch order
+            or None if the batch was not started
+        (input) batches -> List of lists of task indexes
+        (input) tasks -> List of (database name, table name) tuples
+        (input) t_list -> List of table results in task order
+        (input) tbl_done -> Function called for each table:
+            tbl_done(dbn, t_data)
+
+    """
+
+    for idx, t_data in zip(batches[b_idx], b_data or []):
+        if not tbl_done:
+            t_list[idx] = t_data
+
+        elif t_data is not None:
+            tbl_done(tasks[idx][0], t_data)
+
+
+def process_tables(                                     # pylint:disable=R0913
+        server, args, db_dict, tbl_func, batch_func=None, tbl_done=None,
+        budget=None, throttle=None, lag=None):
+
+    """Function:  process_tables
+
+    Description:  Run a table function against every table in the database
+        dictionary, using a pool of connections if the -j option is set.
+        The tables are scheduled largest first so a large table does not
+        start at the end of the run, but the results are returned in
+        database dictionary order.  If the -B option and a batch function
+        are passed, small tables are processed in batches.  If a tbl_done
+        function is passed, each table's results are passed to it as soon
+        as the table finishes instead of being returned.  If a time budget
+        is passed, tables not started within the budget are left out.  If a
+        throttle is passed, each batch waits for the server load first.  If
+        a lag check is passed, each batch waits for the replication lag
+        first.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) tbl_func -> Function to run:  tbl_func(server, dbn, tbl)
+        (input) batch_func -> Function to run on a batch of tables:
+            batch_func(server, batch)
+        (input) tbl_done -> Function called for each table:
+            tbl_done(dbn, t_data)
+        (input) budget -> Dictionary of the time budget
+        (input) throttle -> Dictionary of the throttle
+        (input) lag -> Dictionary of the replica lag check
+        (output) results -> List of database results with table results
+
+    """
+
+    results = []
+    tasks = [(dbn, tbl) for dbn, tbls in db_dict.items() for tbl in tbls]
+    order = sorted(
+        range(len(tasks)),
+        key=lambda idx: tbl_size(db_dict[tasks[idx][0]][tasks[idx][1]]),
+        reverse=True)
+    batch_size = int(args.get_val("-B", def_val=1))
+
+    if batch_func and batch_size > 1:
+        batches = make_batches(tasks, order, db_dict, batch_size)
+
+    else:
+        batches = [[idx] for idx in order]
+        batch_func = functools.partial(run_batch, tbl_func=tbl_func)
+
+    if budget:
+        batch_func = functools.partial(
+            budget_batch, batch_func=batch_func, budget=budget,
+            db_dict=db_dict)
+
+    # Wait first so a pause is not counted against the time budget
+    if throttle:
+        batch_func = functools.partial(
+            throttle_batch, batch_func=batch_func, throttle=throttle)
+
+    if lag:
+        batch_func = functools.partial(
+            lag_batch, batch_func=batch_func, lag=lag)
+
+    t_list = None if tbl_done else [None] * len(tasks)
+    pool = create_pool(server, args)
+
+    try:
+        run_tasks(
+            pool, [([tasks[idx] for idx in batch],) for batch in batches],
+            batch_func, functools.partial(
+                batch_done, batches=batches, tasks=tasks, t_list=t_list,
+                tbl_done=tbl_done))
+
+    finally:
+        close_pool(pool)
+
+    if t_list is not None:
+        t_list = iter(t_list)
+
+        for dbn, tbls in db_dict.items():
+            t_data = [next(t_list) for _ in tbls]
+            results.append({"Database": dbn, "Tables": [
+                item for item in t_data if item is not None]})
+
+    return results
+
+
+def get_ckpt_file(args, ckpt_type):
+
+    """Function:  get_ckpt_file
+
+    Description:  Return the checkpoint file name for the -y flavor id and the
+        option type.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) ckpt_type -> Option type (e.g. check)
+        (output) Directory path and name of checkpoint file
+
+    """
+
+    flavor = args.get_val("-y", def_val="")
+    name = "mysql_db_admin_" + flavor if flavor else "mysql_db_admin"
+
+    return os.path.join(args.get_val("-P"), f"{name}_{ckpt_type}.ckpt")
+
+
+def load_ckpt(ckpt_file, header):
+
+    """Function:  load_ckpt
+
+    Description:  Load the finished tables from a checkpoint file.  The
+        checkpoint is ignored if its header does not match, and a line cut
+        short by an interrupted run is skipped.
+
+    Arguments:
+        (input) ckpt_file -> Directory path and name of checkpoint file
+        (input) header -> Dictionary of the checkpoint header
+        (output) done -> Dictionary of databases and dictionaries of table
+            results
+
+    """
+
+    done = {}
+
+    if not os.path.isfile(ckpt_file):
+        return done
+
+    with open(ckpt_file, "r", encoding="UTF-8") as fhdr:
+        for cnt, line in enumerate(fhdr):
+            try:
+                line = json.loads(line)
+
+            except ValueError:
+                continue
+
+            if cnt == 0 and line != header:
+                return {}
+
+            if "Database" in line:
+                done.setdefault(line["Database"], {})[
+                    line["Table"]["TableName"]] = line["Table"]
+
+    return done
+
+
+def ckpt_table(dbn, t_data, fhdr, done, tbl_done=None):
+
+    """Function:  ckpt_table
+
+    Description:  Record a finished table in the checkpoint file and pass its
+        results to the tbl_done function if one is set, otherwise store them
+        in the finished tables.
+
+    Arguments:
+        (input) dbn -> Database name
+        (input) t_data -> Dictionary of table results
+        (input) fhdr -> File handler of checkpoint file
+        (input) done -> Dictionary of databases and dictionaries of table
+            results
+        (input) tbl_done -> Function called for each table:
+            tbl_done(dbn, t_data)
+
+    """
+
+    stream_line({"Database": dbn, "Table": t_data}, fhdr=fhdr)
+
+    if tbl_done:
+        tbl_done(dbn, t_data)
+
+    else:
+        done.setdefault(dbn, {})[t_data["TableName"]] = t_data
+
+
+def ckpt_tables(                                        # pylint:disable=R0913
+        server, args, db_dict, results, tbl_func, batch_func=None,
+        tbl_done=None, budget=None, throttle=None, lag=None):
+
+    """Function:  ckpt_tables
+
+    Description:  Process the tables with a checkpoint file.  With the -r
+        option the tables finished by a previous run are not processed again
+        and their results are merged with the new results.  The checkpoint
+        file is removed once all tables are finished, it is kept if tables
+        were not started within the time budget or the replica lag wait.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) results -> JSON template document
+        (input) tbl_func -> Function to run:  tbl_func(server, dbn, tbl)
+        (input) batch_func -> Function to run on a batch of tables
+        (input) tbl_done -> Function called for each table:
+            tbl_done(dbn, t_data)
+        (input) budget -> Dictionary of the time budget
+        (input) throttle -> Dictionary of the throttle
+        (input) lag -> Dictionary of the replica lag check
+        (output) t_results -> List of database results with table results
+
+    """
+
+    t_results = []
+    ckpt_file = get_ckpt_file(args, results["Type"])
+    header = {"Server": server.name, "Type": results["Type"]}
+    done = load_ckpt(ckpt_file, header) if args.arg_exist("-r") else {}
+    todo = {}
+
+    # Rewrite the checkpoint so a line cut short by the last run is dropped
+    with open(ckpt_file, "w", encoding="UTF-8") as fhdr:
+        stream_line(header, fhdr=fhdr)
+
+        for dbn, tbls in db_dict.items():
+            todo[dbn] = {}
+
+            for tbl, tbl_info in tbls.items():
+                if tbl in done.get(dbn, {}):
+                    ckpt_table(dbn, done[dbn][tbl], fhdr, done, tbl_done)
+
+                else:
+                    todo[dbn][tbl] = tbl_info
+
+        process_tables(
+            server, args, todo, tbl_func, batch_func=batch_func,
+            tbl_done=functools.partial(
+                ckpt_table, fhdr=fhdr, done=done, tbl_done=tbl_done),
+            budget=budget, throttle=throttle, lag=lag)
+
+    if (not budget or not budget["Unprocessed"]) \
+       and (not lag or not lag["Unprocessed"]):
+        os.remove(ckpt_file)
+
+    if not tbl_done:
+        for dbn, tbls in db_dict.items():
+            t_results.append({"Database": dbn, "Tables": [
+                done[dbn][tbl] for tbl in tbls if tbl in done.get(dbn, {})]})
+
+    return t_results
+
+
+def stream_line(line, fhdr=None, suppress=False, lock=None):
+
+    """Function:  stream_line
+
+    Description:  Write a JSON document as a single line to the file, or to
+        standard out if no file is set.
+
+    Arguments:
+        (input) line -> JSON data document
+        (input) fhdr -> File handler of output file
+        (input) suppress -> True|False - Suppress standard out
+        (input) lock -> Lock held while writing if the file is shared
+
+    """
+
+    line = json.dumps(line, default=str)
+
+    with lock or contextlib.nullcontext():
+        if fhdr:
+            fhdr.write(line + "\n")
+            fhdr.flush()
+
+        elif not suppress:
+            print(line, flush=True)
+
+
+def stream_table(dbn, t_data, template, **kwargs):
+
+    """Function:  stream_table
+
+    Description:  Write a table's results as a JSON line, to include the
+        template (server and type) and the database name.
+
+    Arguments:
+        (input) dbn -> Database name
+        (input) t_data -> Dictionary of table results
+        (input) template -> JSON template document
+        (input) **kwargs:
+            fhdr -> File handler of output file
+            suppress -> True|False - Suppress standard out
+            lock -> Lock held while writing if the file is shared
+
+    """
+
+    line = dict(template)
+    line["Database"] = dbn
+    line.update(t_data)
+    stream_line(line, **kwargs)
+
+
+def stream_tables(                                      # pylint:disable=R0913
+        server, args, db_dict, results, tbl_func, batch_func=None,
+        budget=None, throttle=None, lag=None, fleet=None):
+
+    """Function:  stream_tables
+
+    Description:  Process the tables and write each table's results as a
+        JSON line (NDJSON) as soon as the table finishes.  A summary line
+        closes the run.  The results are not kept in memory.  In fleet mode
+        the lines go to the output file shared by the fleet.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) results -> JSON template document
+        (input) tbl_func -> Function to run:  tbl_func(server, dbn, tbl)
+        (input) batch_func -> Function to run on a batch of tables
+        (input) budget -> Dictionary of the time budget
+        (input) throttle -> Dictionary of the throttle
+        (input) lag -> Dictionary of the replica lag check
+        (input) fleet -> Dictionary of the fleet run
+        (output) state -> True|False - Successful operation
+        (output) msg -> None or error message
+
+    """
+
+    data_config = create_data_config(args)
+    fhdr = fleet["Fhdr"] if fleet else None
+    lock = fleet["Lock"] if fleet else None
+
+    if data_config["outfile"] and not fleet:
+        fhdr = open(                                    # pylint:disable=R1732
+            data_config["outfile"], data_config["mode"], encoding="UTF-8")
+
+    try:
+        tbl_done = functools.partial(
+            stream_table, template=results, fhdr=fhdr,
+            suppress=data_config["suppress"], lock=lock)
+
+        if args.get_val("-P"):
+            ckpt_tables(
+                server, args, db_dict, results, tbl_func,
+                batch_func=batch_func, tbl_done=tbl_done, budget=budget,
+                throttle=throttle, lag=lag)
+
+        else:
+            process_tables(
+                server, args, db_dict, tbl_func, batch_func=batch_func,
+                tbl_done=tbl_done, budget=budget, throttle=throttle,
+                lag=lag)
+
+        summary = dict(results)
+        summary["Summary"] = {
+            "Databases": len(db_dict),
+            "Tables": sum(len(tbls) for tbls in db_dict.values()),
+            "EndTime": gen_libs.get_date() + "T" + gen_libs.get_time()}
+
+        if budget:
+            summary["Summary"]["Unprocessed"] = budget["Unprocessed"]
+
+        if lag:
+            summary["Summary"]["ReplicaWait"] = lag_report(lag)
+
+        stream_line(
+            summary, fhdr=fhdr, suppress=data_config["suppress"], lock=lock)
+
+    finally:
+        if fhdr and not fleet:
+            fhdr.close()
+
+    return True, None
+
+
+def run_tables(                                         # pylint:disable=R0913
+        server, args, db_dict, results, tbl_func, batch_func=None,
+        budget=None, throttle=None, lag=None, fleet=None):
+
+    """Function:  run_tables
+
+    Description:  Process the tables and send out the results, either as a
+        JSON line per table if the -J option is passed or as a single JSON
+        document.  Tables not started within the time budget are listed
+        under Unprocessed and the time waited on replication lag under
+        ReplicaWait.  In fleet mode the document is handed to the fleet.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) db_dict -> Dictionary of databases and dictionaries of tables
+        (input) results -> JSON template document
+        (input) tbl_func -> Function to run:  tbl_func(server, dbn, tbl)
+        (input) batch_func -> Function to run on a batch of tables
+        (input) budget -> Dictionary of the time budget
+        (input) throttle -> Dictionary of the throttle
+        (input) lag -> Dictionary of the replica lag check
+        (input) fleet -> Dictionary of the fleet run
+        (output) state -> True|False - Successful operation
+        (output) msg -> None or error message
+
+    """
+
+    if args.get_val("-J", def_val=False):
+        return stream_tables(
+            server, args, db_dict, results, tbl_func, batch_func=batch_func,
+            budget=budget, throttle=throttle, lag=lag, fleet=fleet)
+
+    data_config = dict(create_data_config(args))
+
+    if args.get_val("-P"):
+        results["Results"] = ckpt_tables(
+            server, args, db_dict, results, tbl_func, batch_func=batch_func,
+            budget=budget, throttle=throttle, lag=lag)
+
+    else:
+        results["Results"] = process_tables(
+            server, args, db_dict, tbl_func, batch_func=batch_func,
+            budget=budget, throttle=throttle, lag=lag)
+
+    if budget:
+        results["Unprocessed"] = budget["Unprocessed"]
+
+    if lag:
+        results["ReplicaWait"] = lag_report(lag)
+
+    if fleet:
+        fleet_doc(fleet, results)
+
+        return True, None
+
+    return data_out(results, **data_config)
+
+
+def analyze(server, args, **kwargs):
+
+    """Function:  analyze
+
+    Description:  Analzye the tables for problems.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            sys_dbs -> List of system databases to skip
+            fleet -> Dictionary of the fleet run
+
+    """
+
+    db_list = list(args.get_val("-A"))
+    db_dict = get_db_tbl(server, args, db_list, **kwargs)
+    results = get_json_template(server)
+    results["Type"] = "analyze"
+    lag = create_lag(args)
+
+    try:
+        state = run_tables(
+            server, args, db_dict, results,
+            functools.partial(
+                table_route, db_dict=db_dict, cmd="analyze",
+                tbl_func=functools.partial(
+                    table_cmd, cmd_func=mysql_libs.analyze_tbl)),
+            batch_func=functools.partial(
+                route_batch, db_dict=db_dict, cmd="analyze"),
+            lag=lag, fleet=kwargs.get("fleet"))
+
+    finally:
+        close_lag(lag)
+
+    if not state[0]:
+        print(f"analyze: Error encountered: {state[1]}")
+
+
+def check(server, args, **kwargs):
+
+    """Function:  check
+
+    Description:  Check the tables for errors.  The check table mode is set
+        by the -m option.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            sys_dbs -> List of system databases to skip
+            throttle_limits -> Dictionary of global status thresholds
+            fleet -> Dictionary of the fleet run
+
+    """
+
+    mode = args.get_val("-m", def_val=None)
+    tbl_func = functools.partial(table_cmd, cmd_func=mysql_libs.check_tbl)
+
+    if mode:
+        mode = mode.upper()
+
+        if mode not in CHECK_MODES:
+            print(f"check: Error encountered: Invalid check mode: {mode}")
+            return
+
+        tbl_func = functools.partial(table_check, mode=mode)
+
+    db_list = list(args.get_val("-C"))
+    db_dict = get_db_tbl(server, args, db_list, **kwargs)
+    results = get_json_template(server)
+    results["Type"] = "check"
+    state = run_tables(
+        server, args, db_dict, results,
+        functools.partial(
+            table_route, db_dict=db_dict, cmd="check", tbl_func=tbl_func),
+        batch_func=functools.partial(
+            route_batch, db_dict=db_dict, cmd="check", mode=mode),
+        budget=create_budget(args), throttle=create_throttle(
+            args, kwargs.get("throttle_limits", THROTTLE_LIMITS)),
+        fleet=kwargs.get("fleet"))
+
+    if not state[0]:
+        print(f"check: Error encountered: {state[1]}")
+
+
+def optimize(server, args, **kwargs):
+
+    """Function:  optimize
+
+    Description:  Optimizes the tables for best performance.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            sys_dbs -> List of system databases to skip
+            throttle_limits -> Dictionary of global status thresholds
+            fleet -> Dictionary of the fleet run
+
+    """
+
+    db_list = list(args.get_val("-D"))
+    downgrade = args.get_val("-q", def_val=False)
+    frag = args.get_val("-g", def_val=None) is not None \
+        or args.get_val("-G", def_val=None) is not None
+
+    if downgrade or frag:
+        # Free space must be current to decide on a rebuild
+        server.cmd_sql("set session information_schema_stats_expiry = 0")
+
+    db_dict = get_db_tbl(server, args, db_list, **kwargs)
+    results = get_json_template(server)
+    results["Type"] = "optimize"
+    tbl_func = functools.partial(
+        table_route, db_dict=db_dict, cmd="optimize",
+        tbl_func=functools.partial(
+            table_cmd, cmd_func=mysql_libs.optimize_tbl),
+        downgrade=downgrade)
+    batch_func = functools.partial(
+        route_batch, db_dict=db_dict, cmd="optimize", downgrade=downgrade)
+
+    if frag:
+        tbl_func = functools.partial(
+            table_route, db_dict=db_dict, cmd="optimize",
+            tbl_func=functools.partial(
+                table_optimize, db_dict=db_dict,
+                frag_pct=int(args.get_val("-g", def_val=0)),
+                free_mb=int(args.get_val("-G", def_val=0))))
+        batch_func = None
+
+    lag = create_lag(args)
+
+    try:
+        state = run_tables(
+            server, args, db_dict, results, tbl_func, batch_func=batch_func,
+            budget=create_budget(args), throttle=create_throttle(
+                args, kwargs.get("throttle_limits", THROTTLE_LIMITS)),
+            lag=lag, fleet=kwargs.get("fleet"))
+
+    finally:
+        close_lag(lag)
+
+    if not state[0]:
+        print(f"optimize: Error encountered: {state[1]}")
+
+
+def checksum(server, args, **kwargs):
+
+    """Function:  checksum
+
+    Description:  Returns checksums of the tables.  With the -O option the
+        tables are checksummed on the source and the replica at the same time
+        and only the mismatching tables are returned.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            sys_dbs -> List of system databases to skip
+            throttle_limits -> Dictionary of global status thresholds
+            fleet -> Dictionary of the fleet run
+
+    """
+
+    db_list = list(args.get_val("-S"))
+    state_file = args.get_val("-I", def_val=None)
+    throttle = create_throttle(
+        args, kwargs.get("throttle_limits", THROTTLE_LIMITS))
+    chunk = create_chunk(server, args, throttle)
+    tbl_func = functools.partial(table_checksum_chunk, chunk=chunk) \
+        if chunk else None
+    cmp = None
+
+    if args.get_val("-O", def_val=None) is not None:
+        cmp = create_compare(args, chunk)
+
+        if not cmp:
+            close_chunk(chunk)
+            print(f"checksum: Error encountered: No connection to replica:"
+                  f" {args.get_val('-O')}")
+            return
+
+        tbl_func = functools.partial(table_compare, cmp=cmp)
+
+    if state_file:
+        # Metadata must be current to detect changed tables
+        server.cmd_sql("set session information_schema_stats_expiry = 0")
+
+    db_dict = get_db_tbl(server, args, db_list, **kwargs)
+    results = get_json_template(server)
+    results["Type"] = "checksum"
+
+    if tbl_func is None:
+        tbl_func = functools.partial(table_checksum, db_dict=db_dict)
+
+    if cmp:
+        results["Type"] = "compare"
+        results["Replica"] = cmp["Pool"][0].name
+
+    if state_file:
+        chk_state = load_state(state_file)
+        tbl_func = functools.partial(
+            table_checksum_inc, db_dict=db_dict,
+            srv_state=chk_state.setdefault(server.name, {}),
+            full=args.get_val("-f", def_val=False), chk_func=tbl_func,
+            method="chunk" if chunk else None)
+
+    try:
+        state = run_tables(
+            server, args, db_dict, results, tbl_func, throttle=throttle,
+            fleet=kwargs.get("fleet"))
+
+    finally:
+        close_chunk(chunk)
+        close_compare(cmp)
+
+    if chunk and chunk["File"]:
+        os.remove(chunk["File"])
+
+    if state_file:
+        save_state(state_file, chk_state)
+
+    if not state[0]:
+        print(f"optimize: Error encountered: {state[1]}")
+
+
+def pct(num, den):
+
+    """Function:  pct
+
+    Description:  Return a percentage rounded to two places.
+
+    Arguments:
+        (input) num -> Numerator
+        (input) den -> Denominator
+        (output) Percentage or None if the denominator is zero
+
+    """
+
+    return round(num / den * 100, 2) if den else None
+
+
+def ext_status(vals):
+
+    """Function:  ext_status
+
+    Description:  Derive the extended status (InnoDB buffer pool, row locks,
+        temporary tables and thread cache) from the global status and system
+        variables.
+
+    Arguments:
+        (input) vals -> Dictionary of lowercase variable names and values
+        (output) Dictionary of the extended status sections
+
+    """
+
+    reqs = vals.get("innodb_buffer_pool_read_requests", 0)
+    tmp_tbls = vals.get("created_tmp_tables", 0)
+    conns = vals.get("connections", 0)
+
+    return {
+        "InnoDB": {
+            "BufferPoolHitRatio": pct(
+                reqs - vals.get("innodb_buffer_pool_reads", 0), reqs),
+            "DirtyPagesPercent": pct(
+                vals.get("innodb_buffer_pool_pages_dirty", 0),
+                vals.get("innodb_buffer_pool_pages_total", 0)),
+            "RowLockWaits": vals.get("innodb_row_lock_waits"),
+            "RowLockCurrentWaits": vals.get("innodb_row_lock_current_waits"),
+            "RowLockTimeAvgMs": vals.get("innodb_row_lock_time_avg")},
+        "TempTables": {
+            "Created": tmp_tbls,
+            "CreatedOnDisk": vals.get("created_tmp_disk_tables", 0),
+            "PercentOnDisk": pct(
+                vals.get("created_tmp_disk_tables", 0), tmp_tbls)},
+        "ThreadCache": {
+            "Size": vals.get("thread_cache_size"),
+            "ThreadsCreated": vals.get("threads_created", 0),
+            "HitRate": pct(conns - vals.get("threads_created", 0), conns)}}
+
+
+def get_status(server):
+
+    """Function:  get_status
+
+    Description:  Return a status document of the database server, to include
+        the extended status fetched in a single performance_schema query.
+
+    Arguments:
+        (input) server -> Server instance
+        (output) results -> JSON status document
+
+    """
+
+    server.upd_srv_stat()
+    results = get_json_template(server)
+    results["Type"] = "status"
+    results["Memory"] = {
+        "CurrentUsage": server.cur_mem_mb, "MaxUsage": server.max_mem_mb,
+        "PercentUsed": server.prct_mem}
+    results["UpTime"] = server.days_up
+    results["Connections"] = {
+        "CurrentConnected": server.cur_conn, "MaxConnections": server.max_conn,
+        "PercentUsed": server.prct_conn}
+    results.update(
+        ext_status(get_load(server, STATUS_EXT, STATUS_EXT_VARS)))
+
+    return results
+
+
+def status_rates(prev, cur, secs):
+
+    """Function:  status_rates
+
+    Description:  Return the per second rates of the status counters between
+        two samples.
+
+    Arguments:
+        (input) prev -> Dictionary of the previous sample's counters
+        (input) cur -> Dictionary of the current sample's counters
+        (input) secs -> Seconds between the samples
+        (output) rates -> Dictionary of the per second rates
+
+    """
+
+    rates = {"Interval": round(secs, 3)}
+
+    for name, label in STATUS_RATES.items():
+        rates[label] = round(
+            (cur.get(name.lower(), 0) - prev.get(name.lower(), 0)) / secs, 2)
+
+    return rates
+
+
+def status_sample(server, args):
+
+    """Function:  status_sample
+
+    Description:  Take a status sample at a fixed interval over one
+        connection and write each sample as a JSON line, with the per second
+        rates of the counters since the previous sample.  With the -E option
+        the Prometheus metrics file is rewritten for each sample.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (output) state -> True|False - Successful operation
+        (output) msg -> None or error message
+
+    """
+
+    data_config = create_data_config(args)
+    interval = int(args.get_val("-i"))
+    count = args.get_val("-N", def_val=None)
+    count = int(count) if count is not None else None
+    prev = None
+    cnt = 0
+    fhdr = None
+
+    if data_config["outfile"]:
+        fhdr = open(                                    # pylint:disable=R1732
+            data_config["outfile"], data_config["mode"], encoding="UTF-8")
+
+    try:
+        start = time.monotonic()
+
+        while count is None or cnt < count:
+            if cnt:
+                time.sleep(max(0, start + cnt * interval - time.monotonic()))
+
+            now = time.monotonic()
+            results = get_status(server)
+            counters = get_load(server, PROM_COUNTERS)
+
+            if prev:
+                results["Rates"] = status_rates(
+                    prev[1], counters, now - prev[0])
+
+            prev = (now, counters)
+
+            if args.get_val("-E", def_val=None):
+                prom_write(args.get_val("-E"), prom_text(results, counters))
+
+            if fhdr:
+                stream_line(results, fhdr=fhdr)
+
+            stream_line(results, suppress=data_config["suppress"])
+            cnt += 1
+
+    finally:
+        if fhdr:
+            fhdr.close()
+
+    return True, None
+
+
+def prom_value(val):
+
+    """Function:  prom_value
+
+    Description:  Return a value in Prometheus text format.
+
+    Arguments:
+        (input) val -> Value
+        (output) Value as a string or None if not a number
+
+    """
+
+    try:
+        val = float(val)
+
+    except (TypeError, ValueError):
+        return None
+
+    return str(int(val)) if val.is_integer() else repr(val)
+
+
+def prom_text(results, counters):
+
+    """Function:  prom_text
+
+    Description:  Return the status document and global status counters in
+        Prometheus text exposition format, labelled with the server name.
+
+    Arguments:
+        (input) results -> JSON status document
+        (input) counters -> Dictionary of lowercase global status names and
+            values
+        (output) Metrics in Prometheus text format
+
+    """
+
+    label = '{server="' + str(results["Server"]).replace(
+        "\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"}'
+    metrics = [
+        ("mysql_memory_current_mb", results["Memory"]["CurrentUsage"]),
+        ("mysql_memory_max_mb", results["Memory"]["MaxUsage"]),
+        ("mysql_memory_percent_used", results["Memory"]["PercentUsed"]),
+        ("mysql_uptime_days", results["UpTime"]),
+        ("mysql_connections_current",
+         results["Connections"]["CurrentConnected"]),
+        ("mysql_connections_max", results["Connections"]["MaxConnections"]),
+        ("mysql_connections_percent_used",
+         results["Connections"]["PercentUsed"]),
+        ("mysql_innodb_buffer_pool_hit_ratio_percent",
+         results.get("InnoDB", {}).get("BufferPoolHitRatio")),
+        ("mysql_innodb_dirty_pages_percent",
+         results.get("InnoDB", {}).get("DirtyPagesPercent")),
+        ("mysql_tmp_tables_on_disk_percent",
+         results.get("TempTables", {}).get("PercentOnDisk")),
+        ("mysql_thread_cache_hit_rate_percent",
+         results.get("ThreadCache", {}).get("HitRate"))]
+    lines = []
+
+    for name, val in metrics:
+        val = prom_value(val)
+
+        if val is not None:
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name}{label} {val}")
+
+    for item in PROM_COUNTERS:
+        val = prom_value(counters.get(item.lower()))
+
+        if val is not None:
+            name = "mysql_global_status_" + item.lower()
+            mtype = "gauge" if item in PROM_GAUGES else "counter"
+            lines.append(f"# TYPE {name} {mtype}")
+            lines.append(f"{name}{label} {val}")
+
+    return "\n".join(lines) + "\n"
+
+
+def prom_write(prom_file, text):
+
+    """Function:  prom_write
+
+    Description:  Write the metrics to a temporary file which then replaces
+        the metrics file, so a collector never reads a partly written file.
+
+    Arguments:
+        (input) prom_file -> Path and name of metrics file
+        (input) text -> Metrics in Prometheus text format
+
+    """
+
+    tmp_file = prom_file + ".tmp"
+
+    with open(tmp_file, "w", encoding="UTF-8") as fhdr:
+        fhdr.write(text)
+
+    os.replace(tmp_file, prom_file)
+
+
+def prom_app(environ, start_response, server):
+
+    """Function:  prom_app
+
+    Description:  WSGI application serving the Prometheus metrics, each
+        scrape takes a sample over the server connection.
+
+    Arguments:
+        (input) environ -> WSGI environment
+        (input) start_response -> WSGI start response function
+        (input) server -> Server instance
+        (output) List of response body
+
+    """
+
+    if environ.get("PATH_INFO", "/") not in ["/", "/metrics"]:
+        start_response("404 Not Found", [("Content-Type", "text/plain")])
+        return [b"Not Found\n"]
+
+    body = prom_text(
+        get_status(server), get_load(server, PROM_COUNTERS)).encode("UTF-8")
+    start_response("200 OK", [
+        ("Content-Type", "text/plain; version=0.0.4; charset=utf-8"),
+        ("Content-Length", str(len(body)))])
+
+    return [body]
+
+
+def prom_serve(server, args):
+
+    """Function:  prom_serve
+
+    Description:  Serve the Prometheus metrics on the local HTTP port until
+        the program is stopped.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (output) state -> True|False - Successful operation
+        (output) msg -> None or error message
+
+    """
+
+    httpd = wsgiref.simple_server.make_server(
+        "127.0.0.1", int(args.get_val("-H")),
+        functools.partial(prom_app, server=server))
+
+    try:
+        httpd.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        httpd.server_close()
+
+    return True, None
+
+
+def status(server, args, **kwargs):
+
+    """Function:  status
+
+    Description:  Retrieves a number of database status variables and sends
+        them out either in standard out (print) or to a JSON format which
+        is printed and poissibly inserted into a Mongo database.  With the
+        -i option the status is sampled at a fixed interval.  With the -E or
+        -H options the status is written or served as Prometheus metrics.
+        In fleet mode the status is handed to the fleet.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            sys_dbs -> List of system databases to skip
+            fleet -> Dictionary of the fleet run
+
+    """
+
+    if args.get_val("-H", def_val=None) is not None:
+        state = prom_serve(server, args)
+
+    elif args.get_val("-i", def_val=None) is not None:
+        state = status_sample(server, args)
+
+    elif args.get_val("-E", def_val=None) is not None:
+        prom_write(args.get_val("-E"), prom_text(
+            get_status(server), get_load(server, PROM_COUNTERS)))
+        state = (True, None)
+
+    elif kwargs.get("fleet"):
+        fleet_doc(kwargs.get("fleet"), get_status(server))
+        state = (True, None)
+
+    else:
+        data_config = dict(create_data_config(args))
+        state = data_out(get_status(server), **data_config)
+
+    if not state[0]:
+        print(f"analyze: Error encountered: {state[1]}")
+
+
+def listdbs(server, args, **kwargs):
+
+    """Function:  listdbs
+
+    Description:  List user or user/system databases in the database instance.
+        The databases are read from the schema cache if the -a option is
+        passed.  In fleet mode the list is handed to the fleet.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            sys_dbs -> List of system databases
+            fleet -> Dictionary of the fleet run
+
+    """
+
+    sys_dbs = list(kwargs.get("sys_dbs", []))
+    db_list = load_cache(server, args)["Databases"] \
+        if args.arg_exist("-a") else gen_libs.dict_2_list(
+            mysql_libs.fetch_db_dict(server), "Database")
+
+    if kwargs.get("fleet"):
+        fleet_doc(kwargs.get("fleet"), {
+            "Server": server.name, "Databases": db_list
+            if args.arg_exist("-k")
+            else gen_libs.del_not_and_list(db_list, sys_dbs)})
+
+    elif args.arg_exist("-k"):
+        print("List of user and system databases:")
+
+        for item in db_list:
+            print(f"    {item}")
+
+    else:
+        print("List of user databases:")
+
+        for item in gen_libs.del_not_and_list(db_list, sys_dbs):
+            print(f"    {item}")
+
+
+def fleet_doc(fleet, data):
+
+    """Function:  fleet_doc
+
+    Description:  Hand a server's JSON document to the fleet, either written
+        as a JSON line to the shared output file (-J option) or kept under
+        the server's name for the fleet document.
+
+    Arguments:
+        (input) fleet -> Dictionary of the fleet run
+        (input) data -> JSON data document
+
+    """
+
+    if fleet["Stream"]:
+        stream_line(
+            data, fhdr=fleet["Fhdr"], suppress=fleet["Suppress"],
+            lock=fleet["Lock"])
+
+    else:
+        with fleet["Lock"]:
+            fleet["Servers"][data.get("Server")] = data
+
+
+def run_server(args, func_dict, cfg_name, fleet=None):
+
+    """Function:  run_server
+
+    Description:  Connect to the server of a configuration module and run the
+        functions against it.  For a configuration module other than the -c
+        option, the functions get a copy of the arguments with -c set to the
+        module so any extra connections (-j option) go to the same server.
+        In fleet mode an error on the server is handed to the fleet instead
+        of stopping the fleet run.  The server is always disconnected.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary of functions
+        (input) cfg_name -> Name of the configuration module
+        (input) fleet -> Dictionary of the fleet run
+
+    """
+
+    sysdbs = ["performance_schema", "information_schema", "mysql", "sys"]
+
+    func_dict = dict(func_dict)
+
+    if cfg_name != args.get_val("-c"):
+        args = copy.copy(args)
+        args.args_array = dict(args.args_array)
+        args.args_array["-c"] = cfg_name
+
+    server = mysql_libs.create_instance(
+        cfg_name, args.get_val("-d"), mysql_class.Server)
+    server.connect(silent=True)
+
+    if server.conn_msg and fleet:
+        fleet_doc(fleet, {"Server": server.name, "Error": server.conn_msg})
+
+    elif server.conn_msg:
         print(f"run_program:  Error encountered on server: {server.name}:"
               f" {server.conn_msg}")
 
     else:
-        # Intersect args.args_array & func_dict to determine functions to call
-        for item in set(args.get_args_keys()) & set(func_dict.keys()):
-            cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
-            sys_dbs = cfg.sys_dbs if hasattr(cfg, "sys_dbs") else sysdbs
-            func_dict[item](server, args, sys_dbs=sys_dbs)
+        try:
+            # Intersect args.args_array & func_dict to determine functions
+            for item in set(args.get_args_keys()) & set(func_dict.keys()):
+                cfg = gen_libs.load_module(cfg_name, args.get_val("-d"))
+                sys_dbs = cfg.sys_dbs if hasattr(cfg, "sys_dbs") else sysdbs
+                limits = cfg.throttle_limits \
+                    if hasattr(cfg, "throttle_limits") else THROTTLE_LIMITS
+                func_dict[item](
+                    server, args, sys_dbs=sys_dbs, throttle_limits=limits,
+                    fleet=fleet)
+
+        except Exception as err:                        # pylint:disable=W0718
+            if not fleet:
+                raise
+
+            fleet_doc(fleet, {"Server": server.name, "Error": str(err)})
+
+        finally:
+            mysql_libs.disconnect(server)
+
+
+def fleet_run(args, func_dict):
+
+    """Function:  fleet_run
+
+    Description:  Run the functions against the servers of the -c and -F
+        options, up to -W servers at the same time.  The results are sent out
+        as one JSON document keyed by server name, or with the -J option as
+        JSON lines to the output file as each table finishes.  An error on
+        one server is reported under its configuration name and the other
+        servers carry on.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary of functions
+
+    """
+
+    data_config = dict(create_data_config(args))
+    cfg_list = list(dict.fromkeys(
+        [args.get_val("-c")] + list(args.get_val("-F"))))
+    fleet = {
+        "Servers": {}, "Lock": threading.Lock(), "Fhdr": None,
+        "Stream": args.get_val("-J", def_val=False),
+        "Suppress": data_config["suppress"]}
+
+    if fleet["Stream"]:
+        fleet["Fhdr"] = open(                           # pylint:disable=R1732
+            data_config["outfile"], data_config["mode"], encoding="UTF-8")
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(args.get_val("-W", def_val=FLEET_WORKERS))) \
+                as executor:
+            futs = {
+                executor.submit(
+                    run_server, args, func_dict, cfg, fleet=fleet): cfg
+                for cfg in cfg_list}
+
+            for fut in concurrent.futures.as_completed(futs):
+                try:
+                    fut.result()
+
+                except Exception as err:                # pylint:disable=W0718
+                    fleet_doc(fleet, {"Server": futs[fut], "Error": str(err)})
+
+    finally:
+        if fleet["Fhdr"]:
+            fleet["Fhdr"].close()
+
+    if not fleet["Stream"]:
+        results = {
+            "Platform": "MySQL", "Type": "fleet",
+            "AsOf": gen_libs.get_date() + "T" + gen_libs.get_time(),
+            "Servers": fleet["Servers"]}
+        state = data_out(results, **data_config)
+
+        if not state[0]:
+            print(f"fleet_run: Error encountered: {state[1]}")
+
+
+def run_program(args, func_dict):
+
+    """Function:  run_program
+
+    Description:  Creates class instance(s) and controls flow of the program.
 
-        mysql_libs.disconnect(server)
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary of functions
+
+    """
+
+    if args.get_val("-F", def_val=None):
+        fleet_run(args, func_dict)
+
+    else:
+        run_server(args, func_dict, args.get_val("-c"))
 
 
 def main():
@@ -683,7 +4019,9 @@ def main():
         func_dict -> dictionary list for the function calls or other options
         opt_con_req_list -> contains the options that require other options
         opt_def_dict -> contains options with their default values
+        opt_int_list -> contains the options that require integer values
         opt_multi_list -> contains the options that will have multiple values
+        opt_pos_list -> contains the options that require positive values
         opt_req_list -> contains the options that are required for the program
         opt_val_list -> contains options which require values
         opt_xor_dict -> contains options which are XOR with its values
@@ -693,27 +4031,44 @@ def main():
 
     """
 
-    dir_perms_chk = {"-d": 5}
-    file_perms = {"-o": 6}
-    file_crt_list = ["-o"]
+    dir_perms_chk = {"-d": 5, "-P": 7, "-a": 7}
+    file_perms = {"-o": 6, "-I": 6, "-E": 6}
+    file_crt_list = ["-o", "-I", "-E"]
     func_dict = {
         "-A": analyze, "-C": check, "-D": optimize, "-S": checksum,
         "-M": status, "-L": listdbs}
-    opt_con_req_list = {"-s": ["-e"], "-u": ["-e"], "-w": ["-o"]}
+    opt_con_req_list = {
+        "-s": ["-e"], "-u": ["-e"], "-w": ["-o"], "-g": ["-D"], "-G": ["-D"],
+        "-I": ["-S"], "-f": ["-I"], "-J": ["-o"], "-r": ["-P"],
+        "-l": ["-R"], "-i": ["-M"], "-N": ["-i"],
+        "-E": ["-M"], "-H": ["-M"], "-W": ["-F"],
+        "-K": ["-S"], "-Q": ["-K"],
+        "-O": ["-S"], "-x": ["-a"], "-m": ["-C"], "-q": ["-D"]}
     opt_def_dict = {
         "-t": None, "-A": [], "-C": [], "-D": [], "-S": [], "-n": 4}
-    opt_multi_list = ["-A", "-C", "-D", "-S", "-t", "-e", "-s"]
+    opt_int_list = [
+        "-n", "-j", "-g", "-G", "-B", "-b", "-l", "-i", "-N", "-H", "-W", "-K",
+        "-Q", "-x"]
+    opt_pos_list = ["-j", "-W", "-K", "-Q", "-B", "-i", "-l"]
+    opt_multi_list = [
+        "-A", "-C", "-D", "-S", "-t", "-e", "-s", "-R", "-F", "-X", "-Z"]
     opt_req_list = ["-c", "-d"]
     opt_val_list = [
         "-c", "-d", "-t", "-A", "-C", "-D", "-S", "-o", "-e", "-s", "-y", "-w",
-        "-n"]
+        "-n", "-j", "-g", "-G", "-I", "-B", "-P", "-b", "-R", "-l",
+        "-i", "-N", "-E", "-H", "-F", "-W", "-K", "-Q",
+        "-O", "-a", "-x", "-X", "-Z", "-m"]
     opt_xor_dict = {
         "-A": ["-C", "-D", "-M", "-S", "-L"],
         "-C": ["-A", "-D", "-M", "-S", "-L"],
         "-D": ["-A", "-C", "-M", "-S", "-L"],
         "-S": ["-A", "-C", "-D", "-M", "-L"],
         "-M": ["-A", "-C", "-D", "-S", "-L"],
-        "-L": ["-A", "-C", "-D", "-S", "-M"]}
+        "-L": ["-A", "-C", "-D", "-S", "-M"],
+        "-F": ["-I", "-P", "-R", "-i", "-E", "-H", "-O"],
+        "-O": ["-I", "-P", "-Q"],
+        "-a": ["-I", "-g", "-G", "-q"],
+        "-q": ["-g", "-G"]}
 
     # Process argument list from command line.
     args = gen_class.ArgParser(
@@ -726,7 +4081,9 @@ def main():
        and args.arg_xor_dict(opt_xor_val=opt_xor_dict)                      \
        and args.arg_cond_req(opt_con_req=opt_con_req_list)                  \
        and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)                    \
-       and args.arg_file_chk(file_perm_chk=file_perms, file_crt=file_crt_list):
+       and args.arg_file_chk(
+           file_perm_chk=file_perms, file_crt=file_crt_list)                \
+       and arg_int_chk(args, opt_int_list, opt_pos_list):
 
         try:
             proglock = gen_class.ProgramLock(
@@ -115,9 +115,10 @@ class UnitTest(unittest.TestCase):
 
         self.server = Server()
         self.args = ArgParser()
-        self.db_tbl = {"db1": ["tbl1"]}
-        self.db_tbl2 = {"db1": ["tbl1", "tbl2"]}
-        self.db_tbl3 = {"db1": ["tbl1", "tbl2"], "db2": ["tbl3", "tbl4"]}
+        self.db_tbl = {"db1": {"tbl1": {}}}
+        self.db_tbl2 = {"db1": {"tbl1": {}, "tbl2": {}}}
+        self.db_tbl3 = {
+            "db1": {"tbl1": {}, "tbl2": {}}, "db2": {"tbl3": {}, "tbl4": {}}}
         self.template = {"Server": "ServerName"}
         self.config = {"config": "value"}
         self.analyze = [{"Msg_type": "status", "Msg_text": "OK"}]
@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  arg_int_chk.py
+
+    Description:  Unit testing of arg_int_chk in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/arg_int_chk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zero_positive
+        test_positive
+        test_zero_not_positive
+        test_not_integer
+        test_integer
+        test_no_option
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_int_list = ["-j"]
+        self.opt_pos_list = ["-W"]
+
+    def test_zero_positive(self):
+
+        """Function:  test_zero_positive
+
+        Description:  Test with a zero value for an option requiring a
+            positive value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-W"] = "0"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_db_admin.arg_int_chk(
+                    self.args, ["-W"], self.opt_pos_list))
+
+    def test_positive(self):
+
+        """Function:  test_positive
+
+        Description:  Test with a positive value for an option requiring a
+            positive value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-W"] = "1"
+
+        self.assertTrue(
+            mysql_db_admin.arg_int_chk(self.args, ["-W"], self.opt_pos_list))
+
+    def test_zero_not_positive(self):
+
+        """Function:  test_zero_not_positive
+
+        Description:  Test with a zero value for an option not requiring a
+            positive value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "0"
+
+        self.assertTrue(
+            mysql_db_admin.arg_int_chk(
+                self.args, self.opt_int_list, self.opt_pos_list))
+
+    def test_not_integer(self):
+
+        """Function:  test_not_integer
+
+        Description:  Test with option with a non-integer value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "abc"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_db_admin.arg_int_chk(self.args, self.opt_int_list))
+
+    def test_integer(self):
+
+        """Function:  test_integer
+
+        Description:  Test with option with an integer value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "4"
+
+        self.assertTrue(
+            mysql_db_admin.arg_int_chk(self.args, self.opt_int_list))
+
+    def test_no_option(self):
+
+        """Function:  test_no_option
+
+        Description:  Test with option not passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_db_admin.arg_int_chk(self.args, self.opt_int_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
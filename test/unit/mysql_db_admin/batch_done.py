@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  batch_done.py
+
+    Description:  Unit testing of batch_done in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/batch_done.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tbl_done
+        test_no_results
+        test_not_started
+        test_tbl_done
+        test_store_results
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tasks = [("db1", "t1"), ("db1", "t2"), ("db2", "t3")]
+        self.batches = [[2, 0], [1]]
+        self.b_data = [{"TableName": "t3"}, {"TableName": "t1"}]
+        self.done = []
+        self.results = [{"TableName": "t1"}, None, {"TableName": "t3"}]
+        self.results2 = [("db2", {"TableName": "t3"}),
+                         ("db1", {"TableName": "t1"})]
+
+    def tbl_done(self, dbn, t_data):
+
+        """Function:  tbl_done
+
+        Description:  Stub holder to capture the table results.
+
+        Arguments:
+
+        """
+
+        self.done.append((dbn, t_data))
+
+    def test_no_results(self):
+
+        """Function:  test_no_results
+
+        Description:  Test a table without results is not passed on.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.batch_done(
+            0, [None, {"TableName": "t1"}], self.batches, self.tasks,
+            tbl_done=self.tbl_done)
+
+        self.assertEqual(self.done, [("db1", {"TableName": "t1"})])
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test with a batch not started.
+
+        Arguments:
+
+        """
+
+        t_list = [None] * len(self.tasks)
+        mysql_db_admin.batch_done(
+            0, None, self.batches, self.tasks, t_list=t_list)
+
+        self.assertEqual(t_list, [None, None, None])
+
+    def test_tbl_done(self):
+
+        """Function:  test_tbl_done
+
+        Description:  Test with a tbl_done function.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.batch_done(
+            0, self.b_data, self.batches, self.tasks, tbl_done=self.tbl_done)
+
+        self.assertEqual(self.done, self.results2)
+
+    def test_store_results(self):
+
+        """Function:  test_store_results
+
+        Description:  Test storing the table results in task order.
+
+        Arguments:
+
+        """
+
+        t_list = [None] * len(self.tasks)
+        mysql_db_admin.batch_done(
+            0, self.b_data, self.batches, self.tasks, t_list=t_list)
+
+        self.assertEqual(t_list, self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
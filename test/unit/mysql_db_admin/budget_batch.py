@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  budget_batch.py
+
+    Description:  Unit testing of budget_batch in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/budget_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def batch_func(server, batch):
+
+    """Function:  batch_func
+
+    Description:  Function stub holder for a batch function.
+
+    Arguments:
+
+    """
+
+    return [{"TableName": tbl, "Server": server} for _, tbl in batch]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_over_budget
+        test_within_budget
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.batch = [("db1", "t1"), ("db1", "t2")]
+        self.db_dict = {"db1": {
+            "t1": {"DATA_LENGTH": 300, "INDEX_LENGTH": 100},
+            "t2": {"DATA_LENGTH": 100, "INDEX_LENGTH": 0}}}
+        self.budget = {"End": 100.0, "Bytes": 1000, "Secs": 100.0,
+                       "Tables": 1, "Unprocessed": [],
+                       "Lock": threading.Lock()}
+        self.results = [{"TableName": "t1", "Server": "Server"},
+                        {"TableName": "t2", "Server": "Server"}]
+        self.unprocessed = [{"Database": "db1", "TableName": "t1"},
+                            {"Database": "db1", "TableName": "t2"}]
+
+    @mock.patch("mysql_db_admin.time.monotonic",
+                mock.Mock(return_value=60.0))
+    def test_over_budget(self):
+
+        """Function:  test_over_budget
+
+        Description:  Test a batch predicted to not finish within the budget
+            is not started.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_db_admin.budget_batch(
+                self.server, self.batch, batch_func, self.budget,
+                self.db_dict))
+        self.assertEqual(self.budget["Unprocessed"], self.unprocessed)
+
+    @mock.patch("mysql_db_admin.time.monotonic")
+    def test_within_budget(self, mock_time):
+
+        """Function:  test_within_budget
+
+        Description:  Test a batch predicted to finish within the budget.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 30.0]
+
+        self.assertEqual(
+            mysql_db_admin.budget_batch(
+                self.server, self.batch, batch_func, self.budget,
+                self.db_dict), self.results)
+        self.assertEqual(
+            (self.budget["Bytes"], self.budget["Secs"], self.budget["Tables"]),
+            (1500, 120.0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  budget_est.py
+
+    Description:  Unit testing of budget_est in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/budget_est.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_by_size
+        test_by_count
+        test_no_history
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.budget = {"End": 1000.0, "Bytes": 0, "Secs": 0.0, "Tables": 0,
+                       "Unprocessed": [], "Lock": threading.Lock()}
+
+    def test_by_size(self):
+
+        """Function:  test_by_size
+
+        Description:  Test predicting by size.
+
+        Arguments:
+
+        """
+
+        self.budget.update({"Bytes": 1000, "Secs": 10.0, "Tables": 2})
+
+        self.assertEqual(
+            mysql_db_admin.budget_est(self.budget, 500, 1), 5.0)
+
+    def test_by_count(self):
+
+        """Function:  test_by_count
+
+        Description:  Test predicting by number of tables if the finished
+            tables had no size.
+
+        Arguments:
+
+        """
+
+        self.budget.update({"Secs": 10.0, "Tables": 2})
+
+        self.assertEqual(
+            mysql_db_admin.budget_est(self.budget, 500, 3), 15.0)
+
+    def test_no_history(self):
+
+        """Function:  test_no_history
+
+        Description:  Test with no tables finished.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.budget_est(self.budget, 500, 1), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Classification (U)
+
+"""Program:  cache_tbls.py
+
+    Description:  Unit testing of cache_tbls in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/cache_tbls.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_tbl_list
+        test_excludes
+        test_pattern
+        test_names
+        test_empty_db_list
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cache = {"Tables": {
+            "app_1": {"t1": {}, "tmp_t2": {}}, "app_2": {"t3": {}},
+            "db1": {"t4": {}}}}
+        self.results = {"app_1": {"t1": {}}}
+        self.results2 = {
+            "app_1": {"t1": {}, "tmp_t2": {}}, "app_2": {"t3": {}}}
+
+    def test_tbl_list(self):
+
+        """Function:  test_tbl_list
+
+        Description:  Test with a table list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.cache_tbls(self.cache, ["app_1"], ["t1", "t9"]),
+            self.results)
+
+    def test_excludes(self):
+
+        """Function:  test_excludes
+
+        Description:  Test with database and table excludes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.cache_tbls(
+                self.cache, ["app_%"], db_excl=["app_2"],
+                tbl_excl=["tmp_*"]), self.results)
+
+    def test_pattern(self):
+
+        """Function:  test_pattern
+
+        Description:  Test with a database pattern.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.cache_tbls(self.cache, ["app_*"]), self.results2)
+
+    def test_names(self):
+
+        """Function:  test_names
+
+        Description:  Test with database names.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.cache_tbls(self.cache, ["db1", "db9"]),
+            {"db1": {"t4": {}}, "db9": {}})
+
+    def test_empty_db_list(self):
+
+        """Function:  test_empty_db_list
+
+        Description:  Test with an empty database list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.cache_tbls(self.cache, []), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
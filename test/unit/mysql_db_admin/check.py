@@ -95,6 +95,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_invalid_mode
+        test_mode
         test_multiline_return
         test_data_out_error
         test_multiple_db_tbl
@@ -115,9 +117,10 @@ class UnitTest(unittest.TestCase):
 
         self.server = Server()
         self.args = ArgParser()
-        self.db_tbl = {"db1": ["tbl1"]}
-        self.db_tbl2 = {"db1": ["tbl1", "tbl2"]}
-        self.db_tbl3 = {"db1": ["tbl1", "tbl2"], "db2": ["tbl3", "tbl4"]}
+        self.db_tbl = {"db1": {"tbl1": {}}}
+        self.db_tbl2 = {"db1": {"tbl1": {}, "tbl2": {}}}
+        self.db_tbl3 = {
+            "db1": {"tbl1": {}, "tbl2": {}}, "db2": {"tbl3": {}, "tbl4": {}}}
         self.template = {"Server": "ServerName"}
         self.config = {"config": "value"}
         self.check = [{"Msg_type": "status", "Msg_text": "OK"}]
@@ -125,6 +128,56 @@ class UnitTest(unittest.TestCase):
             {"Msg_type": "status", "Msg_text": "OK"},
             {"Msg_type": "note", "Msg_text": "Message Here"}]
 
+    @mock.patch("mysql_db_admin.run_tables")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_invalid_mode(self, mock_dbdict, mock_run):
+
+        """Function:  test_invalid_mode
+
+        Description:  Test with an invalid check table mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "slow"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_db_admin.check(self.server, self.args))
+        mock_dbdict.assert_not_called()
+        mock_run.assert_not_called()
+
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_db_admin.mysql_libs.check_tbl")
+    @mock.patch("mysql_db_admin.table_check")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_mode(                                      # pylint:disable=R0913
+            self, mock_dbdict, mock_template, mock_config, mock_table,
+            mock_check):
+
+        """Function:  test_mode
+
+        Description:  Test with a check table mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "fast"
+
+        mock_dbdict.return_value = self.db_tbl
+        mock_template.return_value = self.template
+        mock_config.return_value = self.config
+        mock_table.return_value = {"TableName": "tbl1", "Mode": "FAST"}
+
+        self.assertFalse(mysql_db_admin.check(self.server, self.args))
+        mock_table.assert_called_once_with(
+            self.server, "db1", "tbl1", mode="FAST")
+        mock_check.assert_not_called()
+
     @mock.patch("mysql_db_admin.data_out",
                 mock.Mock(return_value=(True, None)))
     @mock.patch("mysql_db_admin.mysql_libs.check_tbl")
@@ -73,6 +73,7 @@ class Server():                                         # pylint:disable=R0903
 
     Methods:
         __init__
+        cmd_sql
 
     """
 
@@ -86,6 +87,23 @@ class Server():                                         # pylint:disable=R0903
 
         """
 
+        self.name = "ServerName"
+        self.cmd = None
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Stub method holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return True
+
 
 class UnitTest(unittest.TestCase):
 
@@ -95,6 +113,10 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_chunked
+        test_compare
+        test_compare_no_replica
+        test_incremental
         test_data_out_error
         test_multiple_db_tbl
         test_one_db_multiple_tbl
@@ -114,13 +136,130 @@ class UnitTest(unittest.TestCase):
 
         self.server = Server()
         self.args = ArgParser()
-        self.db_tbl = {"db1": ["tbl1"]}
-        self.db_tbl2 = {"db1": ["tbl1", "tbl2"]}
-        self.db_tbl3 = {"db1": ["tbl1", "tbl2"], "db2": ["tbl3", "tbl4"]}
+        self.db_tbl = {"db1": {"tbl1": {}}}
+        self.db_tbl2 = {"db1": {"tbl1": {}, "tbl2": {}}}
+        self.db_tbl3 = {
+            "db1": {"tbl1": {}, "tbl2": {}}, "db2": {"tbl3": {}, "tbl4": {}}}
         self.template = {"Server": "ServerName"}
         self.config = {"config": "value"}
         self.checksum = [{"Checksum": 123456}]
 
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_db_admin.os.remove")
+    @mock.patch("mysql_db_admin.table_checksum_chunk")
+    @mock.patch("mysql_db_admin.create_chunk")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_chunked(                                   # pylint:disable=R0913
+            self, mock_dbdict, mock_template, mock_config, mock_chunk,
+            mock_tbl, mock_remove):
+
+        """Function:  test_chunked
+
+        Description:  Test with chunked checksum and a checkpoint file.
+
+        Arguments:
+
+        """
+
+        chunk = {"File": "/dir/mysql_db_admin_chunk.ckpt", "Fhdr": None,
+                 "Pool": [self.server]}
+
+        mock_dbdict.return_value = self.db_tbl
+        mock_template.return_value = self.template
+        mock_config.return_value = self.config
+        mock_chunk.return_value = chunk
+        mock_tbl.return_value = {"TableName": "tbl1", "Checksum": 5}
+
+        self.assertFalse(mysql_db_admin.checksum(self.server, self.args))
+        mock_tbl.assert_called_once_with(
+            self.server, "db1", "tbl1", chunk=chunk)
+        mock_remove.assert_called_once_with(chunk["File"])
+
+    @mock.patch("mysql_db_admin.close_compare")
+    @mock.patch("mysql_db_admin.run_tables")
+    @mock.patch("mysql_db_admin.create_compare")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_compare(                                   # pylint:disable=R0913
+            self, mock_dbdict, mock_template, mock_cmp, mock_run,
+            mock_close):
+
+        """Function:  test_compare
+
+        Description:  Test the tables are compared with the replica.
+
+        Arguments:
+
+        """
+
+        cmp = {"Pool": [self.server]}
+        self.args.args_array["-O"] = "replica_cfg"
+
+        mock_dbdict.return_value = self.db_tbl
+        mock_template.return_value = self.template
+        mock_cmp.return_value = cmp
+        mock_run.return_value = (True, None)
+
+        self.assertFalse(mysql_db_admin.checksum(self.server, self.args))
+        self.assertEqual(mock_run.call_args[0][3]["Type"], "compare")
+        self.assertEqual(mock_run.call_args[0][4].keywords, {"cmp": cmp})
+        mock_close.assert_called_once_with(cmp)
+
+    @mock.patch("mysql_db_admin.run_tables")
+    @mock.patch("mysql_db_admin.create_compare", mock.Mock(return_value=None))
+    def test_compare_no_replica(self, mock_run):
+
+        """Function:  test_compare_no_replica
+
+        Description:  Test with no connection to the replica.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-O"] = "replica_cfg"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_db_admin.checksum(self.server, self.args))
+
+        mock_run.assert_not_called()
+
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_db_admin.save_state")
+    @mock.patch("mysql_db_admin.load_state")
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_incremental(                               # pylint:disable=R0913
+            self, mock_dbdict, mock_template, mock_config, mock_checksum,
+            mock_load, mock_save):
+
+        """Function:  test_incremental
+
+        Description:  Test with incremental checksum state file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = "/path/state.json"
+
+        mock_dbdict.return_value = self.db_tbl
+        mock_template.return_value = self.template
+        mock_config.return_value = self.config
+        mock_checksum.return_value = self.checksum
+        mock_load.return_value = {}
+
+        self.assertFalse(mysql_db_admin.checksum(self.server, self.args))
+        self.assertEqual(
+            mock_save.call_args[0][1]["ServerName"]["db1"]["tbl1"]["Checksum"],
+            123456)
+
     @mock.patch("mysql_db_admin.data_out",
                 mock.Mock(return_value=(False, "Error Message")))
     @mock.patch("mysql_db_admin.mysql_libs.checksum")
@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  chunk_digest.py
+
+    Description:  Unit testing of chunk_digest in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/chunk_digest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cmds = []
+        self.rows = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return self.rows.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stop
+        test_last_chunk
+        test_range_chunk
+        test_first_chunk
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.cols = ["id", "name"]
+        self.pk_cols = ["id"]
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test the last chunk of a range ends at the stop
+            primary key.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[], [{"RowCnt": 5, "Digest": 7}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_digest(
+                self.server, "db1", "t1", self.cols, self.pk_cols, [100],
+                1000, stop=[199]), {"Upper": None, "Rows": 5, "Digest": 7})
+        self.assertTrue(
+            self.server.cmds[0][0].endswith(
+                "where (`id`) > (%s) and (`id`) <= (%s)"
+                " order by `id` limit 1 offset 999"))
+        self.assertTrue(
+            self.server.cmds[1][0].endswith(
+                "where (`id`) > (%s) and (`id`) <= (%s)"))
+        self.assertEqual(self.server.cmds[1][1], (100, 199))
+
+    def test_last_chunk(self):
+
+        """Function:  test_last_chunk
+
+        Description:  Test the last chunk runs to the end of the table.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[], [{"RowCnt": 5, "Digest": 7}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_digest(
+                self.server, "db1", "t1", self.cols, self.pk_cols, [100],
+                1000), {"Upper": None, "Rows": 5, "Digest": 7})
+        self.assertTrue(
+            self.server.cmds[1][0].endswith("where (`id`) > (%s)"))
+        self.assertEqual(self.server.cmds[1][1], (100,))
+
+    def test_range_chunk(self):
+
+        """Function:  test_range_chunk
+
+        Description:  Test a chunk inside a range is bound by its upper
+            primary key.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"id": 150}], [{"RowCnt": 50, "Digest": 3}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_digest(
+                self.server, "db1", "t1", self.cols, self.pk_cols, [100],
+                50, stop=[199]), {"Upper": [150], "Rows": 50, "Digest": 3})
+        self.assertEqual(self.server.cmds[1][1], (100, 150))
+
+    def test_first_chunk(self):
+
+        """Function:  test_first_chunk
+
+        Description:  Test the first chunk is bound by its upper primary key.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"id": 1000}], [{"RowCnt": 1000, "Digest": 3}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_digest(
+                self.server, "db1", "t1", self.cols, self.pk_cols, None,
+                1000), {"Upper": [1000], "Rows": 1000, "Digest": 3})
+        self.assertTrue(
+            self.server.cmds[0][0].endswith("limit 1 offset 999"))
+        self.assertTrue(
+            self.server.cmds[1][0].endswith("where (`id`) <= (%s)"))
+        self.assertIn("bit_xor(crc32(concat_ws(", self.server.cmds[1][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
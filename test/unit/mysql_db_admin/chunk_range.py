@@ -0,0 +1,162 @@
+# Classification (U)
+
+"""Program:  chunk_range.py
+
+    Description:  Unit testing of chunk_range in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/chunk_range.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_resume
+        test_key_not_restored
+        test_binary_key
+        test_chunks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.fhdr = mock.MagicMock()
+        self.cols = ["id"]
+        self.chunk = {"Size": 1000, "Throttle": None, "Lock": None,
+                      "File": None, "Fhdr": None, "Done": {}}
+        self.rng = [[0], [2000]]
+        self.digests = [
+            {"Upper": [1000], "Rows": 1000, "Digest": 6},
+            {"Upper": None, "Rows": 10, "Digest": 3}]
+        self.results = {"Lower": None, "Rows": 1010, "Digest": 5,
+                        "Chunks": 2}
+
+    @mock.patch("mysql_db_admin.chunk_digest")
+    def test_resume(self, mock_digest):
+
+        """Function:  test_resume
+
+        Description:  Test a range resumes from its last finished chunk.
+
+        Arguments:
+
+        """
+
+        self.chunk["Done"] = {"db1": {"t1": {"[[0], [2000]]": {
+            "Lower": [1000], "Rows": 1000, "Digest": 6, "Chunks": 1}}}}
+        mock_digest.return_value = self.digests[1]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_range(
+                self.server, "db1", "t1", self.cols, self.cols, self.chunk,
+                self.rng), self.results)
+        self.assertEqual(mock_digest.call_args[0][5], [1000])
+        self.assertEqual(mock_digest.call_args[1]["stop"], [2000])
+
+    @mock.patch("mysql_db_admin.chunk_digest")
+    def test_key_not_restored(self, mock_digest):
+
+        """Function:  test_key_not_restored
+
+        Description:  Test a chunk whose key type cannot be restored is not
+            recorded.
+
+        Arguments:
+
+        """
+
+        self.chunk["Fhdr"] = self.fhdr
+        mock_digest.side_effect = [
+            {"Upper": [{1, 2}], "Rows": 1000, "Digest": 6},
+            {"Upper": None, "Rows": 10, "Digest": 3}]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_range(
+                self.server, "db1", "t1", self.cols, self.cols, self.chunk,
+                self.rng), self.results)
+        self.fhdr.write.assert_not_called()
+
+    @mock.patch("mysql_db_admin.chunk_digest")
+    def test_binary_key(self, mock_digest):
+
+        """Function:  test_binary_key
+
+        Description:  Test a chunk with a binary key is recorded as hex.
+
+        Arguments:
+
+        """
+
+        self.chunk["Fhdr"] = self.fhdr
+        mock_digest.side_effect = [
+            {"Upper": [b"\x01\xff"], "Rows": 1000, "Digest": 6},
+            {"Upper": None, "Rows": 10, "Digest": 3}]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_range(
+                self.server, "db1", "t1", self.cols, self.cols, self.chunk,
+                self.rng), self.results)
+        self.assertIn('"Lower": [{"Hex": "01ff"}]',
+                      self.fhdr.write.call_args[0][0])
+
+    @mock.patch("mysql_db_admin.throttle_wait")
+    @mock.patch("mysql_db_admin.chunk_digest")
+    def test_chunks(self, mock_digest, mock_wait):
+
+        """Function:  test_chunks
+
+        Description:  Test the chunk digests are combined, the run waits on
+            the throttle between chunks and each finished chunk is recorded.
+
+        Arguments:
+
+        """
+
+        self.chunk["Throttle"] = {"Limits": {}}
+        self.chunk["Fhdr"] = self.fhdr
+        mock_digest.side_effect = self.digests
+
+        self.assertEqual(
+            mysql_db_admin.chunk_range(
+                self.server, "db1", "t1", self.cols, self.cols, self.chunk,
+                self.rng), self.results)
+        self.assertEqual(mock_digest.call_args_list[0][0][5], [0])
+        mock_wait.assert_called_once_with(self.server, {"Limits": {}})
+        self.fhdr.write.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
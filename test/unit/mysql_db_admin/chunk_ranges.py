@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  chunk_ranges.py
+
+    Description:  Unit testing of chunk_ranges in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/chunk_ranges.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cmds = []
+        self.rows = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return self.rows.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_integer
+        test_no_rows
+        test_one_range
+        test_chunk_ranges
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_not_integer(self):
+
+        """Function:  test_not_integer
+
+        Description:  Test with a primary key that is not an integer.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"MinKey": "a", "MaxKey": "z"}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_ranges(self.server, "db1", "t1", "id", 4),
+            [[None, None]])
+
+    def test_no_rows(self):
+
+        """Function:  test_no_rows
+
+        Description:  Test with a table without rows.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"MinKey": None, "MaxKey": None}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_ranges(self.server, "db1", "t1", "id", 4),
+            [[None, None]])
+
+    def test_one_range(self):
+
+        """Function:  test_one_range
+
+        Description:  Test with fewer keys than ranges.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"MinKey": 5, "MaxKey": 5}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_ranges(self.server, "db1", "t1", "id", 4),
+            [[[4], None]])
+
+    def test_chunk_ranges(self):
+
+        """Function:  test_chunk_ranges
+
+        Description:  Test the key space is split into ranges of equal width
+            with an open ended last range.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"MinKey": 1, "MaxKey": 100}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_ranges(self.server, "db1", "t1", "id", 4),
+            [[[0], [25]], [[25], [50]], [[50], [75]], [[75], None]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  chunk_upper.py
+
+    Description:  Unit testing of chunk_upper in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/chunk_upper.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cmds = []
+        self.rows = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return self.rows.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_upper
+        test_chunk_upper
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_upper(self):
+
+        """Function:  test_no_upper
+
+        Description:  Test with fewer rows left than the chunk size.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[]]
+
+        self.assertIsNone(
+            mysql_db_admin.chunk_upper(
+                self.server, "db1", "t1", ["id"], [10], 100, stop=[50]))
+        self.assertEqual(self.server.cmds[0][1], (10, 50))
+
+    def test_chunk_upper(self):
+
+        """Function:  test_chunk_upper
+
+        Description:  Test the upper primary key of the chunk is returned.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"a": 1, "b": 5}]]
+
+        self.assertEqual(
+            mysql_db_admin.chunk_upper(
+                self.server, "db1", "t1", ["a", "b"], None, 100), [1, 5])
+        self.assertEqual(
+            self.server.cmds[0][0],
+            "select `a`, `b` from `db1`.`t1` order by `a`, `b`"
+            " limit 1 offset 99")
+
+
+if __name__ == "__main__":
+    unittest.main()
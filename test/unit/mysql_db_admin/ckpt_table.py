@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  ckpt_table.py
+
+    Description:  Unit testing of ckpt_table in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/ckpt_table.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tbl_done
+        test_tbl_done
+        test_store_done
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fhdr = "FileHandler"
+        self.t_data = {"TableName": "t1", "Status": "OK"}
+        self.done = {}
+        self.tables = []
+        self.line = {"Database": "db1", "Table": self.t_data}
+        self.results = {"db1": {"t1": self.t_data}}
+
+    def tbl_done(self, dbn, t_data):
+
+        """Function:  tbl_done
+
+        Description:  Stub holder to capture the table results.
+
+        Arguments:
+
+        """
+
+        self.tables.append((dbn, t_data))
+
+    @mock.patch("mysql_db_admin.stream_line")
+    def test_tbl_done(self, mock_line):
+
+        """Function:  test_tbl_done
+
+        Description:  Test with a tbl_done function.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.ckpt_table(
+            "db1", self.t_data, self.fhdr, self.done, tbl_done=self.tbl_done)
+
+        mock_line.assert_called_once_with(self.line, fhdr=self.fhdr)
+        self.assertEqual(self.tables, [("db1", self.t_data)])
+        self.assertEqual(self.done, {})
+
+    @mock.patch("mysql_db_admin.stream_line")
+    def test_store_done(self, mock_line):
+
+        """Function:  test_store_done
+
+        Description:  Test storing the table results in the finished tables.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.ckpt_table("db1", self.t_data, self.fhdr, self.done)
+
+        mock_line.assert_called_once_with(self.line, fhdr=self.fhdr)
+        self.assertEqual(self.done, self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,293 @@
+# Classification (U)
+
+"""Program:  ckpt_tables.py
+
+    Description:  Unit testing of ckpt_tables in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/ckpt_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-P": "/dir"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def process_tables(                                     # pylint:disable=R0913
+        server, args, db_dict, tbl_func, batch_func=None, tbl_done=None,
+        budget=None, throttle=None, lag=None):
+
+    """Function:  process_tables
+
+    Description:  Function stub holder for process_tables, finishes every
+        table passed in.
+
+    Arguments:
+
+    """
+
+    for dbn, tbls in db_dict.items():
+        for tbl in tbls:
+            tbl_done(dbn, {"TableName": tbl, "Run": "new"})
+
+    return [server, args, tbl_func, batch_func, budget, throttle, lag]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tbl_done
+        test_lag_keep_ckpt
+        test_budget_keep_ckpt
+        test_resume_tbl_done
+        test_resume
+        test_no_resume
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.db_dict = {"db1": {"t1": {}, "t2": {}}}
+        self.results = {"Server": "ServerName", "Type": "check"}
+        self.done = {"db1": {"t1": {"TableName": "t1", "Run": "old"}}}
+        self.tables = []
+        self.results2 = [{"Database": "db1", "Tables": [
+            {"TableName": "t1", "Run": "new"},
+            {"TableName": "t2", "Run": "new"}]}]
+        self.results3 = [{"Database": "db1", "Tables": [
+            {"TableName": "t1", "Run": "old"},
+            {"TableName": "t2", "Run": "new"}]}]
+
+    def tbl_done(self, dbn, t_data):
+
+        """Function:  tbl_done
+
+        Description:  Stub holder to capture the table results.
+
+        Arguments:
+
+        """
+
+        self.tables.append((dbn, t_data["TableName"], t_data["Run"]))
+
+    @mock.patch("mysql_db_admin.os.remove")
+    @mock.patch("mysql_db_admin.process_tables", process_tables)
+    @mock.patch("builtins.open", mock.mock_open())
+    def test_lag_keep_ckpt(self, mock_remove):
+
+        """Function:  test_lag_keep_ckpt
+
+        Description:  Test the checkpoint file is kept if tables were not
+            started after the replica lag wait timed out.
+
+        Arguments:
+
+        """
+
+        lag = {"Unprocessed": [{"Database": "db1", "TableName": "t3"}]}
+
+        self.assertEqual(
+            mysql_db_admin.ckpt_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                lag=lag), self.results2)
+        mock_remove.assert_not_called()
+
+    @mock.patch("mysql_db_admin.os.remove")
+    @mock.patch("mysql_db_admin.process_tables", process_tables)
+    @mock.patch("builtins.open", mock.mock_open())
+    def test_budget_keep_ckpt(self, mock_remove):
+
+        """Function:  test_budget_keep_ckpt
+
+        Description:  Test the checkpoint file is kept if tables were not
+            started within the time budget.
+
+        Arguments:
+
+        """
+
+        budget = {"Unprocessed": [{"Database": "db1", "TableName": "t3"}]}
+
+        self.assertEqual(
+            mysql_db_admin.ckpt_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                budget=budget), self.results2)
+        mock_remove.assert_not_called()
+
+    @mock.patch("mysql_db_admin.os.remove", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.process_tables", process_tables)
+    @mock.patch("mysql_db_admin.load_ckpt")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_resume_tbl_done(self, mock_file, mock_load):
+
+        """Function:  test_resume_tbl_done
+
+        Description:  Test resuming with a tbl_done function.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        mock_load.return_value = self.done
+
+        self.assertEqual(
+            mysql_db_admin.ckpt_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                tbl_done=self.tbl_done), [])
+        self.assertEqual(
+            self.tables, [("db1", "t1", "old"), ("db1", "t2", "new")])
+        self.assertEqual(mock_file().write.call_count, 3)
+
+    @mock.patch("mysql_db_admin.os.remove")
+    @mock.patch("mysql_db_admin.process_tables", process_tables)
+    @mock.patch("mysql_db_admin.load_ckpt")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_resume(self, mock_file, mock_load, mock_remove):
+
+        """Function:  test_resume
+
+        Description:  Test resuming merges the old and new results.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        mock_load.return_value = self.done
+
+        self.assertEqual(
+            mysql_db_admin.ckpt_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.results3)
+        mock_file.assert_called_once_with(
+            "/dir/mysql_db_admin_check.ckpt", "w", encoding="UTF-8")
+        mock_remove.assert_called_once_with("/dir/mysql_db_admin_check.ckpt")
+
+    @mock.patch("mysql_db_admin.os.remove", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.process_tables", process_tables)
+    @mock.patch("mysql_db_admin.load_ckpt")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_no_resume(self, mock_file, mock_load):
+
+        """Function:  test_no_resume
+
+        Description:  Test with no -r option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.ckpt_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.results2)
+        mock_load.assert_not_called()
+        self.assertEqual(mock_file().write.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
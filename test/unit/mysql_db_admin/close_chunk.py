@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  close_chunk.py
+
+    Description:  Unit testing of close_chunk in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/close_chunk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_chunk
+        test_close_chunk
+
+    """
+
+    def test_no_chunk(self):
+
+        """Function:  test_no_chunk
+
+        Description:  Test with no chunked checksum.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_db_admin.close_chunk(None))
+
+    @mock.patch("mysql_db_admin.close_pool")
+    def test_close_chunk(self, mock_close):
+
+        """Function:  test_close_chunk
+
+        Description:  Test the chunk checkpoint file is closed and the pool
+            is disconnected.
+
+        Arguments:
+
+        """
+
+        fhdr = mock.MagicMock()
+
+        mysql_db_admin.close_chunk({"Fhdr": fhdr, "Pool": ["Server"]})
+
+        fhdr.close.assert_called_once()
+        mock_close.assert_called_once_with(["Server"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Classification (U)
+
+"""Program:  close_compare.py
+
+    Description:  Unit testing of close_compare in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/close_compare.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_compare
+        test_close_compare
+
+    """
+
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    def test_no_compare(self, mock_disconn):
+
+        """Function:  test_no_compare
+
+        Description:  Test with no comparison.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.close_compare(None)
+
+        mock_disconn.assert_not_called()
+
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    def test_close_compare(self, mock_disconn):
+
+        """Function:  test_close_compare
+
+        Description:  Test the replica connections are disconnected.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.close_compare({"Pool": ["Replica1", "Replica2"]})
+
+        self.assertEqual(mock_disconn.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
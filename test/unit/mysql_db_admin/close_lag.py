@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  close_lag.py
+
+    Description:  Unit testing of close_lag in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/close_lag.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replicas
+        test_no_lag
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lag = {"Replicas": ["Replica1", "Replica2"]}
+
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    def test_replicas(self, mock_disconn):
+
+        """Function:  test_replicas
+
+        Description:  Test the replicas are disconnected.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.close_lag(self.lag)
+
+        self.assertEqual(mock_disconn.call_count, 2)
+
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    def test_no_lag(self, mock_disconn):
+
+        """Function:  test_no_lag
+
+        Description:  Test with no lag check.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.close_lag(None)
+
+        mock_disconn.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+# Classification (U)
+
+"""Program:  compare_chunks.py
+
+    Description:  Unit testing of compare_chunks in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/compare_chunks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import datetime
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mismatch_datetime
+        test_replica_error
+        test_mismatch_limit
+        test_mismatch
+        test_match
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Source"
+        self.replica = "Replica"
+        self.cols = ["id"]
+        self.chunk = {"Size": 100, "Throttle": None}
+
+    @staticmethod
+    def digest(server, **kwargs):
+
+        """Function:  digest
+
+        Description:  Stub holder for range_digest, the replica differs in
+            every chunk.
+
+        Arguments:
+
+        """
+
+        return {"Rows": 100, "Digest": kwargs["lower"][0]
+                if server == "Replica" and kwargs["lower"] else 1}
+
+    @mock.patch("mysql_db_admin.range_digest")
+    @mock.patch("mysql_db_admin.chunk_upper")
+    def test_mismatch_datetime(self, mock_upper, mock_digest):
+
+        """Function:  test_mismatch_datetime
+
+        Description:  Test a differing chunk with a datetime primary key is
+            listed with a reportable key range.
+
+        Arguments:
+
+        """
+
+        mock_upper.side_effect = [[datetime.datetime(2026, 1, 2)], None]
+        mock_digest.side_effect = lambda server, **kwargs: {
+            "Rows": 100, "Digest": 1 if server == "Source" else 2}
+
+        t_data = mysql_db_admin.compare_chunks(
+            self.server, self.replica, "db1", "t1", self.cols, self.cols,
+            self.chunk)
+
+        self.assertEqual(
+            t_data["Mismatches"][1],
+            {"Lower": ["2026-01-02 00:00:00"], "Upper": None,
+             "SourceRows": 100, "ReplicaRows": 100})
+        json.dumps(t_data)
+
+    @mock.patch("mysql_db_admin.range_digest")
+    @mock.patch("mysql_db_admin.chunk_upper")
+    def test_replica_error(self, mock_upper, mock_digest):
+
+        """Function:  test_replica_error
+
+        Description:  Test the walk stops at a replica error and the error is
+            returned.
+
+        Arguments:
+
+        """
+
+        mock_upper.side_effect = [[100], None]
+        mock_digest.side_effect = self.digest_error
+
+        t_data = mysql_db_admin.compare_chunks(
+            self.server, self.replica, "db1", "t1", self.cols, self.cols,
+            self.chunk)
+
+        self.assertEqual(t_data["Error"], "Replica: Unknown column 'c2'")
+        self.assertEqual(t_data["Chunks"], 0)
+        self.assertEqual(mock_upper.call_count, 1)
+
+    @staticmethod
+    def digest_error(server, **kwargs):
+
+        """Function:  digest_error
+
+        Description:  Stub holder for range_digest, the replica table has a
+            missing column.
+
+        Arguments:
+
+        """
+
+        if server == "Replica":
+            raise ValueError("Unknown column 'c2'")
+
+        return {"Rows": 100, "Digest": kwargs["lower"] or 1}
+
+    @mock.patch("mysql_db_admin.CMP_MAX_CHUNKS", 2)
+    @mock.patch("mysql_db_admin.range_digest")
+    @mock.patch("mysql_db_admin.chunk_upper")
+    def test_mismatch_limit(self, mock_upper, mock_digest):
+
+        """Function:  test_mismatch_limit
+
+        Description:  Test the listed mismatched chunks are limited.
+
+        Arguments:
+
+        """
+
+        mock_upper.side_effect = [[100], [200], [300], None]
+        mock_digest.side_effect = self.digest
+
+        t_data = mysql_db_admin.compare_chunks(
+            self.server, self.replica, "db1", "t1", self.cols, self.cols,
+            self.chunk)
+
+        self.assertEqual(t_data["Chunks"], 4)
+        self.assertEqual(t_data["MismatchChunks"], 3)
+        self.assertEqual(len(t_data["Mismatches"]), 2)
+
+    @mock.patch("mysql_db_admin.range_digest")
+    @mock.patch("mysql_db_admin.chunk_upper")
+    def test_mismatch(self, mock_upper, mock_digest):
+
+        """Function:  test_mismatch
+
+        Description:  Test the differing chunk is listed with its primary
+            key range.
+
+        Arguments:
+
+        """
+
+        mock_upper.side_effect = [[100], None]
+        mock_digest.side_effect = self.digest
+
+        t_data = mysql_db_admin.compare_chunks(
+            self.server, self.replica, "db1", "t1", self.cols, self.cols,
+            self.chunk)
+
+        self.assertEqual(
+            t_data["Mismatches"],
+            [{"Lower": [100], "Upper": None, "SourceRows": 100,
+              "ReplicaRows": 100}])
+        self.assertEqual(t_data["Source"], 0)
+        self.assertEqual(t_data["Replica"], 101)
+        self.assertEqual(mock_upper.call_args_list[1][0][4], [100])
+
+    @mock.patch("mysql_db_admin.range_digest")
+    @mock.patch("mysql_db_admin.chunk_upper")
+    def test_match(self, mock_upper, mock_digest):
+
+        """Function:  test_match
+
+        Description:  Test both servers are digested over the same chunks.
+
+        Arguments:
+
+        """
+
+        mock_upper.side_effect = [[100], None]
+        mock_digest.return_value = {"Rows": 100, "Digest": 7}
+
+        t_data = mysql_db_admin.compare_chunks(
+            self.server, self.replica, "db1", "t1", self.cols, self.cols,
+            self.chunk)
+
+        self.assertEqual(t_data["MismatchChunks"], 0)
+        self.assertEqual(t_data["Source"], t_data["Replica"])
+        self.assertEqual(
+            sorted((item[0][0], str(item[1]["upper"]))
+                   for item in mock_digest.call_args_list),
+            [("Replica", "None"), ("Replica", "[100]"), ("Source", "None"),
+             ("Source", "[100]")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  compare_run.py
+
+    Description:  Unit testing of compare_run in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/compare_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import concurrent.futures
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def digest(server):
+
+    """Function:  digest
+
+    Description:  Function stub holder for a digest function, which fails
+        on a missing replica table.
+
+    Arguments:
+
+    """
+
+    if server == "Replica2":
+        raise ValueError("Table 'db1.t1' doesn't exist")
+
+    return {"Server": server}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_source_error
+        test_replica_error
+        test_compare_run
+
+    """
+
+    def test_source_error(self):
+
+        """Function:  test_source_error
+
+        Description:  Test a source error is raised.
+
+        Arguments:
+
+        """
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                mysql_db_admin.compare_run(
+                    executor, digest, "Replica2", "Replica")
+
+    def test_replica_error(self):
+
+        """Function:  test_replica_error
+
+        Description:  Test a replica error is returned as the replica's
+            results.
+
+        Arguments:
+
+        """
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(
+                mysql_db_admin.compare_run(
+                    executor, digest, "Source", "Replica2"),
+                ({"Server": "Source"},
+                 {"Error": "Replica: Table 'db1.t1' doesn't exist"}))
+
+    def test_compare_run(self):
+
+        """Function:  test_compare_run
+
+        Description:  Test the function is run on both servers.
+
+        Arguments:
+
+        """
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(
+                mysql_db_admin.compare_run(
+                    executor, digest, "Source", "Replica"),
+                ({"Server": "Source"}, {"Server": "Replica"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  create_budget.py
+
+    Description:  Unit testing of create_budget in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/create_budget.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-C": []}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_budget
+        test_no_budget
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mysql_db_admin.time.monotonic",
+                mock.Mock(return_value=100.0))
+    def test_budget(self):
+
+        """Function:  test_budget
+
+        Description:  Test with -b option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = "5"
+        budget = mysql_db_admin.create_budget(self.args)
+
+        self.assertEqual(
+            (budget["End"], budget["Tables"], budget["Unprocessed"]),
+            (400.0, 0, []))
+
+    def test_no_budget(self):
+
+        """Function:  test_no_budget
+
+        Description:  Test with no -b option.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.create_budget(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+# Classification (U)
+
+"""Program:  create_chunk.py
+
+    Description:  Unit testing of create_chunk in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/create_chunk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-S": [], "-K": "1000"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_resume
+        test_ranges
+        test_no_checkpoint
+        test_no_chunk
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.done = {"db1": {"t1": {"[null, null]": {
+            "Lower": [b"\x01\xff"], "Chunks": 2}}}}
+
+    @mock.patch("mysql_db_admin.load_chunks")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_resume(self, mock_file, mock_load):
+
+        """Function:  test_resume
+
+        Description:  Test the checkpoint file is rewritten with the chunks
+            of the previous run.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = "/dir"
+        self.args.args_array["-r"] = True
+        mock_load.return_value = self.done
+
+        chunk = mysql_db_admin.create_chunk(self.server, self.args)
+
+        self.assertEqual(chunk["File"], "/dir/mysql_db_admin_chunk.ckpt")
+        self.assertEqual(chunk["Done"], self.done)
+        mock_load.assert_called_once_with(
+            "/dir/mysql_db_admin_chunk.ckpt",
+            {"Server": "ServerName", "Type": "chunk"})
+        self.assertEqual(mock_file().write.call_count, 2)
+        self.assertIn('"Lower": [{"Hex": "01ff"}]',
+                      mock_file().write.call_args[0][0])
+
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_ranges(self, mock_pool):
+
+        """Function:  test_ranges
+
+        Description:  Test the spare pool connections are queued for the -Q
+            option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = "3"
+        mock_pool.return_value = [self.server, "Server2", "Server3"]
+
+        chunk = mysql_db_admin.create_chunk(self.server, self.args)
+
+        mock_pool.assert_called_once_with(self.server, self.args, size=3)
+        self.assertEqual(chunk["Ranges"], 3)
+        self.assertEqual(chunk["Conns"].qsize(), 2)
+
+    def test_no_checkpoint(self):
+
+        """Function:  test_no_checkpoint
+
+        Description:  Test with the -K option and no -P option.
+
+        Arguments:
+
+        """
+
+        chunk = mysql_db_admin.create_chunk(
+            self.server, self.args, throttle="Throttle")
+
+        self.assertEqual(chunk["Size"], 1000)
+        self.assertEqual(chunk["Throttle"], "Throttle")
+        self.assertIsNone(chunk["Fhdr"])
+        self.assertIsNone(chunk["Conns"])
+        self.assertEqual(chunk["Pool"], [self.server])
+
+    def test_no_chunk(self):
+
+        """Function:  test_no_chunk
+
+        Description:  Test with no -K option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-K"]
+
+        self.assertIsNone(mysql_db_admin.create_chunk(self.server, self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# Classification (U)
+
+"""Program:  create_compare.py
+
+    Description:  Unit testing of create_compare in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/create_compare.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-S": [], "-d": "config", "-O": "replica_cfg"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ReplicaName"
+        self.conn_msg = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        return silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_failure
+        test_create_compare
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_connect_failure(self, mock_inst):
+
+        """Function:  test_connect_failure
+
+        Description:  Test with a failed replica connection.
+
+        Arguments:
+
+        """
+
+        self.server.conn_msg = "Error connection message"
+        mock_inst.return_value = self.server
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(mysql_db_admin.create_compare(self.args))
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_create_compare(self, mock_inst):
+
+        """Function:  test_create_compare
+
+        Description:  Test a replica connection is made for each -j
+            connection.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "2"
+        mock_inst.return_value = self.server
+
+        cmp = mysql_db_admin.create_compare(self.args, chunk="Chunk")
+
+        self.assertEqual(cmp["Pool"], [self.server, self.server])
+        self.assertEqual(cmp["Conns"].qsize(), 2)
+        self.assertEqual(cmp["Chunk"], "Chunk")
+        mock_inst.assert_called_with(
+            "replica_cfg", "config", mysql_db_admin.mysql_class.Server)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+# Classification (U)
+
+"""Program:  create_lag.py
+
+    Description:  Unit testing of create_lag in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/create_lag.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-D": []}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.conn_msg = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        status = True
+
+        if silent:
+            status = True
+
+        return status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_failure
+        test_lag_threshold
+        test_replicas
+        test_no_replicas
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.replica = Server()
+        self.replica2 = Server()
+        self.args = ArgParser()
+        self.args.args_array["-R"] = ["replica1", "replica2"]
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_connect_failure(self, mock_inst):
+
+        """Function:  test_connect_failure
+
+        Description:  Test a replica failing to connect is skipped.
+
+        Arguments:
+
+        """
+
+        self.replica2.conn_msg = "Connection error"
+        mock_inst.side_effect = [self.replica, self.replica2]
+
+        with gen_libs.no_std_out():
+            lag = mysql_db_admin.create_lag(self.args)
+
+        self.assertEqual(lag["Replicas"], [self.replica])
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_lag_threshold(self, mock_inst):
+
+        """Function:  test_lag_threshold
+
+        Description:  Test with -l option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-l"] = "10"
+        mock_inst.side_effect = [self.replica, self.replica2]
+
+        self.assertEqual(mysql_db_admin.create_lag(self.args)["Max"], 10)
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_replicas(self, mock_inst):
+
+        """Function:  test_replicas
+
+        Description:  Test with replicas connected.
+
+        Arguments:
+
+        """
+
+        mock_inst.side_effect = [self.replica, self.replica2]
+        lag = mysql_db_admin.create_lag(self.args)
+
+        self.assertEqual(
+            (lag["Replicas"], lag["Max"], lag["Waits"]),
+            ([self.replica, self.replica2], 30, 0))
+
+    def test_no_replicas(self):
+
+        """Function:  test_no_replicas
+
+        Description:  Test with no -R option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-R"]
+
+        self.assertIsNone(mysql_db_admin.create_lag(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
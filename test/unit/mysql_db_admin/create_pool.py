@@ -0,0 +1,216 @@
+# Classification (U)
+
+"""Program:  create_pool.py
+
+    Description:  Unit testing of create_pool in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/create_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.conn_msg = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        status = True
+
+        if silent:
+            status = True
+
+        return status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_size
+        test_connect_failure
+        test_multiple_connections
+        test_single_connection
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.server2 = Server()
+        self.args = ArgParser()
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_size(self, mock_inst):
+
+        """Function:  test_size
+
+        Description:  Test the passed size overrides the -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "3"
+
+        mock_inst.return_value = self.server2
+
+        self.assertEqual(
+            mysql_db_admin.create_pool(self.server, self.args, size=2),
+            [self.server, self.server2])
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_connect_failure(self, mock_inst):
+
+        """Function:  test_connect_failure
+
+        Description:  Test with a failed pool connection.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "3"
+        self.server2.conn_msg = "Error connection message"
+
+        mock_inst.return_value = self.server2
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_db_admin.create_pool(self.server, self.args),
+                [self.server])
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_multiple_connections(self, mock_inst):
+
+        """Function:  test_multiple_connections
+
+        Description:  Test with multiple connections.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "2"
+
+        mock_inst.return_value = self.server2
+
+        self.assertEqual(
+            mysql_db_admin.create_pool(self.server, self.args),
+            [self.server, self.server2])
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_single_connection(self, mock_inst):
+
+        """Function:  test_single_connection
+
+        Description:  Test with no -j option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.create_pool(self.server, self.args), [self.server])
+        mock_inst.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  create_throttle.py
+
+    Description:  Unit testing of create_throttle in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/create_throttle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-C": []}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_throttle
+        test_no_throttle
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.limits = {"Threads_running": 10}
+
+    def test_throttle(self):
+
+        """Function:  test_throttle
+
+        Description:  Test with -T option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-T"] = True
+        throttle = mysql_db_admin.create_throttle(self.args, self.limits)
+
+        self.assertEqual(
+            (throttle["Limits"], throttle["Delay"]), (self.limits, 0.0))
+
+    def test_no_throttle(self):
+
+        """Function:  test_no_throttle
+
+        Description:  Test with no -T option.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_db_admin.create_throttle(self.args, self.limits))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import json
+import pprint
 import unittest
 import mock
 
@@ -110,6 +111,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_email_outfile_render_once
+        test_outfile_indent_str
+        test_outfile_expand_large
         test_outfile_mode_expand2
         test_outfile_mode_expand
         test_outfile_expand
@@ -164,10 +168,74 @@ class UnitTest(unittest.TestCase):
             False, "Error: Is not a dictionary: %s" % (self.data2))
         self.results3 = (False, "Error Message")
         self.outfile = "path/to/open"
+        self.expanded = pprint.pformat(self.data)
+        self.expanded2 = json.dumps(self.data, indent=4)
 
-    @mock.patch("mysql_db_admin.pprint.pprint", mock.Mock(return_value=True))
-    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="data")
-    def test_outfile_mode_expand2(self, mock_file):
+    @mock.patch("mysql_db_admin.json.dumps", wraps=json.dumps)
+    @mock.patch("mysql_db_admin.gen_libs.write_file")
+    @mock.patch("mysql_db_admin.gen_class.setup_mail")
+    def test_email_outfile_render_once(self, mock_mail, mock_write,
+                                       mock_dumps):
+
+        """Function:  test_email_outfile_render_once
+
+        Description:  Test the email and outfile share one JSON render.
+
+        Arguments:
+
+        """
+
+        mock_mail.return_value = self.mail
+
+        self.assertEqual(
+            mysql_db_admin.data_out(
+                self.data, suppress=self.suppress, to_addr=self.to_addr,
+                outfile=self.outfile), self.results)
+        mock_dumps.assert_called_once()
+        mock_write.assert_called_once_with(
+            self.outfile, self.mode2, self.mail.msg)
+
+    @mock.patch("mysql_db_admin.gen_libs.write_file")
+    def test_outfile_indent_str(self, mock_write):
+
+        """Function:  test_outfile_indent_str
+
+        Description:  Test with the indent passed as an option string.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.data_out(
+                self.data, suppress=self.suppress, outfile=self.outfile,
+                indent="4"), self.results)
+        mock_write.assert_called_once_with(
+            self.outfile, self.mode2, self.expanded2)
+
+    @mock.patch("mysql_db_admin.EXPAND_MAX_SIZE", 10)
+    @mock.patch("mysql_db_admin.pprint.pformat")
+    @mock.patch("mysql_db_admin.gen_libs.write_file")
+    def test_outfile_expand_large(self, mock_write, mock_pformat):
+
+        """Function:  test_outfile_expand_large
+
+        Description:  Test a large document is expanded without pprint.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.data_out(
+                self.data, suppress=self.suppress, outfile=self.outfile,
+                expand=True), self.results)
+        mock_pformat.assert_not_called()
+        mock_write.assert_called_once_with(
+            self.outfile, self.mode2, self.expanded2)
+
+    @mock.patch("mysql_db_admin.gen_libs.write_file")
+    def test_outfile_mode_expand2(self, mock_write):
 
         """Function:  test_outfile_mode_expand2
 
@@ -177,18 +245,15 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "data"
-        mock_file.assert_called_with(self.outfile)
-
         self.assertEqual(
             mysql_db_admin.data_out(
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 mode=self.mode2, expand=True), self.results)
+        mock_write.assert_called_once_with(
+            self.outfile, self.mode2, self.expanded)
 
-    @mock.patch("mysql_db_admin.pprint.pprint", mock.Mock(return_value=True))
-    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="data")
-    def test_outfile_mode_expand(self, mock_file):
+    @mock.patch("mysql_db_admin.gen_libs.write_file")
+    def test_outfile_mode_expand(self, mock_write):
 
         """Function:  test_outfile_mode_expand
 
@@ -198,18 +263,15 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "data"
-        mock_file.assert_called_with(self.outfile)
-
         self.assertEqual(
             mysql_db_admin.data_out(
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 mode=self.mode, expand=True), self.results)
+        mock_write.assert_called_once_with(
+            self.outfile, self.mode, self.expanded)
 
-    @mock.patch("mysql_db_admin.pprint.pprint", mock.Mock(return_value=True))
-    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="data")
-    def test_outfile_expand(self, mock_file):
+    @mock.patch("mysql_db_admin.gen_libs.write_file")
+    def test_outfile_expand(self, mock_write):
 
         """Function:  test_outfile_expand
 
@@ -219,14 +281,12 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "data"
-        mock_file.assert_called_with(self.outfile)
-
         self.assertEqual(
             mysql_db_admin.data_out(
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 expand=True), self.results)
+        mock_write.assert_called_once_with(
+            self.outfile, self.mode2, self.expanded)
 
     @mock.patch("mysql_db_admin.gen_libs.write_file",
                 mock.Mock(return_value=True))
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  engine_action.py
+
+    Description:  Unit testing of engine_action in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/engine_action.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_downgrade
+        test_innodb_free
+        test_innodb_no_free
+        test_unsupported
+        test_unknown_engine
+        test_supported
+        test_no_engine
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.innodb = {"ENGINE": "InnoDB", "DATA_FREE": 0}
+        self.innodb2 = {"ENGINE": "InnoDB", "DATA_FREE": 4194304}
+        self.memory = {"ENGINE": "MEMORY"}
+        self.myisam = {"ENGINE": "MyISAM", "DATA_FREE": 0}
+
+    def test_no_downgrade(self):
+
+        """Function:  test_no_downgrade
+
+        Description:  Test the downgrade is off by default.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.engine_action("optimize", self.innodb), "optimize")
+
+    def test_innodb_free(self):
+
+        """Function:  test_innodb_free
+
+        Description:  Test InnoDB optimize with free space.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.engine_action(
+                "optimize", self.innodb2, downgrade=True), "optimize")
+
+    def test_innodb_no_free(self):
+
+        """Function:  test_innodb_no_free
+
+        Description:  Test InnoDB optimize without free space.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.engine_action(
+                "optimize", self.innodb, downgrade=True), "analyze")
+
+    def test_unsupported(self):
+
+        """Function:  test_unsupported
+
+        Description:  Test with an engine known to not support the command.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_db_admin.engine_action("optimize", self.memory))
+
+    def test_unknown_engine(self):
+
+        """Function:  test_unknown_engine
+
+        Description:  Test an engine not known to the program gets the
+            command.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.engine_action("optimize", {"ENGINE": "RocksDB"}),
+            "optimize")
+
+    def test_supported(self):
+
+        """Function:  test_supported
+
+        Description:  Test with a supported engine.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.engine_action("optimize", self.myisam),
+            "optimize")
+
+    def test_no_engine(self):
+
+        """Function:  test_no_engine
+
+        Description:  Test with a table without an engine.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.engine_action("check", {}), "check")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  ext_status.py
+
+    Description:  Unit testing of ext_status in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/ext_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_values
+        test_ext_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.vals = {
+            "innodb_buffer_pool_reads": 50,
+            "innodb_buffer_pool_read_requests": 10000,
+            "innodb_buffer_pool_pages_dirty": 25,
+            "innodb_buffer_pool_pages_total": 1000,
+            "innodb_row_lock_waits": 7, "innodb_row_lock_current_waits": 1,
+            "innodb_row_lock_time_avg": 12, "created_tmp_disk_tables": 5,
+            "created_tmp_tables": 200, "threads_created": 4,
+            "connections": 400, "thread_cache_size": 9}
+        self.results = {
+            "InnoDB": {"BufferPoolHitRatio": 99.5, "DirtyPagesPercent": 2.5,
+                       "RowLockWaits": 7, "RowLockCurrentWaits": 1,
+                       "RowLockTimeAvgMs": 12},
+            "TempTables": {"Created": 200, "CreatedOnDisk": 5,
+                           "PercentOnDisk": 2.5},
+            "ThreadCache": {"Size": 9, "ThreadsCreated": 4, "HitRate": 99.0}}
+
+    def test_no_values(self):
+
+        """Function:  test_no_values
+
+        Description:  Test with no values returned.
+
+        Arguments:
+
+        """
+
+        results = mysql_db_admin.ext_status({})
+
+        self.assertIsNone(results["InnoDB"]["BufferPoolHitRatio"])
+        self.assertIsNone(results["ThreadCache"]["HitRate"])
+
+    def test_ext_status(self):
+
+        """Function:  test_ext_status
+
+        Description:  Test the extended status is derived.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.ext_status(self.vals), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  fleet_doc.py
+
+    Description:  Unit testing of fleet_doc in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/fleet_doc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stream
+        test_document
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fhdr = mock.MagicMock()
+        self.fleet = {
+            "Servers": {}, "Lock": threading.Lock(), "Fhdr": self.fhdr,
+            "Stream": False, "Suppress": False}
+        self.data = {"Server": "Server_Name", "Type": "check"}
+
+    @mock.patch("mysql_db_admin.stream_line")
+    def test_stream(self, mock_line):
+
+        """Function:  test_stream
+
+        Description:  Test the document is written as a JSON line.
+
+        Arguments:
+
+        """
+
+        self.fleet["Stream"] = True
+
+        mysql_db_admin.fleet_doc(self.fleet, self.data)
+
+        mock_line.assert_called_once_with(
+            self.data, fhdr=self.fhdr, suppress=False,
+            lock=self.fleet["Lock"])
+        self.assertEqual(self.fleet["Servers"], {})
+
+    def test_document(self):
+
+        """Function:  test_document
+
+        Description:  Test the document is kept under the server name.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.fleet_doc(self.fleet, self.data)
+
+        self.assertEqual(
+            self.fleet["Servers"], {"Server_Name": self.data})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+# Classification (U)
+
+"""Program:  fleet_run.py
+
+    Description:  Unit testing of fleet_run in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/fleet_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-M": True,
+            "-F": ["mysql_cfg2", "mysql_cfg"]}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_server_error
+        test_data_out_error
+        test_stream
+        test_document
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.func_list = {"-M": "status"}
+        self.config = {"outfile": None, "mode": "w", "suppress": True}
+        self.config2 = {"outfile": "/path/file", "mode": "w",
+                        "suppress": True}
+
+    @mock.patch("mysql_db_admin.gen_libs.get_time",
+                mock.Mock(return_value="12:00:00"))
+    @mock.patch("mysql_db_admin.gen_libs.get_date",
+                mock.Mock(return_value="2026-01-01"))
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.run_server")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_server_error(self, mock_config, mock_server, mock_out):
+
+        """Function:  test_server_error
+
+        Description:  Test an error on one server is reported and the
+            results are still sent out.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config
+        mock_out.return_value = (True, None)
+        mock_server.side_effect = [ImportError("No module"), None]
+
+        self.assertFalse(mysql_db_admin.fleet_run(self.args, self.func_list))
+        self.assertEqual(
+            list(mock_out.call_args[0][0]["Servers"].values()),
+            [{"Server": mock_server.call_args_list[0][0][2],
+              "Error": "No module"}])
+
+    @mock.patch("mysql_db_admin.print", create=True)
+    @mock.patch("mysql_db_admin.gen_libs.get_time",
+                mock.Mock(return_value="12:00:00"))
+    @mock.patch("mysql_db_admin.gen_libs.get_date",
+                mock.Mock(return_value="2026-01-01"))
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(False, "Error Message")))
+    @mock.patch("mysql_db_admin.run_server", mock.Mock(return_value=None))
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_data_out_error(self, mock_config, mock_print):
+
+        """Function:  test_data_out_error
+
+        Description:  Test with data_out returning an error.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config
+
+        self.assertFalse(mysql_db_admin.fleet_run(self.args, self.func_list))
+        mock_print.assert_called_once_with(
+            "fleet_run: Error encountered: Error Message")
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.run_server")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_stream(self, mock_file, mock_config, mock_server, mock_out):
+
+        """Function:  test_stream
+
+        Description:  Test the servers stream to one shared output file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-J"] = True
+        mock_config.return_value = self.config2
+
+        self.assertFalse(mysql_db_admin.fleet_run(self.args, self.func_list))
+        mock_file.assert_called_once_with("/path/file", "w", encoding="UTF-8")
+        mock_file().close.assert_called_once()
+        self.assertEqual(
+            mock_server.call_args[1]["fleet"]["Fhdr"], mock_file())
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_db_admin.gen_libs.get_time",
+                mock.Mock(return_value="12:00:00"))
+    @mock.patch("mysql_db_admin.gen_libs.get_date",
+                mock.Mock(return_value="2026-01-01"))
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.run_server")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_document(self, mock_config, mock_server, mock_out):
+
+        """Function:  test_document
+
+        Description:  Test each server is run once and the results are sent
+            out as one document.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config
+        mock_out.return_value = (True, None)
+
+        self.assertFalse(mysql_db_admin.fleet_run(self.args, self.func_list))
+        self.assertEqual(
+            sorted(item[0][2] for item in mock_server.call_args_list),
+            ["mysql_cfg", "mysql_cfg2"])
+        self.assertEqual(mock_out.call_args[0][0]["Type"], "fleet")
+        self.assertEqual(mock_out.call_args[0][0]["Servers"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
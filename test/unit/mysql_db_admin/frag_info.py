@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  frag_info.py
+
+    Description:  Unit testing of frag_info in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/frag_info.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_data_length
+        test_fragmentation
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tbl_info = {"DATA_LENGTH": 1000, "DATA_FREE": 250}
+        self.tbl_info2 = {"DATA_LENGTH": 0, "DATA_FREE": None}
+        self.results = {
+            "DataFree": 250, "DataLength": 1000, "PercentFree": 25.0}
+        self.results2 = {"DataFree": 0, "DataLength": 0, "PercentFree": 0.0}
+
+    def test_no_data_length(self):
+
+        """Function:  test_no_data_length
+
+        Description:  Test with no data length.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.frag_info(self.tbl_info2), self.results2)
+
+    def test_fragmentation(self):
+
+        """Function:  test_fragmentation
+
+        Description:  Test with free space and data length.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.frag_info(self.tbl_info), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
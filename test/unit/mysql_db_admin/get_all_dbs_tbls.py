@@ -17,7 +17,6 @@
 import sys
 import os
 import unittest
-import mock
 
 # Local
 sys.path.append(os.getcwd())
@@ -35,6 +34,7 @@ class Server():                                         # pylint:disable=R0903
 
     Methods:
         __init__
+        col_sql
 
     """
 
@@ -48,6 +48,25 @@ class Server():                                         # pylint:disable=R0903
 
         """
 
+        self.cmd = None
+        self.params = None
+        self.data = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
 
 class UnitTest(unittest.TestCase):
 
@@ -57,6 +76,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_patterns
+        test_tbl_list
+        test_single_query
+        test_empty_db_list
+        test_db_no_tables
         test_multiple_dbs
         test_one_db
 
@@ -76,15 +100,109 @@ class UnitTest(unittest.TestCase):
         self.dict_key = "TABLE_NAME"
         self.db_list = ["db1"]
         self.db_list2 = ["db1", "db2"]
-        self.tbl_dict = [{"TABLE_NAME": "t2"}]
-        self.tbl_dict2 = [{"TABLE_NAME": "t1"}, {"TABLE_NAME": "t2"}]
+        self.tbl1 = {"TABLE_SCHEMA": "db1", "TABLE_NAME": "t2"}
+        self.tbl2 = {"TABLE_SCHEMA": "db2", "TABLE_NAME": "t1"}
+        self.tbl3 = {"TABLE_SCHEMA": "db2", "TABLE_NAME": "t2"}
+        self.tbl_dict = [self.tbl1]
+        self.tbl_dict2 = [self.tbl1, self.tbl2, self.tbl3]
+        self.results = {"db1": {"t2": self.tbl1}}
+        self.results2 = {
+            "db1": {"t2": self.tbl1},
+            "db2": {"t1": self.tbl2, "t2": self.tbl3}}
+        self.results3 = {"db1": {"t2": self.tbl1}, "db2": {}}
+        self.results4 = {}
+        self.params = ("BASE TABLE", "db1", "db2")
         self.tbl_list = ["t2"]
-        self.tbl_list2 = ["t1", "t2"]
-        self.results = {"db1": ["t2"]}
-        self.results2 = {"db1": ["t2"], "db2": ["t1", "t2"]}
+        self.params2 = ("BASE TABLE", "db1", "t2")
+        self.params3 = ("BASE TABLE", "app_%", "app_2", "tmp%")
+
+    def test_patterns(self):
+
+        """Function:  test_patterns
+
+        Description:  Test with patterns and excludes.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.tbl_dict
+
+        self.assertEqual(
+            mysql_db_admin.get_all_dbs_tbls(
+                self.server, ["app_%"], self.dict_key, db_excl=["app_2"],
+                tbl_excl=["tmp*"]), self.results)
+        self.assertEqual(self.server.params, self.params3)
+        self.assertIn("TABLE_SCHEMA like %s", self.server.cmd)
+        self.assertIn("TABLE_NAME not like %s", self.server.cmd)
+
+    def test_tbl_list(self):
+
+        """Function:  test_tbl_list
+
+        Description:  Test with a list of table names to look up.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.tbl_dict
+
+        self.assertEqual(
+            mysql_db_admin.get_all_dbs_tbls(
+                self.server, self.db_list, self.dict_key,
+                tbl_list=self.tbl_list), self.results)
+        self.assertEqual(self.server.params, self.params2)
+        self.assertIn("TABLE_NAME in (%s)", self.server.cmd)
+
+    def test_single_query(self):
+
+        """Function:  test_single_query
+
+        Description:  Test all databases are fetched in one query.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.tbl_dict2
+        mysql_db_admin.get_all_dbs_tbls(
+            self.server, self.db_list2, self.dict_key)
+
+        self.assertEqual(self.server.params, self.params)
+
+    def test_empty_db_list(self):
+
+        """Function:  test_empty_db_list
+
+        Description:  Test with empty database list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.get_all_dbs_tbls(self.server, [], self.dict_key),
+            self.results4)
+        self.assertIsNone(self.server.cmd)
+
+    def test_db_no_tables(self):
+
+        """Function:  test_db_no_tables
+
+        Description:  Test with a database that has no tables.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.tbl_dict
+
+        self.assertEqual(
+            mysql_db_admin.get_all_dbs_tbls(
+                self.server, self.db_list2, self.dict_key), self.results3)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
-    def test_multiple_dbs(self, mock_fetch):
+    def test_multiple_dbs(self):
 
         """Function:  test_multiple_dbs
 
@@ -94,14 +212,13 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_fetch.side_effect = [self.tbl_dict, self.tbl_dict2]
+        self.server.data = self.tbl_dict2
 
         self.assertEqual(
             mysql_db_admin.get_all_dbs_tbls(
                 self.server, self.db_list2, self.dict_key), self.results2)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
-    def test_one_db(self, mock_fetch):
+    def test_one_db(self):
 
         """Function:  test_one_db
 
@@ -111,7 +228,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_fetch.return_value = self.tbl_dict
+        self.server.data = self.tbl_dict
 
         self.assertEqual(
             mysql_db_admin.get_all_dbs_tbls(
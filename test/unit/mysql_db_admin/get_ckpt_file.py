@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  get_ckpt_file.py
+
+    Description:  Unit testing of get_ckpt_file in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/get_ckpt_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-P": "/dir"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_flavor_id
+        test_no_flavor_id
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.results = "/dir/mysql_db_admin_check.ckpt"
+        self.results2 = "/dir/mysql_db_admin_flavor_check.ckpt"
+
+    def test_flavor_id(self):
+
+        """Function:  test_flavor_id
+
+        Description:  Test with -y option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-y"] = "flavor"
+
+        self.assertEqual(
+            mysql_db_admin.get_ckpt_file(self.args, "check"), self.results2)
+
+    def test_no_flavor_id(self):
+
+        """Function:  test_no_flavor_id
+
+        Description:  Test with no -y option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.get_ckpt_file(self.args, "check"), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,6 +97,13 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_cache_all
+        test_cache_dbs
+        test_cache_tbl
+        test_missing_tbl
+        test_excludes
+        test_db_pattern
+        test_tbl_lookup
         test_812
         test_81
         test_802
@@ -134,17 +141,174 @@ class UnitTest(unittest.TestCase):
         self.db_list5 = ["db1", "db2"]
         self.tbl_list = ["t2"]
         self.tbl_list2 = ["t1", "t2"]
-        self.tbl_dict = [{"TABLE_NAME": "t2"}]
-        self.tbl_dict2 = [{"TABLE_NAME": "t1"}, {"TABLE_NAME": "t2"}]
-        self.all_tbls = {"db1": ["t2"]}
-        self.all_tbls2 = {"db1": ["t2"], "db2": ["t1"]}
+        self.tbl_dict2 = {"db1": {"t1": {}, "t2": {}}}
+        self.all_tbls = {"db1": {"t2": {}}}
+        self.all_tbls2 = {"db1": {"t2": {}}, "db2": {"t1": {}}}
         self.sys_dbs = ["systemdb"]
-        self.results = {"db1": ["t2"]}
-        self.results2 = {"db1": ["t2"], "db2": ["t1"]}
+        self.results = {"db1": {"t2": {}}}
+        self.results2 = {"db1": {"t2": {}}, "db2": {"t1": {}}}
         self.results3 = {}
-        self.results4 = {"db1": ["t1", "t2"]}
+        self.results4 = {"db1": {"t1": {}, "t2": {}}}
+        self.tbl_list3 = ["t2", "t9"]
+        self.cache = {
+            "Databases": ["db1", "systemdb"],
+            "Tables": {"db1": {"t1": {}, "t2": {}}, "systemdb": {"t3": {}}}}
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
+    @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    @mock.patch("mysql_db_admin.load_cache")
+    def test_cache_all(self, mock_cache, mock_all, mock_fetch):
+
+        """Function:  test_cache_all
+
+        Description:  Test all databases from the schema cache.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "/dir/path"
+
+        mock_cache.return_value = self.cache
+
+        self.assertEqual(
+            mysql_db_admin.get_db_tbl(
+                self.server, self.args, self.db_list, sys_dbs=self.sys_dbs),
+            self.results4)
+        mock_all.assert_not_called()
+        mock_fetch.assert_not_called()
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    @mock.patch("mysql_db_admin.load_cache")
+    def test_cache_dbs(self, mock_cache, mock_all):
+
+        """Function:  test_cache_dbs
+
+        Description:  Test with databases from the schema cache.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "/dir/path"
+
+        mock_cache.return_value = self.cache
+
+        self.assertEqual(
+            mysql_db_admin.get_db_tbl(
+                self.server, self.args, self.db_list5, sys_dbs=self.sys_dbs),
+            {"db1": {"t1": {}, "t2": {}}, "db2": {}})
+        mock_all.assert_not_called()
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    @mock.patch("mysql_db_admin.load_cache")
+    def test_cache_tbl(self, mock_cache, mock_all):
+
+        """Function:  test_cache_tbl
+
+        Description:  Test with tables from the schema cache.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "/dir/path"
+        self.args.args_array["-t"] = self.tbl_list3
+
+        mock_cache.return_value = self.cache
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_db_admin.get_db_tbl(
+                    self.server, self.args, self.db_list2,
+                    sys_dbs=self.sys_dbs), self.results)
+        mock_all.assert_not_called()
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    def test_missing_tbl(self, mock_fetch):
+
+        """Function:  test_missing_tbl
+
+        Description:  Test with a named table that is not found.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = self.tbl_list3
+
+        mock_fetch.return_value = self.all_tbls
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_db_admin.get_db_tbl(
+                    self.server, self.args, self.db_list2,
+                    sys_dbs=self.sys_dbs), self.results)
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    def test_excludes(self, mock_fetch):
+
+        """Function:  test_excludes
+
+        Description:  Test the -X and -Z options are passed as excludes.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-X"] = ["tmp_%"]
+        self.args.args_array["-Z"] = ["bak_*"]
+
+        mock_fetch.return_value = self.all_tbls2
+        mysql_db_admin.get_db_tbl(
+            self.server, self.args, self.db_list5, sys_dbs=self.sys_dbs)
+
+        mock_fetch.assert_called_once_with(
+            self.server, self.db_list5, "TABLE_NAME",
+            db_excl=["systemdb", "tmp_%"], tbl_excl=["bak_*"])
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    def test_db_pattern(self, mock_fetch):
+
+        """Function:  test_db_pattern
+
+        Description:  Test with a database pattern and the -t option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = self.tbl_list
+
+        mock_fetch.return_value = self.all_tbls2
+
+        self.assertEqual(
+            mysql_db_admin.get_db_tbl(
+                self.server, self.args, ["db%"], sys_dbs=self.sys_dbs),
+            self.results2)
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    def test_tbl_lookup(self, mock_fetch):
+
+        """Function:  test_tbl_lookup
+
+        Description:  Test the named tables are looked up.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = self.tbl_list2
+
+        mock_fetch.return_value = self.tbl_dict2
+        mysql_db_admin.get_db_tbl(
+            self.server, self.args, self.db_list2, sys_dbs=self.sys_dbs)
+
+        mock_fetch.assert_called_once_with(
+            self.server, self.db_list2, "TABLE_NAME",
+            tbl_list=self.tbl_list2, db_excl=self.sys_dbs, tbl_excl=[])
+
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
     def test_812(self, mock_fetch):
 
         """Function:  test_812
@@ -164,7 +328,7 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.db_list2, sys_dbs=self.sys_dbs),
             self.results4)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
     def test_81(self, mock_fetch):
 
         """Function:  test_81
@@ -184,7 +348,7 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.db_list2, sys_dbs=self.sys_dbs),
             self.results)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
     def test_802(self, mock_fetch):
 
         """Function:  test_802
@@ -204,7 +368,7 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.db_list2, sys_dbs=self.sys_dbs),
             self.results4)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
     def test_80(self, mock_fetch):
 
         """Function:  test_80
@@ -224,7 +388,7 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.db_list2, sys_dbs=self.sys_dbs),
             self.results)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
     def test_with_db_tbl2(self, mock_fetch):
 
         """Function:  test_with_db_tbl2
@@ -244,7 +408,7 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.db_list2, sys_dbs=self.sys_dbs),
             self.results4)
 
-    @mock.patch("mysql_db_admin.mysql_libs.fetch_tbl_dict")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
     def test_with_db_tbl(self, mock_fetch):
 
         """Function:  test_with_db_tbl
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  get_lag.py
+
+    Description:  Unit testing of get_lag in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/get_lag.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.rows = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        return self.rows if cmd else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiple_channels
+        test_replication_stopped
+        test_not_replica
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.replica = Server()
+
+    def test_multiple_channels(self):
+
+        """Function:  test_multiple_channels
+
+        Description:  Test the highest lag of all channels is returned.
+
+        Arguments:
+
+        """
+
+        self.replica.rows = [{"Seconds_Behind_Source": 5},
+                             {"Seconds_Behind_Source": None},
+                             {"Seconds_Behind_Source": 42}]
+
+        self.assertEqual(mysql_db_admin.get_lag(self.replica), 42)
+
+    def test_replication_stopped(self):
+
+        """Function:  test_replication_stopped
+
+        Description:  Test with replication stopped.
+
+        Arguments:
+
+        """
+
+        self.replica.rows = [{"Seconds_Behind_Source": None}]
+
+        self.assertIsNone(mysql_db_admin.get_lag(self.replica))
+
+    def test_not_replica(self):
+
+        """Function:  test_not_replica
+
+        Description:  Test with a server that is not a replica.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.get_lag(self.replica))
+
+
+if __name__ == "__main__":
+    unittest.main()
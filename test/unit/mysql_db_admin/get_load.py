@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  get_load.py
+
+    Description:  Unit testing of get_load in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/get_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.params = None
+        self.rows = [
+            {"Variable_name": "Threads_running", "Value": "12"},
+            {"Variable_name": "Innodb_row_lock_current_waits", "Value": "0"}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.rows
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_system_variables
+        test_get_load
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.names = {"Threads_running": 10,
+                      "Innodb_row_lock_current_waits": 4}
+        self.results = {"threads_running": 12,
+                        "innodb_row_lock_current_waits": 0}
+
+    def test_system_variables(self):
+
+        """Function:  test_system_variables
+
+        Description:  Test the system variables are fetched in the same
+            query.
+
+        Arguments:
+
+        """
+
+        self.server.rows.append(
+            {"Variable_name": "thread_cache_size", "Value": "9"})
+
+        self.assertEqual(
+            mysql_db_admin.get_load(
+                self.server, ["Threads_running"], ["thread_cache_size"])[
+                    "thread_cache_size"], 9)
+        self.assertEqual(
+            self.server.params, ["Threads_running", "thread_cache_size"])
+        self.assertIn("union all", self.server.cmd)
+
+    def test_get_load(self):
+
+        """Function:  test_get_load
+
+        Description:  Test the status values are returned by lowercase name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.get_load(self.server, self.names), self.results)
+        self.assertEqual(
+            self.server.params,
+            ["Threads_running", "Innodb_row_lock_current_waits"])
+        self.assertTrue(self.server.cmd.endswith("in (%s, %s)"))
+        self.assertNotIn("union", self.server.cmd)
+
+
+if __name__ == "__main__":
+    unittest.main()
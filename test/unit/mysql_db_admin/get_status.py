@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  get_status.py
+
+    Description:  Unit testing of get_status in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/get_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        upd_srv_stat
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cur_mem_mb = "cur_mem_mb"
+        self.max_mem_mb = "max_mem_mb"
+        self.prct_mem = "prct_mem"
+        self.days_up = "days_up"
+        self.cur_conn = "cur_conn"
+        self.max_conn = "max_conn"
+        self.prct_conn = "prct_conn"
+
+    def upd_srv_stat(self):
+
+        """Method:  upd_srv_stat
+
+        Description:  Stub method holder for mysql_class.Server.upd_srv_stat.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_get_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.template = {"Server": "ServerName"}
+        self.results = {
+            "Server": "ServerName", "Type": "status",
+            "Memory": {"CurrentUsage": "cur_mem_mb",
+                       "MaxUsage": "max_mem_mb", "PercentUsed": "prct_mem"},
+            "UpTime": "days_up",
+            "Connections": {"CurrentConnected": "cur_conn",
+                            "MaxConnections": "max_conn",
+                            "PercentUsed": "prct_conn"}}
+        self.vals = {"innodb_buffer_pool_read_requests": 1000,
+                     "innodb_buffer_pool_reads": 10}
+
+    @mock.patch("mysql_db_admin.get_load")
+    @mock.patch("mysql_db_admin.get_json_template")
+    def test_get_status(self, mock_template, mock_load):
+
+        """Function:  test_get_status
+
+        Description:  Test the status document.
+
+        Arguments:
+
+        """
+
+        mock_template.return_value = self.template
+        mock_load.return_value = self.vals
+        results = mysql_db_admin.get_status(self.server)
+
+        self.assertEqual(results["InnoDB"]["BufferPoolHitRatio"], 99.0)
+        del results["InnoDB"], results["TempTables"], results["ThreadCache"]
+        self.assertEqual(results, self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
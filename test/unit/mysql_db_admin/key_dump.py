@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  key_dump.py
+
+    Description:  Unit testing of key_dump in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/key_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import decimal
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_restored
+        test_typed_keys
+        test_plain_keys
+        test_no_key
+
+    """
+
+    def test_not_restored(self):
+
+        """Function:  test_not_restored
+
+        Description:  Test with a key type that cannot be restored.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(TypeError):
+            mysql_db_admin.key_dump([{"a", "b"}])
+
+    def test_typed_keys(self):
+
+        """Function:  test_typed_keys
+
+        Description:  Test the binary, date, time and decimal keys are
+            tagged.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_dump([
+                b"\x00\xff", bytearray(b"\x01"),
+                datetime.datetime(2026, 1, 2, 3, 4, 5),
+                datetime.date(2026, 1, 2), datetime.timedelta(seconds=90),
+                decimal.Decimal("1.50")]),
+            [{"Hex": "00ff"}, {"Hex": "01"},
+             {"Datetime": "2026-01-02T03:04:05"}, {"Date": "2026-01-02"},
+             {"Time": 90.0}, {"Decimal": "1.50"}])
+
+    def test_plain_keys(self):
+
+        """Function:  test_plain_keys
+
+        Description:  Test the JSON key types are kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_dump([1, "abc", 1.5, None]),
+            [1, "abc", 1.5, None])
+
+    def test_no_key(self):
+
+        """Function:  test_no_key
+
+        Description:  Test with no key.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.key_dump(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
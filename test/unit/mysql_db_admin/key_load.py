@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  key_load.py
+
+    Description:  Unit testing of key_load in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/key_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import decimal
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_round_trip
+        test_typed_keys
+        test_plain_keys
+        test_no_key
+
+    """
+
+    def test_round_trip(self):
+
+        """Function:  test_round_trip
+
+        Description:  Test the keys are restored from their dumped form.
+
+        Arguments:
+
+        """
+
+        vals = [b"\x00\xff", datetime.datetime(2026, 1, 2, 3, 4, 5, 6),
+                decimal.Decimal("-0.001"), 7, "abc"]
+
+        self.assertEqual(
+            mysql_db_admin.key_load(mysql_db_admin.key_dump(vals)), vals)
+
+    def test_typed_keys(self):
+
+        """Function:  test_typed_keys
+
+        Description:  Test the tagged keys are restored to their types.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_load([
+                {"Hex": "00ff"}, {"Datetime": "2026-01-02T03:04:05"},
+                {"Date": "2026-01-02"}, {"Time": 90.0},
+                {"Decimal": "1.50"}]),
+            [b"\x00\xff", datetime.datetime(2026, 1, 2, 3, 4, 5),
+             datetime.date(2026, 1, 2), datetime.timedelta(seconds=90),
+             decimal.Decimal("1.50")])
+
+    def test_plain_keys(self):
+
+        """Function:  test_plain_keys
+
+        Description:  Test the JSON key types are kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_load([1, "abc", None]), [1, "abc", None])
+
+    def test_no_key(self):
+
+        """Function:  test_no_key
+
+        Description:  Test with no key.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.key_load(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  key_range.py
+
+    Description:  Unit testing of key_range in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/key_range.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_bounds
+        test_composite_key
+        test_key_range
+
+    """
+
+    def test_no_bounds(self):
+
+        """Function:  test_no_bounds
+
+        Description:  Test with no lower or upper primary key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_range(["id"], None, None), ("", []))
+
+    def test_composite_key(self):
+
+        """Function:  test_composite_key
+
+        Description:  Test with a composite primary key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_range(["a", "b"], [1, 2], None),
+            (" where (`a`, `b`) > (%s, %s)", [1, 2]))
+
+    def test_key_range(self):
+
+        """Function:  test_key_range
+
+        Description:  Test with a lower and upper primary key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_range(["id"], [10], [20]),
+            (" where (`id`) > (%s) and (`id`) <= (%s)", [10, 20]))
+
+
+if __name__ == "__main__":
+    unittest.main()
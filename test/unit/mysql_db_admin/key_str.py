@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  key_str.py
+
+    Description:  Unit testing of key_str in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/key_str.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import decimal
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_typed_keys
+        test_plain_keys
+        test_no_key
+
+    """
+
+    def test_typed_keys(self):
+
+        """Function:  test_typed_keys
+
+        Description:  Test the binary, date and decimal keys are converted to
+            strings.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_str([
+                b"\x00\xff", datetime.datetime(2026, 1, 2, 3, 4, 5),
+                decimal.Decimal("1.50")]),
+            ["00ff", "2026-01-02 03:04:05", "1.50"])
+
+    def test_plain_keys(self):
+
+        """Function:  test_plain_keys
+
+        Description:  Test the JSON key types are kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.key_str([1, "abc", None]), [1, "abc", None])
+
+    def test_no_key(self):
+
+        """Function:  test_no_key
+
+        Description:  Test with no key.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.key_str(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
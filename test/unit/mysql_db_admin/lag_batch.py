@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  lag_batch.py
+
+    Description:  Unit testing of lag_batch in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/lag_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def batch_func(server, batch):
+
+    """Function:  batch_func
+
+    Description:  Function stub holder for a batch function.
+
+    Arguments:
+
+    """
+
+    return [{"TableName": tbl, "Server": server} for _, tbl in batch]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timed_out
+        test_lag_batch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.batch = [("db1", "t1")]
+        self.lag = {"Replicas": [], "Max": 30, "Unprocessed": [],
+                    "Lock": threading.Lock()}
+        self.results = [{"TableName": "t1", "Server": "Server"}]
+
+    @mock.patch("mysql_db_admin.lag_wait", mock.Mock(return_value=False))
+    def test_timed_out(self):
+
+        """Function:  test_timed_out
+
+        Description:  Test the batch is not started after the wait timed
+            out.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_db_admin.lag_batch(
+                self.server, self.batch, batch_func, self.lag))
+        self.assertEqual(
+            self.lag["Unprocessed"], [{"Database": "db1", "TableName": "t1"}])
+
+    @mock.patch("mysql_db_admin.lag_wait")
+    def test_lag_batch(self, mock_wait):
+
+        """Function:  test_lag_batch
+
+        Description:  Test waiting for the replication lag before the batch.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = True
+
+        self.assertEqual(
+            mysql_db_admin.lag_batch(
+                self.server, self.batch, batch_func, self.lag), self.results)
+        mock_wait.assert_called_once_with(self.lag)
+
+
+if __name__ == "__main__":
+    unittest.main()
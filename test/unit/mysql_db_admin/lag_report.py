@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  lag_report.py
+
+    Description:  Unit testing of lag_report in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/lag_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lag_report
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lag = {"Replicas": [], "Max": 30, "Waits": 2,
+                    "WaitSecs": 12.34567, "TimedOut": True,
+                    "Unprocessed": [{"Database": "db1", "TableName": "t1"}]}
+        self.results = {"MaxLag": 30, "Waits": 2, "WaitSecs": 12.346,
+                        "TimedOut": True, "Unprocessed": [
+                            {"Database": "db1", "TableName": "t1"}]}
+
+    def test_lag_report(self):
+
+        """Function:  test_lag_report
+
+        Description:  Test the replica wait report.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.lag_report(self.lag), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
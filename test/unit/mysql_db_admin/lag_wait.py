@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  lag_wait.py
+
+    Description:  Unit testing of lag_wait in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/lag_wait.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timed_out
+        test_timeout
+        test_lagging
+        test_not_lagging
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lag = {"Replicas": ["Replica1", "Replica2"], "Max": 30,
+                    "Waits": 0, "WaitSecs": 0.0, "TimedOut": False,
+                    "Unprocessed": [], "Lock": threading.Lock()}
+
+    @mock.patch("mysql_db_admin.get_lag")
+    def test_timed_out(self, mock_lag):
+
+        """Function:  test_timed_out
+
+        Description:  Test with the lag check already timed out.
+
+        Arguments:
+
+        """
+
+        self.lag["TimedOut"] = True
+
+        self.assertFalse(mysql_db_admin.lag_wait(self.lag))
+        mock_lag.assert_not_called()
+
+    @mock.patch("mysql_db_admin.time.monotonic")
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_lag")
+    def test_timeout(self, mock_lag, mock_sleep, mock_time):
+
+        """Function:  test_timeout
+
+        Description:  Test the wait times out while the lag stays above the
+            threshold.
+
+        Arguments:
+
+        """
+
+        mock_lag.return_value = 60
+        mock_time.side_effect = [100.0, 100.0, 1900.0, 1900.0]
+
+        self.assertFalse(mysql_db_admin.lag_wait(self.lag))
+        mock_sleep.assert_called_once_with(5)
+        self.assertEqual(
+            (self.lag["TimedOut"], self.lag["Waits"], self.lag["WaitSecs"]),
+            (True, 1, 1800.0))
+
+    @mock.patch("mysql_db_admin.time.monotonic")
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_lag")
+    def test_lagging(self, mock_lag, mock_sleep, mock_time):
+
+        """Function:  test_lagging
+
+        Description:  Test waiting until the lag is below the threshold.
+
+        Arguments:
+
+        """
+
+        mock_lag.side_effect = [5, 60, 0, 10]
+        mock_time.side_effect = [100.0, 100.0, 105.5]
+
+        self.assertTrue(mysql_db_admin.lag_wait(self.lag))
+        mock_sleep.assert_called_once_with(5)
+        self.assertEqual((self.lag["Waits"], self.lag["WaitSecs"]), (1, 5.5))
+
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_lag")
+    def test_not_lagging(self, mock_lag, mock_sleep):
+
+        """Function:  test_not_lagging
+
+        Description:  Test with the lag below the threshold or replication
+            stopped.
+
+        Arguments:
+
+        """
+
+        mock_lag.side_effect = [5, None]
+
+        self.assertTrue(mysql_db_admin.lag_wait(self.lag))
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.lag["Waits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Classification (U)
+
+"""Program:  like_match.py
+
+    Description:  Unit testing of like_match in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/like_match.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_special_chars
+        test_single_char
+        test_pattern_no_match
+        test_pattern
+        test_exact_underscore
+        test_exact
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "app_db"
+
+    def test_special_chars(self):
+
+        """Function:  test_special_chars
+
+        Description:  Test regex characters are literal.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_db_admin.like_match("appXdb", "app.d*"))
+
+    def test_single_char(self):
+
+        """Function:  test_single_char
+
+        Description:  Test the single character wildcard.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_db_admin.like_match("appXdb", "app_d%"))
+
+    def test_pattern_no_match(self):
+
+        """Function:  test_pattern_no_match
+
+        Description:  Test with a pattern that does not match.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_db_admin.like_match("db1", "app_%"))
+
+    def test_pattern(self):
+
+        """Function:  test_pattern
+
+        Description:  Test with a matching pattern.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_db_admin.like_match(self.name, "app*"))
+
+    def test_exact_underscore(self):
+
+        """Function:  test_exact_underscore
+
+        Description:  Test an underscore in an exact name is literal.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_db_admin.like_match("appXdb", self.name))
+
+    def test_exact(self):
+
+        """Function:  test_exact
+
+        Description:  Test with an exact name.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_db_admin.like_match(self.name, self.name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  like_pattern.py
+
+    Description:  Unit testing of like_pattern in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/like_pattern.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_like
+        test_glob
+        test_underscore
+        test_exact
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "app_db"
+
+    def test_like(self):
+
+        """Function:  test_like
+
+        Description:  Test with a LIKE pattern.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.like_pattern("app_%"), "app_%")
+
+    def test_glob(self):
+
+        """Function:  test_glob
+
+        Description:  Test with a glob pattern.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.like_pattern("app*_?"), "app%__")
+
+    def test_underscore(self):
+
+        """Function:  test_underscore
+
+        Description:  Test an underscore is not a pattern.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.like_pattern(self.name))
+
+    def test_exact(self):
+
+        """Function:  test_exact
+
+        Description:  Test with an exact name.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.like_pattern("db1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -86,6 +86,8 @@ class Server():                                         # pylint:disable=R0903
 
         """
 
+        self.name = "Server_Name"
+
 
 class UnitTest(unittest.TestCase):
 
@@ -95,6 +97,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_cache
+        test_fleet
         test_all_dbs
         test_user_dbs
 
@@ -116,6 +120,53 @@ class UnitTest(unittest.TestCase):
                         "information_schema", "mysql", "sys"]
         self.sys_dbs = ["performance_schema", "information_schema", "mysql",
                         "sys"]
+        self.fleet = {"Stream": False}
+
+    @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict")
+    @mock.patch("mysql_db_admin.load_cache")
+    def test_cache(self, mock_cache, mock_fetch):
+
+        """Function:  test_cache
+
+        Description:  Test with databases from the schema cache.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "/dir/path"
+
+        mock_cache.return_value = {"Databases": self.db_list}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_db_admin.listdbs(
+                    self.server, self.args, sys_dbs=self.sys_dbs))
+        mock_fetch.assert_not_called()
+
+    @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.fleet_doc")
+    @mock.patch("mysql_db_admin.gen_libs.dict_2_list")
+    def test_fleet(self, mock_list, mock_fleet):
+
+        """Function:  test_fleet
+
+        Description:  Test the user databases are handed to the fleet.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.db_list
+
+        self.assertFalse(
+            mysql_db_admin.listdbs(
+                self.server, self.args, sys_dbs=self.sys_dbs,
+                fleet=self.fleet))
+        mock_fleet.assert_called_once_with(
+            self.fleet,
+            {"Server": "Server_Name", "Databases": ["db1", "db2"]})
 
     @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
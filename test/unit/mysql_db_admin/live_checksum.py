@@ -0,0 +1,84 @@
+# Classification (U)
+
+"""Program:  live_checksum.py
+
+    Description:  Unit testing of live_checksum in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/live_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_create_options
+        test_other_options
+        test_live_checksum
+
+    """
+
+    def test_no_create_options(self):
+
+        """Function:  test_no_create_options
+
+        Description:  Test with no create options.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_db_admin.live_checksum({"CREATE_OPTIONS": None}))
+
+    def test_other_options(self):
+
+        """Function:  test_other_options
+
+        Description:  Test with create options without a live checksum.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_db_admin.live_checksum(
+                {"CREATE_OPTIONS": "row_format=DYNAMIC"}))
+
+    def test_live_checksum(self):
+
+        """Function:  test_live_checksum
+
+        Description:  Test with a table keeping a live checksum.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_db_admin.live_checksum({"CREATE_OPTIONS": "CHECKSUM=1"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+# Classification (U)
+
+"""Program:  load_cache.py
+
+    Description:  Unit testing of load_cache in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/load_cache.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-a": "/dir/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cache
+        test_ttl
+        test_expired
+        test_probe_changed
+        test_valid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.probe = {"Databases": 2, "Tables": 1, "CreateTime": "None"}
+        self.probe2 = {"Databases": 3, "Tables": 1, "CreateTime": "None"}
+        self.db_list = ["db1", "mysql"]
+        self.tables = {"db1": {"t1": {}}, "mysql": {}}
+        self.cache = {
+            "AsOf": 1000, "Probe": self.probe, "Databases": self.db_list,
+            "Tables": self.tables}
+        self.cache_file = "/dir/path/ServerName_schema.json"
+
+    @mock.patch("mysql_db_admin.save_state")
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.gen_libs.dict_2_list")
+    @mock.patch("mysql_db_admin.schema_probe")
+    @mock.patch("mysql_db_admin.load_state")
+    def test_no_cache(                                  # pylint:disable=R0913
+            self, mock_load, mock_probe, mock_list, mock_tbls, mock_save):
+
+        """Function:  test_no_cache
+
+        Description:  Test with no cache file.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = {}
+        mock_probe.return_value = self.probe
+        mock_list.return_value = self.db_list
+        mock_tbls.return_value = self.tables
+
+        cache = mysql_db_admin.load_cache(self.server, self.args)
+
+        self.assertEqual(cache["Tables"], self.tables)
+        self.assertEqual(cache["Databases"], self.db_list)
+        mock_save.assert_called_once_with(self.cache_file, cache)
+
+    @mock.patch("mysql_db_admin.time.time", mock.Mock(return_value=5000))
+    @mock.patch("mysql_db_admin.save_state")
+    @mock.patch("mysql_db_admin.schema_probe")
+    @mock.patch("mysql_db_admin.load_state")
+    def test_ttl(self, mock_load, mock_probe, mock_save):
+
+        """Function:  test_ttl
+
+        Description:  Test with the -x option time to live.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-x"] = 90
+        mock_load.return_value = self.cache
+        mock_probe.return_value = self.probe
+
+        self.assertEqual(
+            mysql_db_admin.load_cache(self.server, self.args), self.cache)
+        mock_save.assert_not_called()
+
+    @mock.patch("mysql_db_admin.time.time", mock.Mock(return_value=5000))
+    @mock.patch("mysql_db_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.gen_libs.dict_2_list")
+    @mock.patch("mysql_db_admin.schema_probe")
+    @mock.patch("mysql_db_admin.load_state")
+    def test_expired(self, mock_load, mock_probe, mock_list, mock_tbls):
+
+        """Function:  test_expired
+
+        Description:  Test with a cache past its time to live.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cache
+        mock_probe.return_value = self.probe
+        mock_list.return_value = self.db_list
+        mock_tbls.return_value = self.tables
+
+        self.assertEqual(
+            mysql_db_admin.load_cache(self.server, self.args)["AsOf"], 5000)
+
+    @mock.patch("mysql_db_admin.time.time", mock.Mock(return_value=2000))
+    @mock.patch("mysql_db_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.get_all_dbs_tbls")
+    @mock.patch("mysql_db_admin.mysql_libs.fetch_db_dict",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.gen_libs.dict_2_list")
+    @mock.patch("mysql_db_admin.schema_probe")
+    @mock.patch("mysql_db_admin.load_state")
+    def test_probe_changed(self, mock_load, mock_probe, mock_list, mock_tbls):
+
+        """Function:  test_probe_changed
+
+        Description:  Test with a schema probe that no longer matches.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cache
+        mock_probe.return_value = self.probe2
+        mock_list.return_value = self.db_list
+        mock_tbls.return_value = self.tables
+
+        self.assertEqual(
+            mysql_db_admin.load_cache(self.server, self.args)["Probe"],
+            self.probe2)
+
+    @mock.patch("mysql_db_admin.time.time", mock.Mock(return_value=2000))
+    @mock.patch("mysql_db_admin.save_state")
+    @mock.patch("mysql_db_admin.schema_probe")
+    @mock.patch("mysql_db_admin.load_state")
+    def test_valid(self, mock_load, mock_probe, mock_save):
+
+        """Function:  test_valid
+
+        Description:  Test with a valid cache.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cache
+        mock_probe.return_value = self.probe
+
+        self.assertEqual(
+            mysql_db_admin.load_cache(self.server, self.args), self.cache)
+        mock_save.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  load_chunks.py
+
+    Description:  Unit testing of load_chunks in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/load_chunks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_header_mismatch
+        test_load_chunks
+        test_no_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ckpt_file = "/dir/mysql_db_admin_chunk.ckpt"
+        self.header = {"Server": "ServerName", "Type": "chunk"}
+        self.lines = (
+            '{"Server": "ServerName", "Type": "chunk"}\n'
+            '{"Database": "db1", "TableName": "t1", "Range": [null, null],'
+            ' "Chunk": {"Lower": [{"Hex": "00ff"}], "Chunks": 1}}\n'
+            '{"Database": "db1", "TableName": "t1", "Range": [null, null],'
+            ' "Chunk": {"Lower": [{"Hex": "01ff"}], "Chunks": 2}}\n'
+            '{"Database": "db1", "TableName": "t2", "Range": [[0], [99]],'
+            ' "Chunk": {"Lower": [50], "Chunks": 3}}\n'
+            '{"Database": "db1", "TableName": "t1", "Chu')
+        self.results = {"db1": {
+            "t1": {"[null, null]": {"Lower": [b"\x01\xff"], "Chunks": 2}},
+            "t2": {"[[0], [99]]": {"Lower": [50], "Chunks": 3}}}}
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_header_mismatch(self):
+
+        """Function:  test_header_mismatch
+
+        Description:  Test with a checkpoint from a different server.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=self.lines.replace("ServerName", "Server2"))):
+            self.assertEqual(
+                mysql_db_admin.load_chunks(self.ckpt_file, self.header), {})
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_load_chunks(self):
+
+        """Function:  test_load_chunks
+
+        Description:  Test the last finished chunk of each table range is
+            loaded and a line cut short is skipped.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=self.lines)):
+            self.assertEqual(
+                mysql_db_admin.load_chunks(self.ckpt_file, self.header),
+                self.results)
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=False))
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no checkpoint file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.load_chunks(self.ckpt_file, self.header), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
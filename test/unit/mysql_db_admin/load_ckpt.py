@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  load_ckpt.py
+
+    Description:  Unit testing of load_ckpt in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/load_ckpt.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cut_short_line
+        test_header_mismatch
+        test_load_ckpt
+        test_no_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ckpt_file = "/dir/mysql_db_admin_check.ckpt"
+        self.header = {"Server": "ServerName", "Type": "check"}
+        self.lines = (
+            '{"Server": "ServerName", "Type": "check"}\n'
+            '{"Database": "db1", "Table": {"TableName": "t1"}}\n')
+        self.lines2 = (
+            '{"Server": "ServerName2", "Type": "check"}\n'
+            '{"Database": "db1", "Table": {"TableName": "t1"}}\n')
+        self.results = {"db1": {"t1": {"TableName": "t1"}}}
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_cut_short_line(self):
+
+        """Function:  test_cut_short_line
+
+        Description:  Test a line cut short by an interrupted run is skipped.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=self.lines + '{"Database": "db1", "Tab')):
+            self.assertEqual(
+                mysql_db_admin.load_ckpt(self.ckpt_file, self.header),
+                self.results)
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_header_mismatch(self):
+
+        """Function:  test_header_mismatch
+
+        Description:  Test with a checkpoint from a different server.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=self.lines2)):
+            self.assertEqual(
+                mysql_db_admin.load_ckpt(self.ckpt_file, self.header), {})
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_load_ckpt(self):
+
+        """Function:  test_load_ckpt
+
+        Description:  Test loading the finished tables.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=self.lines)):
+            self.assertEqual(
+                mysql_db_admin.load_ckpt(self.ckpt_file, self.header),
+                self.results)
+
+    @mock.patch("mysql_db_admin.os.path.isfile",
+                mock.Mock(return_value=False))
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no checkpoint file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.load_ckpt(self.ckpt_file, self.header), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  load_state.py
+
+    Description:  Unit testing of load_state in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/load_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_file
+        test_no_file
+        test_load_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state_file = "/path/state.json"
+        self.state = {"ServerName": {"db1": {"t1": {"Checksum": 1234}}}}
+
+    @mock.patch("mysql_db_admin.os.path.getsize", mock.Mock(return_value=0))
+    @mock.patch("mysql_db_admin.os.path.isfile", mock.Mock(return_value=True))
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty state file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.load_state(self.state_file), {})
+
+    @mock.patch("mysql_db_admin.os.path.isfile", mock.Mock(return_value=False))
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no state file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.load_state(self.state_file), {})
+
+    @mock.patch("mysql_db_admin.json.load")
+    @mock.patch("mysql_db_admin.os.path.getsize", mock.Mock(return_value=10))
+    @mock.patch("mysql_db_admin.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="{}")
+    def test_load_state(self, mock_file, mock_load):
+
+        """Function:  test_load_state
+
+        Description:  Test loading the state file.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.state
+
+        self.assertEqual(
+            mysql_db_admin.load_state(self.state_file), self.state)
+        mock_file.assert_called_with(self.state_file, "r", encoding="UTF-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -257,6 +257,7 @@ class UnitTest(unittest.TestCase):
         test_arg_dir_true
         test_arg_file_false
         test_arg_file_true
+        test_arg_int_false
         test_run_program
         test_programlock_true
         test_programlock_false
@@ -538,6 +539,27 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_db_admin.main())
 
+    @mock.patch("mysql_db_admin.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.gen_libs.help_func",
+                mock.Mock(return_value=False))
+    @mock.patch("mysql_db_admin.gen_class.ArgParser")
+    def test_arg_int_false(self, mock_arg):
+
+        """Function:  test_arg_int_false
+
+        Description:  Test arg_int_chk if returns false.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "abc"}
+
+        mock_arg.return_value = self.args
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_db_admin.main())
+
     @mock.patch("mysql_db_admin.run_program", mock.Mock(return_value=True))
     @mock.patch("mysql_db_admin.gen_libs.help_func",
                 mock.Mock(return_value=False))
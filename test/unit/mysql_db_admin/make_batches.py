@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  make_batches.py
+
+    Description:  Unit testing of make_batches in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/make_batches.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_large_tables
+        test_partial_batch
+        test_full_batches
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        large = {"DATA_LENGTH": mysql_db_admin.BATCH_TBL_SIZE + 1}
+        self.tasks = [("db1", "t1"), ("db1", "t2"), ("db1", "t3"),
+                      ("db1", "t4")]
+        self.order = [0, 1, 2, 3]
+        self.db_dict = {"db1": {"t1": {}, "t2": {}, "t3": {}, "t4": {}}}
+        self.db_dict2 = {
+            "db1": {"t1": large, "t2": {}, "t3": large, "t4": {}}}
+        self.results = [[0, 1], [2, 3]]
+        self.results2 = [[0, 1, 2], [3]]
+        self.results3 = [[0], [2], [1, 3]]
+
+    def test_large_tables(self):
+
+        """Function:  test_large_tables
+
+        Description:  Test large tables are not batched.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.make_batches(
+                self.tasks, self.order, self.db_dict2, 3), self.results3)
+
+    def test_partial_batch(self):
+
+        """Function:  test_partial_batch
+
+        Description:  Test with a partial last batch.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.make_batches(
+                self.tasks, self.order, self.db_dict, 3), self.results2)
+
+    def test_full_batches(self):
+
+        """Function:  test_full_batches
+
+        Description:  Test with full batches.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.make_batches(
+                self.tasks, self.order, self.db_dict, 2), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  name_filter.py
+
+    Description:  Unit testing of name_filter in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/name_filter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_excl
+        test_incl
+        test_names
+        test_none
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.col = "TABLE_SCHEMA"
+        self.where = ["(TABLE_SCHEMA in (%s, %s) or TABLE_SCHEMA like %s)"]
+        self.where2 = [
+            "TABLE_SCHEMA not in (%s)", "TABLE_SCHEMA not like %s"]
+
+    def test_excl(self):
+
+        """Function:  test_excl
+
+        Description:  Test with exclude names and patterns.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.name_filter(
+                self.col, excl=["tmp*", "mysql"]),
+            (self.where2, ["mysql", "tmp%"]))
+
+    def test_incl(self):
+
+        """Function:  test_incl
+
+        Description:  Test with include names and patterns.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.name_filter(self.col, ["db1", "app_?", "db2"]),
+            (self.where, ["db1", "db2", "app__"]))
+
+    def test_names(self):
+
+        """Function:  test_names
+
+        Description:  Test with include names.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.name_filter(self.col, ["db1"]),
+            (["(TABLE_SCHEMA in (%s))"], ["db1"]))
+
+    def test_none(self):
+
+        """Function:  test_none
+
+        Description:  Test with no names.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.name_filter(self.col), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  name_match.py
+
+    Description:  Unit testing of name_match in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/name_match.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_excluded
+        test_not_included
+        test_included
+        test_no_lists
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.incl = ["db1", "app_%"]
+        self.excl = ["app_tmp*"]
+
+    def test_excluded(self):
+
+        """Function:  test_excluded
+
+        Description:  Test with an excluded name.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_db_admin.name_match("app_tmp1", self.incl, self.excl))
+
+    def test_not_included(self):
+
+        """Function:  test_not_included
+
+        Description:  Test with a name not included.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_db_admin.name_match("db2", self.incl, self.excl))
+
+    def test_included(self):
+
+        """Function:  test_included
+
+        Description:  Test with an included name.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_db_admin.name_match("app_1", self.incl, self.excl))
+
+    def test_no_lists(self):
+
+        """Function:  test_no_lists
+
+        Description:  Test with no include or exclude lists.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_db_admin.name_match("db2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
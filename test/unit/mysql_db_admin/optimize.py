@@ -73,6 +73,7 @@ class Server():                                         # pylint:disable=R0903
 
     Methods:
         __init__
+        cmd_sql
 
     """
 
@@ -86,6 +87,20 @@ class Server():                                         # pylint:disable=R0903
 
         """
 
+        self.cmd = None
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
 
 class UnitTest(unittest.TestCase):
 
@@ -95,6 +110,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_engine_route
+        test_engine_no_downgrade
+        test_frag_threshold
         test_multiline_return
         test_data_out_error
         test_multiple_db_tbl
@@ -115,9 +133,13 @@ class UnitTest(unittest.TestCase):
 
         self.server = Server()
         self.args = ArgParser()
-        self.db_tbl = {"db1": ["tbl1"]}
-        self.db_tbl2 = {"db1": ["tbl1", "tbl2"]}
-        self.db_tbl3 = {"db1": ["tbl1", "tbl2"], "db2": ["tbl3", "tbl4"]}
+        self.db_tbl = {"db1": {"tbl1": {}}}
+        self.db_tbl2 = {"db1": {"tbl1": {}, "tbl2": {}}}
+        self.db_tbl4 = {"db1": {
+            "tbl1": {"ENGINE": "MEMORY"},
+            "tbl2": {"ENGINE": "InnoDB", "DATA_FREE": 0}}}
+        self.db_tbl3 = {
+            "db1": {"tbl1": {}, "tbl2": {}}, "db2": {"tbl3": {}, "tbl4": {}}}
         self.template = {"Server": "ServerName"}
         self.config = {"config": "value"}
         self.optimize = [{"Msg_type": "status", "Msg_text": "OK"}]
@@ -125,6 +147,100 @@ class UnitTest(unittest.TestCase):
             {"Msg_type": "status", "Msg_text": "OK"},
             {"Msg_type": "note", "Msg_text": "Message Here"}]
 
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_db_admin.mysql_libs.analyze_tbl")
+    @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_engine_route(                              # pylint:disable=R0913
+            self, mock_dbdict, mock_template, mock_config, mock_optimize,
+            mock_analyze):
+
+        """Function:  test_engine_route
+
+        Description:  Test the tables are routed on their engine with the -q
+            option and the statistics are refreshed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = True
+
+        mock_dbdict.return_value = self.db_tbl4
+        mock_template.return_value = self.template
+        mock_config.return_value = self.config
+        mock_analyze.return_value = self.optimize
+
+        self.assertFalse(mysql_db_admin.optimize(self.server, self.args))
+        mock_optimize.assert_not_called()
+        mock_analyze.assert_called_once_with(self.server, "db1", "tbl2")
+        self.assertEqual(
+            self.server.cmd,
+            "set session information_schema_stats_expiry = 0")
+
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_db_admin.mysql_libs.analyze_tbl")
+    @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_engine_no_downgrade(                       # pylint:disable=R0913
+            self, mock_dbdict, mock_template, mock_config, mock_optimize,
+            mock_analyze):
+
+        """Function:  test_engine_no_downgrade
+
+        Description:  Test InnoDB tables are rebuilt without the -q option.
+
+        Arguments:
+
+        """
+
+        mock_dbdict.return_value = self.db_tbl4
+        mock_template.return_value = self.template
+        mock_config.return_value = self.config
+        mock_optimize.return_value = self.optimize
+
+        self.assertFalse(mysql_db_admin.optimize(self.server, self.args))
+        mock_optimize.assert_called_once_with(self.server, "db1", "tbl2")
+        mock_analyze.assert_not_called()
+        self.assertIsNone(self.server.cmd)
+
+    @mock.patch("mysql_db_admin.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("mysql_db_admin.get_json_template")
+    @mock.patch("mysql_db_admin.get_db_tbl")
+    def test_frag_threshold(self, mock_dbdict, mock_template, mock_config,
+                            mock_optimize):
+
+        """Function:  test_frag_threshold
+
+        Description:  Test with fragmentation threshold skipping tables and
+            the statistics are refreshed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-g"] = "10"
+
+        mock_dbdict.return_value = self.db_tbl
+        mock_template.return_value = self.template
+        mock_config.return_value = self.config
+        mock_optimize.return_value = self.optimize
+
+        self.assertFalse(mysql_db_admin.optimize(self.server, self.args))
+        mock_optimize.assert_not_called()
+        self.assertEqual(
+            self.server.cmd,
+            "set session information_schema_stats_expiry = 0")
+
     @mock.patch("mysql_db_admin.data_out",
                 mock.Mock(return_value=(True, None)))
     @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
@@ -0,0 +1,67 @@
+# Classification (U)
+
+"""Program:  pct.py
+
+    Description:  Unit testing of pct in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/pct.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_zero_denominator
+        test_pct
+
+    """
+
+    def test_zero_denominator(self):
+
+        """Function:  test_zero_denominator
+
+        Description:  Test with a zero denominator.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.pct(5, 0))
+
+    def test_pct(self):
+
+        """Function:  test_pct
+
+        Description:  Test the percentage is rounded to two places.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.pct(1, 3), 33.33)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,363 @@
+# Classification (U)
+
+"""Program:  process_tables.py
+
+    Description:  Unit testing of process_tables in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/process_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-C": []}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+ORDER = []
+
+
+def tbl_func(server, dbn, tbl):
+
+    """Function:  tbl_func
+
+    Description:  Function stub holder for a table function.
+
+    Arguments:
+
+    """
+
+    ORDER.append((dbn, tbl))
+
+    return {"TableName": tbl, "Server": server, "Database": dbn}
+
+
+def batch_func(server, batch):
+
+    """Function:  batch_func
+
+    Description:  Function stub holder for a batch function.
+
+    Arguments:
+
+    """
+
+    return [{"TableName": tbl, "Server": server, "Batch": len(batch)}
+            for _, tbl in batch]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lag
+        test_throttle
+        test_budget
+        test_tbl_done
+        test_batch
+        test_largest_first_results
+        test_largest_first
+        test_empty_db_dict
+        test_multiple_dbs
+        test_one_db
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.db_dict = {"db1": {"t1": {}, "t2": {}}}
+        self.db_dict2 = {
+            "db1": {"t1": {}}, "db2": {}, "db3": {"t2": {}, "t3": {}}}
+        self.db_dict3 = {
+            "db1": {"t1": {"DATA_LENGTH": 10, "INDEX_LENGTH": 0}},
+            "db2": {"t2": {"DATA_LENGTH": 500, "INDEX_LENGTH": 100},
+                    "t3": {"DATA_LENGTH": 20, "INDEX_LENGTH": None}}}
+        self.order2 = [("db2", "t2"), ("db2", "t3"), ("db1", "t1")]
+        self.results = [
+            {"Database": "db1", "Tables": [
+                {"TableName": "t1", "Server": "Server", "Database": "db1"},
+                {"TableName": "t2", "Server": "Server", "Database": "db1"}]}]
+        self.results2 = [
+            {"Database": "db1", "Tables": [
+                {"TableName": "t1", "Server": "Server", "Database": "db1"}]},
+            {"Database": "db2", "Tables": []},
+            {"Database": "db3", "Tables": [
+                {"TableName": "t2", "Server": "Server", "Database": "db3"},
+                {"TableName": "t3", "Server": "Server", "Database": "db3"}]}]
+
+    @mock.patch("mysql_db_admin.lag_wait")
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_lag(self, mock_pool, mock_wait):
+
+        """Function:  test_lag
+
+        Description:  Test each batch waits for the replication lag.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, self.db_dict, tbl_func,
+                lag={"Replicas": []}), self.results)
+        self.assertEqual(mock_wait.call_count, 2)
+
+    @mock.patch("mysql_db_admin.throttle_wait")
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_throttle(self, mock_pool, mock_wait):
+
+        """Function:  test_throttle
+
+        Description:  Test each batch waits for the server load.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, self.db_dict, tbl_func,
+                throttle={"Limits": {}}), self.results)
+        self.assertEqual(mock_wait.call_count, 2)
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_budget(self, mock_pool):
+
+        """Function:  test_budget
+
+        Description:  Test tables not started within the time budget are left
+            out of the results.
+
+        Arguments:
+
+        """
+
+        budget = {"End": 0, "Bytes": 0, "Secs": 0.0, "Tables": 0,
+                  "Unprocessed": [], "Lock": threading.Lock()}
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, self.db_dict, tbl_func,
+                budget=budget), [{"Database": "db1", "Tables": []}])
+        self.assertEqual(len(budget["Unprocessed"]), 2)
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_tbl_done(self, mock_pool):
+
+        """Function:  test_tbl_done
+
+        Description:  Test with table results passed to a tbl_done function.
+
+        Arguments:
+
+        """
+
+        done = []
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, self.db_dict, tbl_func,
+                tbl_done=lambda dbn, t_data: done.append(dbn)), [])
+        self.assertEqual(done, ["db1", "db1"])
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_batch(self, mock_pool):
+
+        """Function:  test_batch
+
+        Description:  Test with tables processed in batches.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-B"] = "2"
+
+        mock_pool.return_value = [self.server]
+
+        results = mysql_db_admin.process_tables(
+            self.server, self.args, self.db_dict2, tbl_func,
+            batch_func=batch_func)
+
+        self.assertEqual(
+            [[tbl["Batch"] for tbl in item["Tables"]] for item in results],
+            [[2], [], [2, 1]])
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_largest_first_results(self, mock_pool):
+
+        """Function:  test_largest_first_results
+
+        Description:  Test results are in database dictionary order when
+            tables are processed largest first.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+
+        results = mysql_db_admin.process_tables(
+            self.server, self.args, self.db_dict3, tbl_func)
+
+        self.assertEqual(
+            [[tbl["TableName"] for tbl in item["Tables"]] for item in results],
+            [["t1"], ["t2", "t3"]])
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_largest_first(self, mock_pool):
+
+        """Function:  test_largest_first
+
+        Description:  Test tables are processed largest first.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+        del ORDER[:]
+
+        mysql_db_admin.process_tables(
+            self.server, self.args, self.db_dict3, tbl_func)
+
+        self.assertEqual(ORDER, self.order2)
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_empty_db_dict(self, mock_pool):
+
+        """Function:  test_empty_db_dict
+
+        Description:  Test with empty database dictionary.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, {}, tbl_func), [])
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_multiple_dbs(self, mock_pool):
+
+        """Function:  test_multiple_dbs
+
+        Description:  Test with multiple databases.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, self.db_dict2, tbl_func),
+            self.results2)
+
+    @mock.patch("mysql_db_admin.close_pool", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.create_pool")
+    def test_one_db(self, mock_pool):
+
+        """Function:  test_one_db
+
+        Description:  Test with one database.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = [self.server]
+
+        self.assertEqual(
+            mysql_db_admin.process_tables(
+                self.server, self.args, self.db_dict, tbl_func),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
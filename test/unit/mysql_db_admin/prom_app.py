@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  prom_app.py
+
+    Description:  Unit testing of prom_app in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/prom_app.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        start_response
+        test_not_found
+        test_metrics
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.status = None
+        self.headers = None
+
+    def start_response(self, status, headers):
+
+        """Function:  start_response
+
+        Description:  Stub holder for the WSGI start response function.
+
+        Arguments:
+
+        """
+
+        self.status = status
+        self.headers = dict(headers)
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with a path that is not the metrics.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.prom_app(
+            {"PATH_INFO": "/other"}, self.start_response, self.server)
+
+        self.assertEqual(self.status, "404 Not Found")
+
+    @mock.patch("mysql_db_admin.prom_text",
+                mock.Mock(return_value="mysql_uptime_days 3\n"))
+    @mock.patch("mysql_db_admin.get_load", mock.Mock(return_value={}))
+    @mock.patch("mysql_db_admin.get_status", mock.Mock(return_value={}))
+    def test_metrics(self):
+
+        """Function:  test_metrics
+
+        Description:  Test the metrics are served.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.prom_app(
+                {"PATH_INFO": "/metrics"}, self.start_response, self.server),
+            [b"mysql_uptime_days 3\n"])
+        self.assertEqual(self.status, "200 OK")
+        self.assertEqual(self.headers["Content-Length"], "20")
+
+
+if __name__ == "__main__":
+    unittest.main()
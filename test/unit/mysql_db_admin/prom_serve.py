@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  prom_serve.py
+
+    Description:  Unit testing of prom_serve in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/prom_serve.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-M": True, "-H": "9104"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_prom_serve
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+
+    @mock.patch("mysql_db_admin.wsgiref.simple_server.make_server")
+    def test_prom_serve(self, mock_make):
+
+        """Function:  test_prom_serve
+
+        Description:  Test serving on the local port until stopped.
+
+        Arguments:
+
+        """
+
+        mock_make.return_value.serve_forever.side_effect = KeyboardInterrupt
+
+        self.assertEqual(
+            mysql_db_admin.prom_serve(self.server, self.args), (True, None))
+        self.assertEqual(mock_make.call_args[0][:2], ("127.0.0.1", 9104))
+        mock_make.return_value.server_close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
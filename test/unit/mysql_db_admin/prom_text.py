@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  prom_text.py
+
+    Description:  Unit testing of prom_text in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/prom_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_label_escape
+        test_skip_not_number
+        test_prom_text
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.results = {
+            "Server": "ServerName", "Type": "status",
+            "Memory": {"CurrentUsage": 100, "MaxUsage": 200,
+                       "PercentUsed": 50},
+            "UpTime": 3,
+            "Connections": {"CurrentConnected": 10, "MaxConnections": 100,
+                            "PercentUsed": 10}}
+        self.counters = {"questions": 1000, "threads_running": 4}
+
+    def test_label_escape(self):
+
+        """Function:  test_label_escape
+
+        Description:  Test the server label is escaped.
+
+        Arguments:
+
+        """
+
+        self.results["Server"] = 'Server"Name'
+        text = mysql_db_admin.prom_text(self.results, self.counters)
+
+        self.assertIn('mysql_uptime_days{server="Server\\"Name"} 3', text)
+
+    def test_skip_not_number(self):
+
+        """Function:  test_skip_not_number
+
+        Description:  Test a metric that is not a number is skipped.
+
+        Arguments:
+
+        """
+
+        self.results["UpTime"] = None
+        text = mysql_db_admin.prom_text(self.results, self.counters)
+
+        self.assertNotIn("mysql_uptime_days", text)
+
+    def test_prom_text(self):
+
+        """Function:  test_prom_text
+
+        Description:  Test the metrics in Prometheus text format.
+
+        Arguments:
+
+        """
+
+        text = mysql_db_admin.prom_text(self.results, self.counters)
+
+        self.assertIn(
+            '# TYPE mysql_memory_current_mb gauge\n'
+            'mysql_memory_current_mb{server="ServerName"} 100\n', text)
+        self.assertIn(
+            '# TYPE mysql_global_status_questions counter\n'
+            'mysql_global_status_questions{server="ServerName"} 1000\n',
+            text)
+        self.assertIn(
+            '# TYPE mysql_global_status_threads_running gauge\n'
+            'mysql_global_status_threads_running{server="ServerName"} 4\n',
+            text)
+        self.assertNotIn("mysql_global_status_slow_queries", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
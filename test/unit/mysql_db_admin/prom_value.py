@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  prom_value.py
+
+    Description:  Unit testing of prom_value in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/prom_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_number
+        test_float
+        test_integer_string
+        test_integer
+
+    """
+
+    def test_not_number(self):
+
+        """Function:  test_not_number
+
+        Description:  Test with a value that is not a number.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_db_admin.prom_value(None))
+        self.assertIsNone(mysql_db_admin.prom_value("N/A"))
+
+    def test_float(self):
+
+        """Function:  test_float
+
+        Description:  Test with a float.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.prom_value(12.5), "12.5")
+
+    def test_integer_string(self):
+
+        """Function:  test_integer_string
+
+        Description:  Test with an integer string.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.prom_value("1234567890123"),
+                         "1234567890123")
+
+    def test_integer(self):
+
+        """Function:  test_integer
+
+        Description:  Test with an integer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.prom_value(42), "42")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Classification (U)
+
+"""Program:  prom_write.py
+
+    Description:  Unit testing of prom_write in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/prom_write.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_prom_write
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.prom_file = "/path/mysql.prom"
+        self.text = "mysql_uptime_days 3\n"
+
+    @mock.patch("mysql_db_admin.os.replace")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_prom_write(self, mock_file, mock_replace):
+
+        """Function:  test_prom_write
+
+        Description:  Test the metrics are written to a temporary file which
+            replaces the metrics file.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.prom_write(self.prom_file, self.text)
+
+        mock_file.assert_called_once_with(
+            "/path/mysql.prom.tmp", "w", encoding="UTF-8")
+        mock_file().write.assert_called_once_with(self.text)
+        mock_replace.assert_called_once_with(
+            "/path/mysql.prom.tmp", self.prom_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
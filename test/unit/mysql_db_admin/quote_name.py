@@ -0,0 +1,68 @@
+# Classification (U)
+
+"""Program:  quote_name.py
+
+    Description:  Unit testing of quote_name in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/quote_name.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_backtick
+        test_quote_name
+
+    """
+
+    def test_backtick(self):
+
+        """Function:  test_backtick
+
+        Description:  Test a backtick in a name is doubled.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.quote_name("t`1"), "`t``1`")
+
+    def test_quote_name(self):
+
+        """Function:  test_quote_name
+
+        Description:  Test a database and table name are quoted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.quote_name("db1", "t1"), "`db1`.`t1`")
+
+
+if __name__ == "__main__":
+    unittest.main()
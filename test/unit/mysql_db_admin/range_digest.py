@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  range_digest.py
+
+    Description:  Unit testing of range_digest in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/range_digest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cmds = []
+        self.rows = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return self.rows.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_rows
+        test_range_digest
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_rows(self):
+
+        """Function:  test_no_rows
+
+        Description:  Test with no rows in the range.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"RowCnt": 0, "Digest": None}]]
+
+        self.assertEqual(
+            mysql_db_admin.range_digest(
+                self.server, "db1", "t1", ["id"], ["id"], [10], [20]),
+            {"Rows": 0, "Digest": 0})
+
+    def test_range_digest(self):
+
+        """Function:  test_range_digest
+
+        Description:  Test the row count and digest of the range.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[{"RowCnt": 10, "Digest": 1234}]]
+
+        self.assertEqual(
+            mysql_db_admin.range_digest(
+                self.server, "db1", "t1", ["id", "a"], ["id"], [10], [20]),
+            {"Rows": 10, "Digest": 1234})
+        self.assertIn(
+            "bit_xor(crc32(concat_ws('#', `id`, `a`,"
+            " concat(isnull(`id`), isnull(`a`)))))", self.server.cmds[0][0])
+        self.assertEqual(self.server.cmds[0][1], (10, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
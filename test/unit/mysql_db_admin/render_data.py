@@ -0,0 +1,214 @@
+# Classification (U)
+
+"""Program:  render_data.py
+
+    Description:  Unit testing of render_data in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/render_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import datetime
+import pprint
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_expand_render_once
+        test_not_json_type
+        test_cached
+        test_text
+        test_expand_large
+        test_expand_indent
+        test_expand
+        test_json_indent
+        test_json
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"key": "value", "key2": ["list1", "list2"]}
+        self.buffers = {}
+        self.indent = 4
+
+    @mock.patch("mysql_db_admin.EXPAND_MAX_SIZE", 10)
+    @mock.patch("mysql_db_admin.json.dumps", wraps=json.dumps)
+    def test_expand_render_once(self, mock_dumps):
+
+        """Function:  test_expand_render_once
+
+        Description:  Test a large indented document is rendered once as
+            JSON for the json and expand formats.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.render_data(
+            self.data, "expand", self.buffers, self.indent)
+
+        self.assertEqual(
+            mysql_db_admin.render_data(
+                self.data, "json", self.buffers, self.indent),
+            self.buffers["expand"])
+        mock_dumps.assert_called_once()
+
+    def test_not_json_type(self):
+
+        """Function:  test_not_json_type
+
+        Description:  Test the values that are not JSON types are rendered
+            as strings.
+
+        Arguments:
+
+        """
+
+        data = {"key": datetime.datetime(2026, 1, 2)}
+
+        self.assertEqual(
+            mysql_db_admin.render_data(data, "json", self.buffers),
+            '{"key": "2026-01-02 00:00:00"}')
+        self.assertEqual(
+            mysql_db_admin.render_data(data, "expand", {}, self.indent),
+            pprint.pformat(data, indent=self.indent))
+
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test a format already rendered is reused.
+
+        Arguments:
+
+        """
+
+        self.buffers["json"] = "Rendered"
+
+        self.assertEqual(
+            mysql_db_admin.render_data(self.data, "json", self.buffers),
+            "Rendered")
+
+    def test_text(self):
+
+        """Function:  test_text
+
+        Description:  Test with text format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.render_data(self.data, "text", self.buffers),
+            str(self.data))
+
+    @mock.patch("mysql_db_admin.EXPAND_MAX_SIZE", 10)
+    def test_expand_large(self):
+
+        """Function:  test_expand_large
+
+        Description:  Test a large document is expanded as indented JSON.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.render_data(self.data, "expand", self.buffers),
+            json.dumps(self.data, indent=4))
+
+    def test_expand_indent(self):
+
+        """Function:  test_expand_indent
+
+        Description:  Test with expand format and indent.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.render_data(
+                self.data, "expand", self.buffers, self.indent),
+            pprint.pformat(self.data, indent=self.indent))
+
+    def test_expand(self):
+
+        """Function:  test_expand
+
+        Description:  Test with expand format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.render_data(self.data, "expand", self.buffers),
+            pprint.pformat(self.data))
+
+    def test_json_indent(self):
+
+        """Function:  test_json_indent
+
+        Description:  Test with json format and indent.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.render_data(
+                self.data, "json", self.buffers, self.indent),
+            json.dumps(self.data, indent=self.indent))
+
+    def test_json(self):
+
+        """Function:  test_json
+
+        Description:  Test with json format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.render_data(self.data, "json", self.buffers),
+            json.dumps(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  route_batch.py
+
+    Description:  Unit testing of route_batch in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/route_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mode
+        test_grouped
+        test_one_action
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.db_dict = {"db1": {
+            "t1": {"ENGINE": "InnoDB", "DATA_FREE": 0},
+            "t2": {"ENGINE": "CSV"}, "t3": {"ENGINE": "MyISAM"},
+            "t4": {"ENGINE": "InnoDB", "DATA_FREE": 0}}}
+        self.batch = [("db1", "t1"), ("db1", "t2"), ("db1", "t3"),
+                      ("db1", "t4")]
+        self.batch2 = [("db1", "t3")]
+
+    @mock.patch("mysql_db_admin.table_batch_cmd")
+    def test_mode(self, mock_cmd):
+
+        """Function:  test_mode
+
+        Description:  Test with a check table mode.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = [{"TableName": "t3"}]
+        mysql_db_admin.route_batch(
+            self.server, self.batch2, self.db_dict, "check", mode="FAST")
+
+        mock_cmd.assert_called_once_with(
+            self.server, self.batch2, "check", mode="FAST")
+
+    @mock.patch("mysql_db_admin.table_batch_cmd")
+    def test_grouped(self, mock_cmd):
+
+        """Function:  test_grouped
+
+        Description:  Test the tables are grouped by command.
+
+        Arguments:
+
+        """
+
+        mock_cmd.side_effect = [
+            [{"TableName": "t1"}, {"TableName": "t4"}], [{"TableName": "t3"}]]
+
+        t_list = mysql_db_admin.route_batch(
+            self.server, self.batch, self.db_dict, "optimize",
+            downgrade=True)
+
+        self.assertEqual(
+            [item["Action"] for item in t_list],
+            ["analyze", "skip", "optimize", "analyze"])
+        self.assertEqual(
+            [item["TableName"] for item in t_list], ["t1", "t2", "t3", "t4"])
+        mock_cmd.assert_any_call(
+            self.server, [("db1", "t1"), ("db1", "t4")], "analyze",
+            mode=None)
+
+    @mock.patch("mysql_db_admin.table_batch_cmd")
+    def test_one_action(self, mock_cmd):
+
+        """Function:  test_one_action
+
+        Description:  Test with one command for the batch.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = [{"TableName": "t3"}]
+
+        self.assertEqual(
+            mysql_db_admin.route_batch(
+                self.server, self.batch2, self.db_dict, "check"),
+            [{"TableName": "t3", "Engine": "MyISAM", "Action": "check"}])
+        mock_cmd.assert_called_once_with(
+            self.server, self.batch2, "check", mode=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  run_batch.py
+
+    Description:  Unit testing of run_batch in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/run_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def tbl_func(server, dbn, tbl):
+
+    """Function:  tbl_func
+
+    Description:  Function stub holder for a table function.
+
+    Arguments:
+
+    """
+
+    return {"TableName": tbl, "Server": server, "Database": dbn}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_run_batch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.batch = [("db1", "t1"), ("db2", "t2")]
+        self.results = [
+            {"TableName": "t1", "Server": "Server", "Database": "db1"},
+            {"TableName": "t2", "Server": "Server", "Database": "db2"}]
+
+    def test_run_batch(self):
+
+        """Function:  test_run_batch
+
+        Description:  Test running the table function on each table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.run_batch(self.server, self.batch, tbl_func),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -216,6 +216,7 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_fleet
         test_default_sys_dbs
         test_cfg_sys_dbs
         test_connect_failure
@@ -240,6 +241,24 @@ class UnitTest(unittest.TestCase):
         self.cfg2 = Cfg2()
         self.func_list = {"-C": check}
 
+    @mock.patch("mysql_db_admin.run_server")
+    @mock.patch("mysql_db_admin.fleet_run")
+    def test_fleet(self, mock_fleet, mock_server):
+
+        """Function:  test_fleet
+
+        Description:  Test with the -F option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-F"] = ["mysql_cfg2"]
+
+        self.assertFalse(mysql_db_admin.run_program(self.args, self.func_list))
+        mock_fleet.assert_called_once_with(self.args, self.func_list)
+        mock_server.assert_not_called()
+
     @mock.patch("mysql_db_admin.gen_libs.load_module")
     @mock.patch("mysql_db_admin.mysql_libs.disconnect")
     @mock.patch("mysql_db_admin.mysql_libs.create_instance")
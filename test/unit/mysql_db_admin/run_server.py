@@ -0,0 +1,346 @@
+# Classification (U)
+
+"""Program:  run_server.py
+
+    Description:  Unit testing of run_server in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/run_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        get_args_keys
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Server_Name"
+        self.conn_msg = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        status = True
+
+        if silent:
+            status = True
+
+        return status
+
+
+class Cfg():                                            # pylint:disable=R0903
+
+    """Class:  Cfg
+
+    Description:  Emulate a configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization.
+
+        Arguments:
+
+        """
+
+        self.sys_dbs = [
+            "performance_schema", "information_schema", "mysql", "sys"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fleet_error
+        test_error
+        test_fleet_cfg
+        test_fleet_connect_failure
+        test_connect_failure
+        test_run_server
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.cfg = Cfg()
+        self.func_list = {"-C": mock.Mock()}
+        self.args.args_array["-C"] = True
+        self.fleet = {"Stream": False}
+
+    @mock.patch("mysql_db_admin.fleet_doc")
+    @mock.patch("mysql_db_admin.gen_libs.load_module")
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_fleet_error(self, mock_inst, mock_disconn, mock_cfg, mock_fleet):
+
+        """Function:  test_fleet_error
+
+        Description:  Test an error on the server is handed to the fleet and
+            the server is disconnected.
+
+        Arguments:
+
+        """
+
+        self.func_list["-C"].side_effect = ValueError("Lost connection")
+
+        mock_inst.return_value = self.server
+        mock_cfg.return_value = self.cfg
+
+        self.assertFalse(
+            mysql_db_admin.run_server(
+                self.args, self.func_list, "mysql_cfg", fleet=self.fleet))
+        mock_fleet.assert_called_once_with(
+            self.fleet, {"Server": "Server_Name", "Error": "Lost connection"})
+        mock_disconn.assert_called_once_with(self.server)
+
+    @mock.patch("mysql_db_admin.gen_libs.load_module")
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_error(self, mock_inst, mock_disconn, mock_cfg):
+
+        """Function:  test_error
+
+        Description:  Test an error is raised and the server is disconnected.
+
+        Arguments:
+
+        """
+
+        self.func_list["-C"].side_effect = ValueError("Lost connection")
+
+        mock_inst.return_value = self.server
+        mock_cfg.return_value = self.cfg
+
+        with self.assertRaises(ValueError):
+            mysql_db_admin.run_server(self.args, self.func_list, "mysql_cfg")
+
+        mock_disconn.assert_called_once_with(self.server)
+
+    @mock.patch("mysql_db_admin.gen_libs.load_module")
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_fleet_cfg(self, mock_inst, mock_disconn, mock_cfg):
+
+        """Function:  test_fleet_cfg
+
+        Description:  Test the functions get the -c option set to the
+            configuration module.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+        mock_disconn.return_value = True
+        mock_cfg.return_value = self.cfg
+
+        self.assertFalse(
+            mysql_db_admin.run_server(
+                self.args, self.func_list, "mysql_cfg2", fleet=self.fleet))
+        mock_inst.assert_called_once_with(
+            "mysql_cfg2", "config", mysql_db_admin.mysql_class.Server)
+        args = self.func_list["-C"].call_args[0][1]
+        self.assertEqual(args.get_val("-c"), "mysql_cfg2")
+        self.assertEqual(self.args.get_val("-c"), "mysql_cfg")
+        self.assertEqual(
+            self.func_list["-C"].call_args[1]["fleet"], self.fleet)
+
+    @mock.patch("mysql_db_admin.fleet_doc")
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_fleet_connect_failure(self, mock_inst, mock_fleet):
+
+        """Function:  test_fleet_connect_failure
+
+        Description:  Test the connection error is handed to the fleet.
+
+        Arguments:
+
+        """
+
+        self.server.conn_msg = "Error connection message"
+
+        mock_inst.return_value = self.server
+
+        self.assertFalse(
+            mysql_db_admin.run_server(
+                self.args, self.func_list, "mysql_cfg", fleet=self.fleet))
+        mock_fleet.assert_called_once_with(
+            self.fleet,
+            {"Server": "Server_Name", "Error": "Error connection message"})
+        self.func_list["-C"].assert_not_called()
+
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_connect_failure(self, mock_inst):
+
+        """Function:  test_connect_failure
+
+        Description:  Test with failed connection.
+
+        Arguments:
+
+        """
+
+        self.server.conn_msg = "Error connection message"
+
+        mock_inst.return_value = self.server
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_db_admin.run_server(
+                    self.args, self.func_list, "mysql_cfg"))
+
+        self.func_list["-C"].assert_not_called()
+
+    @mock.patch("mysql_db_admin.gen_libs.load_module")
+    @mock.patch("mysql_db_admin.mysql_libs.disconnect")
+    @mock.patch("mysql_db_admin.mysql_libs.create_instance")
+    def test_run_server(self, mock_inst, mock_disconn, mock_cfg):
+
+        """Function:  test_run_server
+
+        Description:  Test run_server function.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+        mock_disconn.return_value = True
+        mock_cfg.return_value = self.cfg
+
+        self.assertFalse(
+            mysql_db_admin.run_server(
+                self.args, self.func_list, "mysql_cfg"))
+        self.assertEqual(
+            self.func_list["-C"].call_args[0], (self.server, self.args))
+        mock_disconn.assert_called_once_with(self.server)
+
+
+if __name__ == "__main__":
+    unittest.main()
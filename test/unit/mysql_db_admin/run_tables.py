@@ -0,0 +1,259 @@
+# Classification (U)
+
+"""Program:  run_tables.py
+
+    Description:  Unit testing of run_tables in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/run_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-C": []}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fleet
+        test_lag
+        test_budget
+        test_checkpoint
+        test_stream
+        test_json_document
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.db_dict = {"db1": {"t1": {}}}
+        self.results = {"Server": "ServerName", "Type": "check"}
+        self.t_results = [{"Database": "db1", "Tables": [{"TableName": "t1"}]}]
+        self.config = {"config": "value"}
+        self.state = (True, None)
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.fleet_doc")
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_fleet(self, mock_config, mock_process, mock_fleet, mock_out):
+
+        """Function:  test_fleet
+
+        Description:  Test the document is handed to the fleet.
+
+        Arguments:
+
+        """
+
+        fleet = {"Stream": False}
+
+        mock_config.return_value = self.config
+        mock_process.return_value = self.t_results
+
+        self.assertEqual(
+            mysql_db_admin.run_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                fleet=fleet), self.state)
+        mock_fleet.assert_called_once_with(fleet, self.results)
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_lag(self, mock_config, mock_process, mock_out):
+
+        """Function:  test_lag
+
+        Description:  Test the time waited on replication lag is in the
+            results.
+
+        Arguments:
+
+        """
+
+        lag = {"Replicas": [], "Max": 30, "Waits": 1, "WaitSecs": 5.0,
+               "TimedOut": False, "Unprocessed": []}
+
+        mock_config.return_value = self.config
+        mock_process.return_value = self.t_results
+        mock_out.return_value = self.state
+
+        self.assertEqual(
+            mysql_db_admin.run_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                lag=lag), self.state)
+        self.assertEqual(
+            mock_out.call_args[0][0]["ReplicaWait"],
+            {"MaxLag": 30, "Waits": 1, "WaitSecs": 5.0, "TimedOut": False,
+             "Unprocessed": []})
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_budget(self, mock_config, mock_process, mock_out):
+
+        """Function:  test_budget
+
+        Description:  Test the tables not started within the time budget are
+            listed in the results.
+
+        Arguments:
+
+        """
+
+        budget = {"Unprocessed": [{"Database": "db1", "TableName": "t2"}]}
+
+        mock_config.return_value = self.config
+        mock_process.return_value = self.t_results
+        mock_out.return_value = self.state
+
+        self.assertEqual(
+            mysql_db_admin.run_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                budget=budget), self.state)
+        self.assertEqual(
+            mock_out.call_args[0][0]["Unprocessed"], budget["Unprocessed"])
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.ckpt_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_checkpoint(self, mock_config, mock_ckpt, mock_out):
+
+        """Function:  test_checkpoint
+
+        Description:  Test with -P option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = "/dir"
+
+        mock_config.return_value = self.config
+        mock_ckpt.return_value = self.t_results
+        mock_out.return_value = self.state
+
+        self.assertEqual(
+            mysql_db_admin.run_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.state)
+        self.assertEqual(
+            mock_out.call_args[0][0]["Results"], self.t_results)
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.stream_tables")
+    def test_stream(self, mock_stream, mock_out):
+
+        """Function:  test_stream
+
+        Description:  Test with -J option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-J"] = True
+
+        mock_stream.return_value = self.state
+
+        self.assertEqual(
+            mysql_db_admin.run_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.state)
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_json_document(self, mock_config, mock_process, mock_out):
+
+        """Function:  test_json_document
+
+        Description:  Test with a single JSON document.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config
+        mock_process.return_value = self.t_results
+        mock_out.return_value = self.state
+
+        self.assertEqual(
+            mysql_db_admin.run_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.state)
+        self.assertEqual(
+            mock_out.call_args[0][0]["Results"], self.t_results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+# Classification (U)
+
+"""Program:  run_tasks.py
+
+    Description:  Unit testing of run_tasks in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/run_tasks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import functools
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def tbl_func(server, dbn, tbl):
+
+    """Function:  tbl_func
+
+    Description:  Function stub holder for a table function.
+
+    Arguments:
+
+    """
+
+    return server + ":" + dbn + "." + tbl
+
+
+def fail_func(server, dbn, tbl, ran):
+
+    """Function:  fail_func
+
+    Description:  Function stub holder for a table function that fails on
+        the first table.
+
+    Arguments:
+
+    """
+
+    ran.append(tbl)
+
+    if tbl == "t0":
+        raise ValueError("Table failed")
+
+    time.sleep(0.01)
+
+    return server + ":" + dbn + "." + tbl
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        callback
+        interrupt
+        test_interrupt
+        test_task_error
+        test_no_tasks
+        test_multiple_connections
+        test_single_connection
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pool = ["srv1"]
+        self.pool2 = ["srv1", "srv2", "srv3"]
+        self.tasks = [("db1", "t1"), ("db1", "t2"), ("db2", "t3")]
+        self.done = {}
+        self.results = {0: "srv1:db1.t1", 1: "srv1:db1.t2", 2: "srv1:db2.t3"}
+        self.results2 = {0: "db1.t1", 1: "db1.t2", 2: "db2.t3"}
+        self.pool3 = ["srv1", "srv2"]
+        self.tasks2 = [("db1", "t" + str(cnt)) for cnt in range(50)]
+
+    def callback(self, idx, data):
+
+        """Function:  callback
+
+        Description:  Callback stub holder to capture the task results.
+
+        Arguments:
+
+        """
+
+        self.done[idx] = data
+
+    def interrupt(self, idx, data):
+
+        """Function:  interrupt
+
+        Description:  Callback stub holder that interrupts the run.
+
+        Arguments:
+
+        """
+
+        self.done[idx] = data
+
+        raise KeyboardInterrupt
+
+    def test_interrupt(self):
+
+        """Function:  test_interrupt
+
+        Description:  Test the tasks not started are cancelled when the run
+            is interrupted.
+
+        Arguments:
+
+        """
+
+        ran = []
+
+        with self.assertRaises(KeyboardInterrupt):
+            mysql_db_admin.run_tasks(
+                self.pool3, self.tasks2[1:],
+                functools.partial(fail_func, ran=ran), self.interrupt)
+
+        self.assertLess(len(ran), len(self.tasks2) - 1)
+
+    def test_task_error(self):
+
+        """Function:  test_task_error
+
+        Description:  Test the tasks not started are cancelled and the
+            finished tasks are passed on when a task fails.
+
+        Arguments:
+
+        """
+
+        ran = []
+
+        with self.assertRaises(ValueError):
+            mysql_db_admin.run_tasks(
+                self.pool3, self.tasks2, functools.partial(fail_func, ran=ran),
+                self.callback)
+
+        self.assertLess(len(ran), len(self.tasks2))
+        self.assertEqual(len(self.done), len(ran) - 1)
+
+    def test_no_tasks(self):
+
+        """Function:  test_no_tasks
+
+        Description:  Test with no tasks.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.run_tasks(self.pool2, [], tbl_func, self.callback)
+
+        self.assertEqual(self.done, {})
+
+    def test_multiple_connections(self):
+
+        """Function:  test_multiple_connections
+
+        Description:  Test results are passed with their task index with
+            multiple connections.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.run_tasks(
+            self.pool2, self.tasks, tbl_func, self.callback)
+
+        self.assertEqual(
+            {idx: item.split(":")[1] for idx, item in self.done.items()},
+            self.results2)
+
+    def test_single_connection(self):
+
+        """Function:  test_single_connection
+
+        Description:  Test with a single connection.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.run_tasks(
+            self.pool, self.tasks, tbl_func, self.callback)
+
+        self.assertEqual(self.done, self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Classification (U)
+
+"""Program:  save_state.py
+
+    Description:  Unit testing of save_state in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/save_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_save_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state_file = "/path/state.json"
+        self.state = {"ServerName": {"db1": {"t1": {"Checksum": 1234}}}}
+
+    @mock.patch("mysql_db_admin.os.replace")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_save_state(self, mock_file, mock_replace):
+
+        """Function:  test_save_state
+
+        Description:  Test state is written to a temporary file which
+            replaces the state file.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_db_admin.save_state(self.state_file, self.state))
+        mock_file.assert_called_with(
+            self.state_file + ".tmp", "w", encoding="UTF-8")
+        mock_replace.assert_called_with(
+            self.state_file + ".tmp", self.state_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
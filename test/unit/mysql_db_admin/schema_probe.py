@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  schema_probe.py
+
+    Description:  Unit testing of schema_probe in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/schema_probe.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cmds = []
+        self.rows = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return self.rows.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tables
+        test_probe
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.row = {"DbCount": 5, "TblCount": 20, "CreateTime": "2026-10-18"}
+        self.row2 = {"DbCount": 4, "TblCount": 0, "CreateTime": None}
+        self.results = {
+            "Databases": 5, "Tables": 20, "CreateTime": "2026-10-18"}
+        self.results2 = {"Databases": 4, "Tables": 0, "CreateTime": "None"}
+
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with a server without tables.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[self.row2]]
+
+        self.assertEqual(
+            mysql_db_admin.schema_probe(self.server), self.results2)
+
+    def test_probe(self):
+
+        """Function:  test_probe
+
+        Description:  Test the schema probe.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [[self.row]]
+
+        self.assertEqual(
+            mysql_db_admin.schema_probe(self.server), self.results)
+        self.assertEqual(self.server.cmds[0][1], ("BASE TABLE",))
+
+
+if __name__ == "__main__":
+    unittest.main()
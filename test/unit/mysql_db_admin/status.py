@@ -130,6 +130,10 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_fleet
+        test_prom_serve
+        test_prom_file
+        test_sample
         test_data_out_error
         test_status
 
@@ -150,6 +154,84 @@ class UnitTest(unittest.TestCase):
         self.template = {"Server": "ServerName"}
         self.config = {"config": "value"}
 
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.fleet_doc")
+    @mock.patch("mysql_db_admin.get_status")
+    def test_fleet(self, mock_status, mock_fleet, mock_out):
+
+        """Function:  test_fleet
+
+        Description:  Test the status is handed to the fleet.
+
+        Arguments:
+
+        """
+
+        fleet = {"Stream": False}
+        mock_status.return_value = self.template
+
+        self.assertFalse(
+            mysql_db_admin.status(self.server, self.args, fleet=fleet))
+        mock_fleet.assert_called_once_with(fleet, self.template)
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_db_admin.prom_serve")
+    def test_prom_serve(self, mock_serve):
+
+        """Function:  test_prom_serve
+
+        Description:  Test with -H option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "9104"
+        mock_serve.return_value = (True, None)
+
+        self.assertFalse(mysql_db_admin.status(self.server, self.args))
+        mock_serve.assert_called_once_with(self.server, self.args)
+
+    @mock.patch("mysql_db_admin.get_load", mock.Mock(return_value={}))
+    @mock.patch("mysql_db_admin.prom_write")
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.get_json_template")
+    def test_prom_file(self, mock_template, mock_out, mock_write):
+
+        """Function:  test_prom_file
+
+        Description:  Test with -E option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "/path/mysql.prom"
+        mock_template.return_value = self.template
+
+        self.assertFalse(mysql_db_admin.status(self.server, self.args))
+        self.assertEqual(mock_write.call_args[0][0], "/path/mysql.prom")
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_db_admin.data_out")
+    @mock.patch("mysql_db_admin.status_sample")
+    def test_sample(self, mock_sample, mock_out):
+
+        """Function:  test_sample
+
+        Description:  Test with -i option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-i"] = "60"
+        mock_sample.return_value = (True, None)
+
+        self.assertFalse(mysql_db_admin.status(self.server, self.args))
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_db_admin.get_load", mock.Mock(return_value={}))
     @mock.patch("mysql_db_admin.data_out",
                 mock.Mock(return_value=(False, "Error Message")))
     @mock.patch("mysql_db_admin.create_data_config")
@@ -170,6 +252,7 @@ class UnitTest(unittest.TestCase):
         with gen_libs.no_std_out():
             self.assertFalse(mysql_db_admin.status(self.server, self.args))
 
+    @mock.patch("mysql_db_admin.get_load", mock.Mock(return_value={}))
     @mock.patch("mysql_db_admin.data_out",
                 mock.Mock(return_value=(True, None)))
     @mock.patch("mysql_db_admin.create_data_config")
@@ -0,0 +1,78 @@
+# Classification (U)
+
+"""Program:  status_rates.py
+
+    Description:  Unit testing of status_rates in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/status_rates.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_status_rates
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.prev = {"questions": 1000, "connections": 10,
+                     "bytes_received": 5000, "bytes_sent": 20000,
+                     "innodb_rows_read": 100, "innodb_data_reads": 0}
+        self.cur = {"questions": 1600, "connections": 13,
+                    "bytes_received": 8000, "bytes_sent": 50000,
+                    "innodb_rows_read": 1300, "innodb_data_reads": 7}
+        self.results = {"Interval": 60.0, "Queries": 10.0,
+                        "Connections": 0.05, "BytesIn": 50.0,
+                        "BytesOut": 500.0, "InnodbRowsRead": 20.0,
+                        "InnodbDataReads": 0.12}
+
+    def test_status_rates(self):
+
+        """Function:  test_status_rates
+
+        Description:  Test the per second rates.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.status_rates(self.prev, self.cur, 60.0),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  status_sample.py
+
+    Description:  Unit testing of status_sample in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/status_sample.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-M": True, "-i": "60",
+            "-N": "3"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_outfile
+        test_samples
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.config = {"outfile": None, "mode": "w", "suppress": True}
+        self.config2 = {"outfile": "/path/file", "mode": "a",
+                        "suppress": True}
+        self.state = (True, None)
+
+    @mock.patch("mysql_db_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.get_load", mock.Mock(return_value={}))
+    @mock.patch("mysql_db_admin.get_status", mock.Mock(return_value={}))
+    @mock.patch("mysql_db_admin.stream_line")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_outfile(self, mock_file, mock_config, mock_line):
+
+        """Function:  test_outfile
+
+        Description:  Test the samples are written to the output file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-N"] = "1"
+        mock_config.return_value = self.config2
+
+        self.assertEqual(
+            mysql_db_admin.status_sample(self.server, self.args), self.state)
+        mock_file.assert_called_once_with("/path/file", "a", encoding="UTF-8")
+        self.assertEqual(mock_line.call_count, 2)
+
+    @mock.patch("mysql_db_admin.time.monotonic")
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_load")
+    @mock.patch("mysql_db_admin.get_status")
+    @mock.patch("mysql_db_admin.stream_line")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_samples(                                   # pylint:disable=R0913
+            self, mock_config, mock_line, mock_status, mock_load, mock_sleep,
+            mock_time):
+
+        """Function:  test_samples
+
+        Description:  Test sampling at a fixed interval with the rates from
+            the second sample on.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config
+        mock_status.side_effect = [{"Sample": 1}, {"Sample": 2},
+                                   {"Sample": 3}]
+        mock_load.side_effect = [{"questions": 0}, {"questions": 600},
+                                 {"questions": 1800}]
+        mock_time.side_effect = [0.0, 0.0, 1.0, 60.0, 61.0, 120.0]
+
+        self.assertEqual(
+            mysql_db_admin.status_sample(self.server, self.args), self.state)
+        self.assertEqual(
+            mock_sleep.call_args_list, [mock.call(59.0), mock.call(59.0)])
+        lines = [item[0][0] for item in mock_line.call_args_list]
+        self.assertNotIn("Rates", lines[0])
+        self.assertEqual(lines[1]["Rates"]["Queries"], 10.0)
+        self.assertEqual(lines[2]["Rates"]["Queries"], 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
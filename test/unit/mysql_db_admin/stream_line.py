@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  stream_line.py
+
+    Description:  Unit testing of stream_line in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/stream_line.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lock
+        test_suppress
+        test_stdout
+        test_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.line = {"Server": "ServerName", "TableName": "t1"}
+        self.fhdr = mock.MagicMock()
+
+    def test_lock(self):
+
+        """Function:  test_lock
+
+        Description:  Test the lock is held while writing.
+
+        Arguments:
+
+        """
+
+        lock = mock.MagicMock()
+
+        mysql_db_admin.stream_line(self.line, fhdr=self.fhdr, lock=lock)
+
+        lock.__enter__.assert_called_once()
+        self.fhdr.write.assert_called_once()
+
+    @mock.patch("mysql_db_admin.print", create=True)
+    def test_suppress(self, mock_print):
+
+        """Function:  test_suppress
+
+        Description:  Test with standard out suppressed.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.stream_line(self.line, suppress=True)
+
+        mock_print.assert_not_called()
+
+    def test_stdout(self):
+
+        """Function:  test_stdout
+
+        Description:  Test with output to standard out.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_db_admin.stream_line(self.line))
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with output to a file.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.stream_line(self.line, fhdr=self.fhdr)
+
+        self.fhdr.write.assert_called_once()
+        self.fhdr.flush.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# Classification (U)
+
+"""Program:  stream_table.py
+
+    Description:  Unit testing of stream_table in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/stream_table.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stream_table
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.template = {"Server": "ServerName", "Type": "check"}
+        self.t_data = {"TableName": "t1", "Status": "OK"}
+        self.results = {"Server": "ServerName", "Type": "check",
+                        "Database": "db1", "TableName": "t1", "Status": "OK"}
+
+    @mock.patch("mysql_db_admin.stream_line")
+    def test_stream_table(self, mock_line):
+
+        """Function:  test_stream_table
+
+        Description:  Test the table line includes the template and
+            database name.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.stream_table(
+            "db1", self.t_data, self.template, suppress=True)
+
+        mock_line.assert_called_with(self.results, suppress=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+# Classification (U)
+
+"""Program:  stream_tables.py
+
+    Description:  Unit testing of stream_tables in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/stream_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-C": [], "-J": True}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fleet
+        test_stdout
+        test_outfile
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.db_dict = {"db1": {"t1": {}, "t2": {}}}
+        self.results = {"Server": "ServerName", "Type": "check"}
+        self.config = {"outfile": None, "mode": "w", "suppress": True}
+        self.config2 = {"outfile": "/path/file", "mode": "w",
+                        "suppress": True}
+        self.state = (True, None)
+
+    @mock.patch("mysql_db_admin.gen_libs.get_time",
+                mock.Mock(return_value="12:00:00"))
+    @mock.patch("mysql_db_admin.gen_libs.get_date",
+                mock.Mock(return_value="2026-01-01"))
+    @mock.patch("mysql_db_admin.stream_line")
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_fleet(self, mock_file, mock_config, mock_process, mock_line):
+
+        """Function:  test_fleet
+
+        Description:  Test the lines go to the output file of the fleet.
+
+        Arguments:
+
+        """
+
+        fhdr = mock.MagicMock()
+        fleet = {"Fhdr": fhdr, "Lock": "Lock"}
+
+        mock_config.return_value = self.config2
+        mock_process.return_value = []
+
+        self.assertEqual(
+            mysql_db_admin.stream_tables(
+                self.server, self.args, self.db_dict, self.results, None,
+                fleet=fleet), self.state)
+        mock_file.assert_not_called()
+        fhdr.close.assert_not_called()
+        self.assertEqual(mock_line.call_args[1]["fhdr"], fhdr)
+        self.assertEqual(mock_line.call_args[1]["lock"], "Lock")
+
+    @mock.patch("mysql_db_admin.gen_libs.get_time",
+                mock.Mock(return_value="12:00:00"))
+    @mock.patch("mysql_db_admin.gen_libs.get_date",
+                mock.Mock(return_value="2026-01-01"))
+    @mock.patch("mysql_db_admin.stream_line")
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    def test_stdout(self, mock_config, mock_process, mock_line):
+
+        """Function:  test_stdout
+
+        Description:  Test with no output file.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config
+        mock_process.return_value = []
+
+        self.assertEqual(
+            mysql_db_admin.stream_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.state)
+        self.assertEqual(
+            mock_line.call_args[0][0]["Summary"]["Tables"], 2)
+
+    @mock.patch("mysql_db_admin.gen_libs.get_time",
+                mock.Mock(return_value="12:00:00"))
+    @mock.patch("mysql_db_admin.gen_libs.get_date",
+                mock.Mock(return_value="2026-01-01"))
+    @mock.patch("mysql_db_admin.stream_line", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_admin.process_tables")
+    @mock.patch("mysql_db_admin.create_data_config")
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_outfile(self, mock_file, mock_config, mock_process):
+
+        """Function:  test_outfile
+
+        Description:  Test with output file.
+
+        Arguments:
+
+        """
+
+        mock_config.return_value = self.config2
+        mock_process.return_value = []
+
+        self.assertEqual(
+            mysql_db_admin.stream_tables(
+                self.server, self.args, self.db_dict, self.results, None),
+            self.state)
+        mock_file.assert_called_with("/path/file", "w", encoding="UTF-8")
+        mock_file().close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+# Classification (U)
+
+"""Program:  table_batch_cmd.py
+
+    Description:  Unit testing of table_batch_cmd in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_batch_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mode
+        test_statement
+        test_multiline_return
+        test_batch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.batch = [("db1", "t1"), ("db2", "t2")]
+        self.data = [
+            {"Table": "db1.t1", "Msg_type": "status", "Msg_text": "OK"},
+            {"Table": "db2.t2", "Msg_type": "status", "Msg_text": "OK"}]
+        self.data2 = [
+            {"Table": "db1.t1", "Msg_type": "note", "Msg_text": "Recreate"},
+            {"Table": "db1.t1", "Msg_type": "status", "Msg_text": "OK"},
+            {"Table": "db2.t2", "Msg_type": "status", "Msg_text": "OK"}]
+        self.cmd = "check table `db1`.`t1`, `db2`.`t2`"
+        self.results = [
+            {"TableName": "t1", "Status": "OK"},
+            {"TableName": "t2", "Status": "OK"}]
+        self.results2 = [
+            {"TableName": "t1", "Note": "Recreate", "Status": "OK"},
+            {"TableName": "t2", "Status": "OK"}]
+
+    def test_mode(self):
+
+        """Function:  test_mode
+
+        Description:  Test with a check table mode.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data
+
+        self.assertEqual(
+            mysql_db_admin.table_batch_cmd(
+                self.server, self.batch, "check", mode="QUICK"),
+            [dict(item, Mode="QUICK") for item in self.results])
+        self.assertEqual(self.server.cmd, self.cmd + " quick")
+
+    def test_statement(self):
+
+        """Function:  test_statement
+
+        Description:  Test with a single statement for the batch.
+
+        Arguments:
+
+        """
+
+        mysql_db_admin.table_batch_cmd(self.server, self.batch, "check")
+
+        self.assertEqual(self.server.cmd, self.cmd)
+
+    def test_multiline_return(self):
+
+        """Function:  test_multiline_return
+
+        Description:  Test with a table returning multiple lines.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data2
+
+        self.assertEqual(
+            mysql_db_admin.table_batch_cmd(
+                self.server, self.batch, "optimize"), self.results2)
+
+    def test_batch(self):
+
+        """Function:  test_batch
+
+        Description:  Test with a batch of tables.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data
+
+        self.assertEqual(
+            mysql_db_admin.table_batch_cmd(self.server, self.batch, "check"),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
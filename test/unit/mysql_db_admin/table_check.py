@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  table_check.py
+
+    Description:  Unit testing of table_check in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_check.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiline_return
+        test_mode
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = mock.Mock()
+        self.data = [{"Msg_type": "status", "Msg_text": "OK"}]
+        self.data2 = [
+            {"Msg_type": "status", "Msg_text": "Table is already up to date"},
+            {"Msg_type": "note", "Msg_text": "Message Here"}]
+        self.results = {"TableName": "t1", "Status": "OK", "Mode": "FAST"}
+        self.results2 = {
+            "TableName": "t1", "Status": "Table is already up to date",
+            "Note": "Message Here", "Mode": "CHANGED"}
+
+    def test_multiline_return(self):
+
+        """Function:  test_multiline_return
+
+        Description:  Test with check table returning multiple lines.
+
+        Arguments:
+
+        """
+
+        self.server.col_sql.return_value = self.data2
+
+        self.assertEqual(
+            mysql_db_admin.table_check(self.server, "db1", "t1", "CHANGED"),
+            self.results2)
+
+    def test_mode(self):
+
+        """Function:  test_mode
+
+        Description:  Test the mode is passed to check table.
+
+        Arguments:
+
+        """
+
+        self.server.col_sql.return_value = self.data
+
+        self.assertEqual(
+            mysql_db_admin.table_check(self.server, "db1", "t1", "FAST"),
+            self.results)
+        self.server.col_sql.assert_called_once_with(
+            "check table `db1`.`t1` fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
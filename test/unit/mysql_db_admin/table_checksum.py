@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  table_checksum.py
+
+    Description:  Unit testing of table_checksum in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_quick_no_live
+        test_quick
+        test_not_live
+        test_checksum
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = mock.Mock()
+        self.checksum = [{"Table": "db1.t1", "Checksum": 12345}]
+        self.db_dict = {"db1": {
+            "t1": {"CREATE_OPTIONS": "CHECKSUM=1"},
+            "t2": {"CREATE_OPTIONS": ""}}}
+        self.results = {"TableName": "t1", "Checksum": 12345,
+                        "Mode": "extended"}
+        self.results2 = {"TableName": "t1", "Checksum": 12345,
+                         "Mode": "quick"}
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_quick_no_live(self, mock_checksum):
+
+        """Function:  test_quick_no_live
+
+        Description:  Test with no live checksum returned by the quick mode.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+        self.server.col_sql.return_value = [
+            {"Table": "db1.t1", "Checksum": None}]
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum(
+                self.server, "db1", "t1", self.db_dict), self.results)
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_quick(self, mock_checksum):
+
+        """Function:  test_quick
+
+        Description:  Test with a table with a live checksum.
+
+        Arguments:
+
+        """
+
+        self.server.col_sql.return_value = self.checksum
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum(
+                self.server, "db1", "t1", self.db_dict), self.results2)
+        self.server.col_sql.assert_called_once_with(
+            "checksum table `db1`.`t1` quick")
+        mock_checksum.assert_not_called()
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_not_live(self, mock_checksum):
+
+        """Function:  test_not_live
+
+        Description:  Test with a table without a live checksum.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum(
+                self.server, "db1", "t2", self.db_dict)["Mode"], "extended")
+        self.server.col_sql.assert_not_called()
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_checksum(self, mock_checksum):
+
+        """Function:  test_checksum
+
+        Description:  Test table checksum.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum(self.server, "db1", "t1"),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  table_checksum_chunk.py
+
+    Description:  Unit testing of table_checksum_chunk in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_checksum_chunk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import queue
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_primary_key
+        test_composite_key
+        test_ranges
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.conns = queue.Queue()
+        self.chunk = {"Size": 1000, "Throttle": None, "Lock": None,
+                      "File": None, "Fhdr": None, "Done": {}, "Ranges": 3,
+                      "Conns": None}
+        self.progs = [{"Lower": None, "Rows": 1000, "Digest": 6, "Chunks": 1},
+                      {"Lower": None, "Rows": 10, "Digest": 3, "Chunks": 1},
+                      {"Lower": None, "Rows": 5, "Digest": 1, "Chunks": 2}]
+
+    @mock.patch("mysql_db_admin.table_checksum")
+    @mock.patch("mysql_db_admin.tbl_columns")
+    def test_no_primary_key(self, mock_cols, mock_checksum):
+
+        """Function:  test_no_primary_key
+
+        Description:  Test a table without a primary key uses a whole table
+            checksum.
+
+        Arguments:
+
+        """
+
+        mock_cols.return_value = (["a"], [])
+        mock_checksum.return_value = {"TableName": "t1", "Checksum": 1}
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_chunk(
+                self.server, "db1", "t1", self.chunk),
+            {"TableName": "t1", "Checksum": 1})
+
+    @mock.patch("mysql_db_admin.chunk_ranges")
+    @mock.patch("mysql_db_admin.chunk_range")
+    @mock.patch("mysql_db_admin.tbl_columns")
+    def test_composite_key(self, mock_cols, mock_range, mock_ranges):
+
+        """Function:  test_composite_key
+
+        Description:  Test a composite primary key is walked as one range.
+
+        Arguments:
+
+        """
+
+        self.chunk["Conns"] = self.conns
+        mock_cols.return_value = (["a", "b"], ["a", "b"])
+        mock_range.return_value = self.progs[0]
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_chunk(
+                self.server, "db1", "t1", self.chunk),
+            {"TableName": "t1", "Checksum": 6, "Rows": 1000, "Chunks": 1})
+        mock_ranges.assert_not_called()
+        self.assertEqual(mock_range.call_args[0][6], [None, None])
+
+    @mock.patch("mysql_db_admin.chunk_ranges")
+    @mock.patch("mysql_db_admin.chunk_range")
+    @mock.patch("mysql_db_admin.tbl_columns")
+    def test_ranges(self, mock_cols, mock_range, mock_ranges):
+
+        """Function:  test_ranges
+
+        Description:  Test the ranges are walked on the spare connections
+            and their digests combined.
+
+        Arguments:
+
+        """
+
+        self.conns.put("Server2")
+        self.conns.put("Server3")
+        self.chunk["Conns"] = self.conns
+        mock_cols.return_value = (["id", "a"], ["id"])
+        mock_ranges.return_value = [
+            [None, [10]], [[10], [20]], [[20], None]]
+        mock_range.side_effect = self.progs
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_chunk(
+                self.server, "db1", "t1", self.chunk),
+            {"TableName": "t1", "Checksum": 4, "Rows": 1015, "Chunks": 4,
+             "Ranges": 3})
+        self.assertEqual(
+            sorted(item[0][0] for item in mock_range.call_args_list),
+            ["Server", "Server2", "Server3"])
+        self.assertEqual(self.conns.qsize(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
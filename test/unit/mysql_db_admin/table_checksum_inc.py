@@ -0,0 +1,236 @@
+# Classification (U)
+
+"""Program:  table_checksum_inc.py
+
+    Description:  Unit testing of table_checksum_inc in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_checksum_inc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_method_changed
+        test_live_checksum_added
+        test_chk_func
+        test_no_update_time
+        test_full_rescan
+        test_changed
+        test_not_in_state
+        test_unchanged
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.tbl_info = {
+            "UPDATE_TIME": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "TABLE_ROWS": 100, "DATA_LENGTH": 16384}
+        self.db_dict = {"db1": {"t1": self.tbl_info}}
+        self.db_dict2 = {"db1": {"t1": dict(self.tbl_info, TABLE_ROWS=101)}}
+        self.db_dict3 = {"db1": {"t1": dict(self.tbl_info, UPDATE_TIME=None)}}
+        self.meta = {"UpdateTime": "2026-01-02 03:04:05",
+                     "TableRows": 100, "DataLength": 16384,
+                     "Method": "extended"}
+        self.srv_state = {"db1": {"t1": {"Checksum": 1111, "Meta": self.meta}}}
+        self.checksum = [{"Table": "db1.t1", "Checksum": 2222}]
+        self.results = {"TableName": "t1", "Checksum": 1111,
+                        "Mode": "extended", "Cached": True}
+        self.results2 = {"TableName": "t1", "Checksum": 2222,
+                         "Mode": "extended", "Cached": False}
+
+    def test_method_changed(self):
+
+        """Function:  test_method_changed
+
+        Description:  Test with an unchanged table checksummed with another
+            method.
+
+        Arguments:
+
+        """
+
+        chk_func = mock.Mock(
+            return_value={"TableName": "t1", "Checksum": 2222})
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict, self.srv_state,
+                chk_func=chk_func, method="chunk"),
+            {"TableName": "t1", "Checksum": 2222, "Cached": False})
+        self.assertEqual(
+            self.srv_state["db1"]["t1"]["Meta"]["Method"], "chunk")
+
+    def test_live_checksum_added(self):
+
+        """Function:  test_live_checksum_added
+
+        Description:  Test with an unchanged table now keeping a live
+            checksum.
+
+        Arguments:
+
+        """
+
+        db_dict = {"db1": {"t1": dict(
+            self.tbl_info, CREATE_OPTIONS="checksum=1")}}
+        chk_func = mock.Mock(return_value={
+            "TableName": "t1", "Checksum": 2222, "Mode": "quick"})
+
+        self.assertFalse(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", db_dict, self.srv_state,
+                chk_func=chk_func)["Cached"])
+        self.assertEqual(
+            self.srv_state["db1"]["t1"]["Meta"]["Method"], "quick")
+
+    def test_chk_func(self):
+
+        """Function:  test_chk_func
+
+        Description:  Test the table is checksummed with the passed function.
+
+        Arguments:
+
+        """
+
+        chk_func = mock.Mock(return_value={
+            "TableName": "t1", "Checksum": 2222, "Mode": "extended"})
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict2, self.srv_state,
+                chk_func=chk_func), self.results2)
+        chk_func.assert_called_once_with(self.server, "db1", "t1")
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_no_update_time(self, mock_checksum):
+
+        """Function:  test_no_update_time
+
+        Description:  Test with a table without an update time.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict3, self.srv_state),
+            self.results2)
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_full_rescan(self, mock_checksum):
+
+        """Function:  test_full_rescan
+
+        Description:  Test with full rescan of an unchanged table.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict, self.srv_state,
+                full=True), self.results2)
+        self.assertEqual(self.srv_state["db1"]["t1"]["Checksum"], 2222)
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_changed(self, mock_checksum):
+
+        """Function:  test_changed
+
+        Description:  Test with a changed table.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict2, self.srv_state),
+            self.results2)
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_not_in_state(self, mock_checksum):
+
+        """Function:  test_not_in_state
+
+        Description:  Test with a table not in the state.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = self.checksum
+        srv_state = {}
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict, srv_state),
+            self.results2)
+        self.assertEqual(
+            srv_state, {"db1": {"t1": {"Checksum": 2222, "Meta": self.meta}}})
+
+    @mock.patch("mysql_db_admin.mysql_libs.checksum")
+    def test_unchanged(self, mock_checksum):
+
+        """Function:  test_unchanged
+
+        Description:  Test with an unchanged table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.table_checksum_inc(
+                self.server, "db1", "t1", self.db_dict, self.srv_state),
+            self.results)
+        mock_checksum.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
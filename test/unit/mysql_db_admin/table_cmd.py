@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  table_cmd.py
+
+    Description:  Unit testing of table_cmd in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def cmd_func(server, dbn, tbl):
+
+    """Function:  cmd_func
+
+    Description:  Function stub holder for a mysql_libs table command.
+
+    Arguments:
+
+    """
+
+    data = [{"Msg_type": "status", "Msg_text": "OK"}]
+
+    if server and dbn and tbl == "t2":
+        data.append({"Msg_type": "note", "Msg_text": "Message Here"})
+
+    return data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiline_return
+        test_one_line_return
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.results = {"TableName": "t1", "Status": "OK"}
+        self.results2 = {
+            "TableName": "t2", "Status": "OK", "Note": "Message Here"}
+
+    def test_multiline_return(self):
+
+        """Function:  test_multiline_return
+
+        Description:  Test with command returning multiple lines.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.table_cmd(self.server, "db1", "t2", cmd_func),
+            self.results2)
+
+    def test_one_line_return(self):
+
+        """Function:  test_one_line_return
+
+        Description:  Test with command returning one line.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.table_cmd(self.server, "db1", "t1", cmd_func),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  table_compare.py
+
+    Description:  Unit testing of table_compare in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_compare.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import queue
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replica_error
+        test_chunks
+        test_no_primary_key
+        test_mismatch
+        test_match
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Source"
+        self.conns = queue.Queue()
+        self.conns.put("Replica")
+        self.cmp = {"Pool": ["Replica"], "Conns": self.conns, "Chunk": None}
+        self.chunk = {"Size": 100, "Throttle": None}
+
+    @staticmethod
+    def checksum_error(srv, **kwargs):
+
+        """Function:  checksum_error
+
+        Description:  Stub holder for table_checksum, the table is missing on
+            the replica.
+
+        Arguments:
+
+        """
+
+        if srv == "Replica":
+            raise ValueError(f"Table '{kwargs['dbn']}.t1' doesn't exist")
+
+        return {"TableName": "t1", "Checksum": 5}
+
+    @mock.patch("mysql_db_admin.table_checksum")
+    def test_replica_error(self, mock_checksum):
+
+        """Function:  test_replica_error
+
+        Description:  Test a table missing on the replica is returned as a
+            mismatch with the error.
+
+        Arguments:
+
+        """
+
+        mock_checksum.side_effect = self.checksum_error
+
+        self.assertEqual(
+            mysql_db_admin.table_compare(self.server, "db1", "t1", self.cmp),
+            {"TableName": "t1", "Source": 5, "Replica": None,
+             "Error": "Replica: Table 'db1.t1' doesn't exist"})
+        self.assertEqual(self.conns.qsize(), 1)
+
+    @mock.patch("mysql_db_admin.compare_chunks")
+    @mock.patch("mysql_db_admin.tbl_columns")
+    def test_chunks(self, mock_cols, mock_chunks):
+
+        """Function:  test_chunks
+
+        Description:  Test a table with a primary key is compared in chunks
+            with the -K option.
+
+        Arguments:
+
+        """
+
+        self.cmp["Chunk"] = self.chunk
+        mock_cols.return_value = (["id"], ["id"])
+        mock_chunks.return_value = {"TableName": "t1", "Source": 1,
+                                    "Replica": 1, "MismatchChunks": 2}
+
+        self.assertEqual(
+            mysql_db_admin.table_compare(self.server, "db1", "t1", self.cmp),
+            mock_chunks.return_value)
+        mock_chunks.assert_called_once_with(
+            "Source", "Replica", "db1", "t1", ["id"], ["id"], self.chunk)
+        self.assertEqual(self.conns.qsize(), 1)
+
+    @mock.patch("mysql_db_admin.table_checksum")
+    @mock.patch("mysql_db_admin.tbl_columns")
+    def test_no_primary_key(self, mock_cols, mock_checksum):
+
+        """Function:  test_no_primary_key
+
+        Description:  Test a table without a primary key is compared with a
+            whole table checksum.
+
+        Arguments:
+
+        """
+
+        self.cmp["Chunk"] = self.chunk
+        mock_cols.return_value = (["a"], [])
+        mock_checksum.return_value = {"TableName": "t1", "Checksum": 5}
+
+        self.assertIsNone(
+            mysql_db_admin.table_compare(self.server, "db1", "t1", self.cmp))
+        self.assertEqual(mock_checksum.call_count, 2)
+
+    @mock.patch("mysql_db_admin.table_checksum")
+    def test_mismatch(self, mock_checksum):
+
+        """Function:  test_mismatch
+
+        Description:  Test a mismatching table is returned.
+
+        Arguments:
+
+        """
+
+        mock_checksum.side_effect = lambda srv, **kwargs: {
+            "TableName": "t1", "Checksum": 1 if srv == "Source" else 2}
+
+        self.assertEqual(
+            mysql_db_admin.table_compare(self.server, "db1", "t1", self.cmp),
+            {"TableName": "t1", "Source": 1, "Replica": 2})
+        self.assertEqual(self.conns.qsize(), 1)
+
+    @mock.patch("mysql_db_admin.table_checksum")
+    def test_match(self, mock_checksum):
+
+        """Function:  test_match
+
+        Description:  Test a matching table is not returned.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = {"TableName": "t1", "Checksum": 5}
+
+        self.assertIsNone(
+            mysql_db_admin.table_compare(self.server, "db1", "t1", self.cmp))
+        self.assertEqual(
+            sorted(item[0][0] for item in mock_checksum.call_args_list),
+            ["Replica", "Source"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  table_optimize.py
+
+    Description:  Unit testing of table_optimize in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_optimize.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_below_size
+        test_below_percent
+        test_above_thresholds
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.db_dict = {
+            "db1": {"t1": {"DATA_LENGTH": 4194304, "DATA_FREE": 2097152},
+                    "t2": {"DATA_LENGTH": 104857600, "DATA_FREE": 2097152}}}
+        self.optimize = [{"Msg_type": "status", "Msg_text": "OK"}]
+        self.frag = {
+            "DataFree": 2097152, "DataLength": 4194304, "PercentFree": 50.0}
+        self.frag2 = {
+            "DataFree": 2097152, "DataLength": 104857600, "PercentFree": 2.0}
+        self.results = {
+            "TableName": "t1", "Status": "OK", "Fragmentation": self.frag}
+        self.results2 = {
+            "TableName": "t2", "Skipped": "Below fragmentation threshold",
+            "Fragmentation": self.frag2}
+        self.results3 = {
+            "TableName": "t1", "Skipped": "Below fragmentation threshold",
+            "Fragmentation": self.frag}
+
+    @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
+    def test_below_size(self, mock_optimize):
+
+        """Function:  test_below_size
+
+        Description:  Test with free space below the size threshold.
+
+        Arguments:
+
+        """
+
+        mock_optimize.return_value = self.optimize
+
+        self.assertEqual(
+            mysql_db_admin.table_optimize(
+                self.server, "db1", "t1", self.db_dict, 10, 5), self.results3)
+
+    @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
+    def test_below_percent(self, mock_optimize):
+
+        """Function:  test_below_percent
+
+        Description:  Test with fragmentation below the percent threshold.
+
+        Arguments:
+
+        """
+
+        mock_optimize.return_value = self.optimize
+
+        self.assertEqual(
+            mysql_db_admin.table_optimize(
+                self.server, "db1", "t2", self.db_dict, 10, 1), self.results2)
+
+    @mock.patch("mysql_db_admin.mysql_libs.optimize_tbl")
+    def test_above_thresholds(self, mock_optimize):
+
+        """Function:  test_above_thresholds
+
+        Description:  Test with fragmentation above both thresholds.
+
+        Arguments:
+
+        """
+
+        mock_optimize.return_value = self.optimize
+
+        self.assertEqual(
+            mysql_db_admin.table_optimize(
+                self.server, "db1", "t1", self.db_dict, 10, 1), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
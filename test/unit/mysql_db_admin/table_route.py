@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  table_route.py
+
+    Description:  Unit testing of table_route in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/table_route.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_downgrade
+        test_skip
+        test_run
+        test_no_engine
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.db_dict = {"db1": {
+            "t1": {"ENGINE": "InnoDB", "DATA_FREE": 0},
+            "t2": {"ENGINE": "CSV"}, "t3": {"ENGINE": "MyISAM"}, "t4": {}}}
+        self.tbl_func = mock.Mock(return_value={"TableName": "t3"})
+        self.results = {"TableName": "t1", "Engine": "InnoDB",
+                        "Action": "analyze"}
+        self.results2 = {
+            "TableName": "t2", "Skipped": "Engine does not support optimize",
+            "Engine": "CSV", "Action": "skip"}
+        self.results3 = {"TableName": "t3", "Engine": "MyISAM",
+                         "Action": "optimize"}
+
+    @mock.patch("mysql_db_admin.table_cmd")
+    def test_downgrade(self, mock_cmd):
+
+        """Function:  test_downgrade
+
+        Description:  Test with an optimize downgraded to an analyze.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = {"TableName": "t1"}
+
+        self.assertEqual(
+            mysql_db_admin.table_route(
+                self.server, "db1", "t1", self.db_dict, "optimize",
+                self.tbl_func, downgrade=True), self.results)
+        self.tbl_func.assert_not_called()
+
+    def test_skip(self):
+
+        """Function:  test_skip
+
+        Description:  Test with an engine not supported.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.table_route(
+                self.server, "db1", "t2", self.db_dict, "optimize",
+                self.tbl_func), self.results2)
+        self.tbl_func.assert_not_called()
+
+    def test_run(self):
+
+        """Function:  test_run
+
+        Description:  Test with the table function run.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.table_route(
+                self.server, "db1", "t3", self.db_dict, "optimize",
+                self.tbl_func), self.results3)
+
+    def test_no_engine(self):
+
+        """Function:  test_no_engine
+
+        Description:  Test with a table without an engine.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.table_route(
+                self.server, "db1", "t4", self.db_dict, "check",
+                self.tbl_func)["Action"], "check")
+        self.tbl_func.assert_called_once_with(self.server, "db1", "t4")
+
+
+if __name__ == "__main__":
+    unittest.main()
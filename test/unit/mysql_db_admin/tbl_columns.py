@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  tbl_columns.py
+
+    Description:  Unit testing of tbl_columns in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/tbl_columns.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.cmds = []
+        self.rows = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return self.rows.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_primary_key
+        test_tbl_columns
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.rows = [
+            {"COLUMN_NAME": "a", "SEQ_IN_INDEX": 2},
+            {"COLUMN_NAME": "b", "SEQ_IN_INDEX": None},
+            {"COLUMN_NAME": "c", "SEQ_IN_INDEX": 1}]
+
+    def test_no_primary_key(self):
+
+        """Function:  test_no_primary_key
+
+        Description:  Test with a table without a primary key.
+
+        Arguments:
+
+        """
+
+        self.server.rows.append(
+            [dict(row, SEQ_IN_INDEX=None) for row in self.rows])
+
+        self.assertEqual(
+            mysql_db_admin.tbl_columns(self.server, "db1", "t1"),
+            (["a", "b", "c"], []))
+
+    def test_tbl_columns(self):
+
+        """Function:  test_tbl_columns
+
+        Description:  Test the primary key columns are in key order.
+
+        Arguments:
+
+        """
+
+        self.server.rows.append(self.rows)
+
+        self.assertEqual(
+            mysql_db_admin.tbl_columns(self.server, "db1", "t1"),
+            (["a", "b", "c"], ["c", "a"]))
+        self.assertEqual(self.server.cmds[0][1], ("db1", "t1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  tbl_meta.py
+
+    Description:  Unit testing of tbl_meta in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/tbl_meta.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_update_time
+        test_update_time
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tbl_info = {
+            "UPDATE_TIME": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "TABLE_ROWS": 100, "DATA_LENGTH": 16384}
+        self.tbl_info2 = {
+            "UPDATE_TIME": None, "TABLE_ROWS": 100, "DATA_LENGTH": 16384}
+        self.results = {"UpdateTime": "2026-01-02 03:04:05",
+                        "TableRows": 100, "DataLength": 16384}
+        self.results2 = {
+            "UpdateTime": None, "TableRows": 100, "DataLength": 16384}
+
+    def test_no_update_time(self):
+
+        """Function:  test_no_update_time
+
+        Description:  Test with no update time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.tbl_meta(self.tbl_info2), self.results2)
+
+    def test_update_time(self):
+
+        """Function:  test_update_time
+
+        Description:  Test with update time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.tbl_meta(self.tbl_info), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  tbl_size.py
+
+    Description:  Unit testing of tbl_size in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/tbl_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_null_lengths
+        test_no_lengths
+        test_size
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tbl_info = {"DATA_LENGTH": 1000, "INDEX_LENGTH": 24}
+        self.tbl_info2 = {}
+        self.tbl_info3 = {"DATA_LENGTH": None, "INDEX_LENGTH": None}
+
+    def test_null_lengths(self):
+
+        """Function:  test_null_lengths
+
+        Description:  Test with null data and index lengths.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.tbl_size(self.tbl_info3), 0)
+
+    def test_no_lengths(self):
+
+        """Function:  test_no_lengths
+
+        Description:  Test with no data and index lengths.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.tbl_size(self.tbl_info2), 0)
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test with data and index lengths.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_db_admin.tbl_size(self.tbl_info), 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
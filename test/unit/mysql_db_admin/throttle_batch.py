@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  throttle_batch.py
+
+    Description:  Unit testing of throttle_batch in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/throttle_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def batch_func(server, batch):
+
+    """Function:  batch_func
+
+    Description:  Function stub holder for a batch function.
+
+    Arguments:
+
+    """
+
+    return [{"TableName": tbl, "Server": server} for _, tbl in batch]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_throttle_batch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.batch = [("db1", "t1")]
+        self.throttle = {"Limits": {}, "Delay": 0.0}
+        self.results = [{"TableName": "t1", "Server": "Server"}]
+
+    @mock.patch("mysql_db_admin.throttle_wait")
+    def test_throttle_batch(self, mock_wait):
+
+        """Function:  test_throttle_batch
+
+        Description:  Test waiting for the server load before the batch.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_db_admin.throttle_batch(
+                self.server, self.batch, batch_func, self.throttle),
+            self.results)
+        mock_wait.assert_called_once_with(self.server, self.throttle)
+
+
+if __name__ == "__main__":
+    unittest.main()
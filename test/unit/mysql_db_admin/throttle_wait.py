@@ -0,0 +1,148 @@
+# Classification (U)
+
+"""Program:  throttle_wait.py
+
+    Description:  Unit testing of throttle_wait in mysql_db_admin.py.
+
+    Usage:
+        test/unit/mysql_db_admin/throttle_wait.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_db_admin                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_idle_clear
+        test_idle_speed_up
+        test_busy_keep_delay
+        test_overloaded_pause
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.throttle = {
+            "Limits": {"Threads_running": 10,
+                       "Innodb_row_lock_current_waits": 4},
+            "Delay": 0.0, "Lock": threading.Lock()}
+        self.idle = {"threads_running": 2}
+        self.busy = {"threads_running": 7}
+        self.overloaded = {"threads_running": 3,
+                           "innodb_row_lock_current_waits": 5}
+
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_load")
+    def test_idle_clear(self, mock_load, mock_sleep):
+
+        """Function:  test_idle_clear
+
+        Description:  Test a small delay is cleared when the server is idle.
+
+        Arguments:
+
+        """
+
+        self.throttle["Delay"] = 1.0
+        mock_load.return_value = self.idle
+
+        mysql_db_admin.throttle_wait(self.server, self.throttle)
+
+        self.assertEqual(self.throttle["Delay"], 0.0)
+        mock_sleep.assert_not_called()
+
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_load")
+    def test_idle_speed_up(self, mock_load, mock_sleep):
+
+        """Function:  test_idle_speed_up
+
+        Description:  Test the delay is halved when the server is idle.
+
+        Arguments:
+
+        """
+
+        self.throttle["Delay"] = 8.0
+        mock_load.return_value = self.idle
+
+        mysql_db_admin.throttle_wait(self.server, self.throttle)
+
+        mock_sleep.assert_called_once_with(4.0)
+
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_load")
+    def test_busy_keep_delay(self, mock_load, mock_sleep):
+
+        """Function:  test_busy_keep_delay
+
+        Description:  Test the delay is kept when the server is busy but
+            below the thresholds.
+
+        Arguments:
+
+        """
+
+        self.throttle["Delay"] = 2.0
+        mock_load.return_value = self.busy
+
+        mysql_db_admin.throttle_wait(self.server, self.throttle)
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    @mock.patch("mysql_db_admin.time.sleep")
+    @mock.patch("mysql_db_admin.get_load")
+    def test_overloaded_pause(self, mock_load, mock_sleep):
+
+        """Function:  test_overloaded_pause
+
+        Description:  Test the run pauses with a growing delay while a
+            threshold is exceeded.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = [self.overloaded, self.overloaded, self.busy]
+
+        mysql_db_admin.throttle_wait(self.server, self.throttle)
+
+        self.assertEqual(
+            mock_sleep.call_args_list,
+            [mock.call(1), mock.call(2), mock.call(2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,15 +8,99 @@ echo ""
 echo "Unit testing..."
 /usr/bin/python ./test/unit/mysql_db_admin/help_message.py
 /usr/bin/python ./test/unit/mysql_db_admin/analyze.py
+/usr/bin/python ./test/unit/mysql_db_admin/arg_int_chk.py
+/usr/bin/python ./test/unit/mysql_db_admin/batch_done.py
+/usr/bin/python ./test/unit/mysql_db_admin/budget_batch.py
+/usr/bin/python ./test/unit/mysql_db_admin/budget_est.py
+/usr/bin/python ./test/unit/mysql_db_admin/cache_tbls.py
 /usr/bin/python ./test/unit/mysql_db_admin/check.py
 /usr/bin/python ./test/unit/mysql_db_admin/checksum.py
+/usr/bin/python ./test/unit/mysql_db_admin/chunk_digest.py
+/usr/bin/python ./test/unit/mysql_db_admin/chunk_range.py
+/usr/bin/python ./test/unit/mysql_db_admin/chunk_ranges.py
+/usr/bin/python ./test/unit/mysql_db_admin/chunk_upper.py
+/usr/bin/python ./test/unit/mysql_db_admin/ckpt_table.py
+/usr/bin/python ./test/unit/mysql_db_admin/ckpt_tables.py
+/usr/bin/python ./test/unit/mysql_db_admin/close_chunk.py
+/usr/bin/python ./test/unit/mysql_db_admin/close_compare.py
+/usr/bin/python ./test/unit/mysql_db_admin/close_lag.py
+/usr/bin/python ./test/unit/mysql_db_admin/compare_chunks.py
+/usr/bin/python ./test/unit/mysql_db_admin/compare_run.py
+/usr/bin/python ./test/unit/mysql_db_admin/create_budget.py
+/usr/bin/python ./test/unit/mysql_db_admin/create_chunk.py
+/usr/bin/python ./test/unit/mysql_db_admin/create_compare.py
 /usr/bin/python ./test/unit/mysql_db_admin/create_data_config.py
+/usr/bin/python ./test/unit/mysql_db_admin/create_lag.py
+/usr/bin/python ./test/unit/mysql_db_admin/create_pool.py
+/usr/bin/python ./test/unit/mysql_db_admin/create_throttle.py
 /usr/bin/python ./test/unit/mysql_db_admin/data_out.py
+/usr/bin/python ./test/unit/mysql_db_admin/engine_action.py
+/usr/bin/python ./test/unit/mysql_db_admin/ext_status.py
+/usr/bin/python ./test/unit/mysql_db_admin/fleet_doc.py
+/usr/bin/python ./test/unit/mysql_db_admin/fleet_run.py
+/usr/bin/python ./test/unit/mysql_db_admin/frag_info.py
 /usr/bin/python ./test/unit/mysql_db_admin/get_all_dbs_tbls.py
+/usr/bin/python ./test/unit/mysql_db_admin/get_ckpt_file.py
 /usr/bin/python ./test/unit/mysql_db_admin/get_db_tbl.py
 /usr/bin/python ./test/unit/mysql_db_admin/get_json_template.py
+/usr/bin/python ./test/unit/mysql_db_admin/get_lag.py
+/usr/bin/python ./test/unit/mysql_db_admin/get_load.py
+/usr/bin/python ./test/unit/mysql_db_admin/get_status.py
+/usr/bin/python ./test/unit/mysql_db_admin/key_dump.py
+/usr/bin/python ./test/unit/mysql_db_admin/key_load.py
+/usr/bin/python ./test/unit/mysql_db_admin/key_range.py
+/usr/bin/python ./test/unit/mysql_db_admin/key_str.py
+/usr/bin/python ./test/unit/mysql_db_admin/lag_batch.py
+/usr/bin/python ./test/unit/mysql_db_admin/lag_report.py
+/usr/bin/python ./test/unit/mysql_db_admin/lag_wait.py
+/usr/bin/python ./test/unit/mysql_db_admin/like_match.py
+/usr/bin/python ./test/unit/mysql_db_admin/like_pattern.py
 /usr/bin/python ./test/unit/mysql_db_admin/listdbs.py
+/usr/bin/python ./test/unit/mysql_db_admin/live_checksum.py
+/usr/bin/python ./test/unit/mysql_db_admin/load_cache.py
+/usr/bin/python ./test/unit/mysql_db_admin/load_chunks.py
+/usr/bin/python ./test/unit/mysql_db_admin/load_ckpt.py
+/usr/bin/python ./test/unit/mysql_db_admin/load_state.py
+/usr/bin/python ./test/unit/mysql_db_admin/make_batches.py
+/usr/bin/python ./test/unit/mysql_db_admin/name_filter.py
+/usr/bin/python ./test/unit/mysql_db_admin/name_match.py
 /usr/bin/python ./test/unit/mysql_db_admin/optimize.py
+/usr/bin/python ./test/unit/mysql_db_admin/pct.py
+/usr/bin/python ./test/unit/mysql_db_admin/process_tables.py
+/usr/bin/python ./test/unit/mysql_db_admin/prom_app.py
+/usr/bin/python ./test/unit/mysql_db_admin/prom_serve.py
+/usr/bin/python ./test/unit/mysql_db_admin/prom_text.py
+/usr/bin/python ./test/unit/mysql_db_admin/prom_value.py
+/usr/bin/python ./test/unit/mysql_db_admin/prom_write.py
+/usr/bin/python ./test/unit/mysql_db_admin/quote_name.py
+/usr/bin/python ./test/unit/mysql_db_admin/range_digest.py
+/usr/bin/python ./test/unit/mysql_db_admin/render_data.py
+/usr/bin/python ./test/unit/mysql_db_admin/route_batch.py
+/usr/bin/python ./test/unit/mysql_db_admin/run_batch.py
+/usr/bin/python ./test/unit/mysql_db_admin/run_server.py
+/usr/bin/python ./test/unit/mysql_db_admin/run_tables.py
+/usr/bin/python ./test/unit/mysql_db_admin/run_tasks.py
+/usr/bin/python ./test/unit/mysql_db_admin/save_state.py
+/usr/bin/python ./test/unit/mysql_db_admin/schema_probe.py
+/usr/bin/python ./test/unit/mysql_db_admin/status_rates.py
+/usr/bin/python ./test/unit/mysql_db_admin/status_sample.py
+/usr/bin/python ./test/unit/mysql_db_admin/stream_line.py
+/usr/bin/python ./test/unit/mysql_db_admin/stream_table.py
+/usr/bin/python ./test/unit/mysql_db_admin/stream_tables.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_batch_cmd.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_check.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_checksum.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_checksum_chunk.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_checksum_inc.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_cmd.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_compare.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_optimize.py
+/usr/bin/python ./test/unit/mysql_db_admin/table_route.py
+/usr/bin/python ./test/unit/mysql_db_admin/tbl_columns.py
+/usr/bin/python ./test/unit/mysql_db_admin/tbl_meta.py
+/usr/bin/python ./test/unit/mysql_db_admin/tbl_size.py
+/usr/bin/python ./test/unit/mysql_db_admin/throttle_batch.py
+/usr/bin/python ./test/unit/mysql_db_admin/throttle_wait.py
 /usr/bin/python ./test/unit/mysql_db_admin/status.py
 /usr/bin/python ./test/unit/mysql_db_admin/run_program.py
 /usr/bin/python ./test/unit/mysql_db_admin/main.py
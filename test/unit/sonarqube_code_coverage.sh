@@ -10,15 +10,99 @@ echo ""
 echo "Running unit test modules in conjunction with coverage"
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/help_message.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/analyze.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/arg_int_chk.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/batch_done.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/budget_batch.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/budget_est.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/cache_tbls.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/check.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/checksum.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/chunk_digest.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/chunk_range.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/chunk_ranges.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/chunk_upper.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/ckpt_table.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/ckpt_tables.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/close_chunk.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/close_compare.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/close_lag.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/compare_chunks.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/compare_run.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_budget.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_chunk.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_compare.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_data_config.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_lag.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_pool.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/create_throttle.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/data_out.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/engine_action.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/ext_status.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/fleet_doc.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/fleet_run.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/frag_info.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_all_dbs_tbls.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_ckpt_file.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_db_tbl.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_json_template.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_lag.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_load.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/get_status.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/key_dump.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/key_load.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/key_range.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/key_str.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/lag_batch.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/lag_report.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/lag_wait.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/like_match.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/like_pattern.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/listdbs.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/live_checksum.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/load_cache.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/load_chunks.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/load_ckpt.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/load_state.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/make_batches.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/name_filter.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/name_match.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/optimize.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/pct.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/process_tables.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/prom_app.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/prom_serve.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/prom_text.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/prom_value.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/prom_write.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/quote_name.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/range_digest.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/render_data.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/route_batch.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/run_batch.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/run_server.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/run_tables.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/run_tasks.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/save_state.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/schema_probe.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/status_rates.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/status_sample.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/stream_line.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/stream_table.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/stream_tables.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_batch_cmd.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_check.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_checksum.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_checksum_chunk.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_checksum_inc.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_cmd.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_compare.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_optimize.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/table_route.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/tbl_columns.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/tbl_meta.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/tbl_size.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/throttle_batch.py
+coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/throttle_wait.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/main.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/run_program.py
 coverage run -a --source=mysql_db_admin test/unit/mysql_db_admin/status.py
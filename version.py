@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "5.1.0"
+__version__ = "5.2.0"